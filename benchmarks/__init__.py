@@ -0,0 +1 @@
+"""Load and memory benchmarks for the digitalSTROM VDC integration."""
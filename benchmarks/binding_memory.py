@@ -0,0 +1,212 @@
+"""Memory benchmark for BindingRegistry.
+
+Registers N output and N sensor bindings and measures the memory they take
+with tracemalloc. The same number of bindings is then built in the previous
+layout, which had a per-instance __dict__, an eager asyncio.Lock, a closure
+as VDC callback and a second {component_type: component} table, and both
+per-binding costs are reported.
+
+Usage::
+
+    python -m benchmarks.binding_memory --bindings 10000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+
+from custom_components.digitalstrom_vdc.entity_binding import (
+    BindingRegistry,
+    BindingType,
+)
+from custom_components.digitalstrom_vdc.metrics import DISABLED_METRICS
+
+
+class FakeChannel:
+    """Output channel with the attributes a binding touches."""
+
+    __slots__ = ()
+
+    async def set_value(self, value: float) -> None:
+        """Accept a value."""
+
+
+class FakeSensor:
+    """Sensor with a settable value callback."""
+
+    __slots__ = ("on_value_changed",)
+
+    def __init__(self) -> None:
+        """Initialize the sensor."""
+        self.on_value_changed = None
+
+
+def fake_hass() -> Any:
+    """Return the parts of hass a binding registry uses."""
+    return SimpleNamespace(
+        bus=SimpleNamespace(
+            async_fire=lambda *args: None,
+            async_listen=lambda *args, **kwargs: lambda: None,
+        ),
+        loop=asyncio.get_running_loop(),
+    )
+
+
+class LegacyEntityBinding:
+    """EntityBinding as laid out before slots and the lazy lock."""
+
+    def __init__(self, hass: Any, ha_entity_id: str, vdc_component: Any) -> None:
+        """Set the same attributes the previous EntityBinding did."""
+        self.hass = hass
+        self.ha_entity_id = ha_entity_id
+        self.vdc_component = vdc_component
+        self.binding_type = BindingType.SENSOR
+        self.vdc_device_id = None
+        self._on_vdc_update = None
+        self._emit_event = hass.bus.async_fire
+        self._vdc_callback = None
+        self._sync_lock = asyncio.Lock()
+        self._pending_state = None
+        self._write_task = None
+        self.writes_requested = 0
+        self.writes_completed = 0
+        self.writes_failed = 0
+        self.writes_coalesced = 0
+        self.writes_dropped = 0
+        self._set_value_latency = DISABLED_METRICS.histogram("latency")
+        self._messages_out = DISABLED_METRICS.counter("messages")
+        self.sensor_filter = None
+        self._last_reported_value = None
+        self._last_report_time = None
+        self._deferred_report = None
+        self.sensor_reported = 0
+        self.sensor_suppressed_deadband = 0
+        self.sensor_rate_limited = 0
+        self.sensor_forced = 0
+
+    def setup(self) -> None:
+        """Register a closure as VDC callback like the previous version."""
+
+        async def vdc_value_changed(value: Any = None) -> None:
+            """Handle VDC component value change."""
+
+        self._vdc_callback = vdc_value_changed
+
+
+def _measure_start() -> int:
+    """Start a measurement and return the traced bytes."""
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def _measure_end(start: int) -> int:
+    """Return the bytes allocated since start."""
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0] - start
+
+
+async def measure_registry(count: int) -> tuple[int, BindingRegistry]:
+    """Return the bytes taken by count output and count sensor bindings."""
+    hass = fake_hass()
+    channels = [FakeChannel() for _ in range(count)]
+    sensors = [FakeSensor() for _ in range(count)]
+    entity_ids = [(f"light.l{index}", f"sensor.s{index}") for index in range(count)]
+
+    start = _measure_start()
+    registry = BindingRegistry(hass)
+    for (light_id, sensor_id), channel, sensor in zip(
+        entity_ids, channels, sensors, strict=True
+    ):
+        await registry.register_channel_binding(light_id, channel)
+        await registry.register_sensor_binding(sensor_id, sensor)
+    return _measure_end(start), registry
+
+
+async def measure_legacy(count: int) -> int:
+    """Return the bytes taken by the same bindings in the previous layout."""
+    hass = fake_hass()
+    channels = [FakeChannel() for _ in range(count)]
+    sensors = [FakeSensor() for _ in range(count)]
+    entity_ids = [(f"light.l{index}", f"sensor.s{index}") for index in range(count)]
+
+    start = _measure_start()
+    binding_objects: dict[str, LegacyEntityBinding] = {}
+    bindings: dict[str, dict[str, Any]] = {}
+    entity_index: dict[str, list[LegacyEntityBinding]] = {}
+    for (light_id, sensor_id), channel, sensor in zip(
+        entity_ids, channels, sensors, strict=True
+    ):
+        light = binding_objects[light_id] = LegacyEntityBinding(hass, light_id, channel)
+        bindings[light_id] = {"channel": channel}
+        entity_index.setdefault(light_id, []).append(light)
+        sensor_binding = LegacyEntityBinding(hass, sensor_id, sensor)
+        sensor_binding.setup()
+        binding_objects[sensor_id] = sensor_binding
+        bindings[sensor_id] = {"sensor": sensor}
+    used = _measure_end(start)
+    # Keep the tables alive until measured
+    del binding_objects, bindings, entity_index
+    return used
+
+
+async def async_main(args: argparse.Namespace) -> dict[str, Any]:
+    """Run both measurements and return the report."""
+    total = 2 * args.bindings
+    tracemalloc.start()
+    legacy = await measure_legacy(args.bindings)
+    current, registry = await measure_registry(args.bindings)
+    tracemalloc.stop()
+    return {
+        "bindings": total,
+        "legacy_bytes_per_binding": round(legacy / total, 1),
+        "bytes_per_binding": round(current / total, 1),
+        "saved_percent": round(100.0 * (legacy - current) / legacy, 1),
+        "footprint": registry.memory_footprint(),
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--bindings",
+        type=int,
+        default=5000,
+        help="number of output bindings, the same number of sensor bindings is added",
+    )
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    return parser.parse_args(argv)
+
+
+def print_report(report: dict[str, Any]) -> None:
+    """Print a human readable report."""
+    print(f"Bindings: {report['bindings']}")
+    print(f"Previous layout: {report['legacy_bytes_per_binding']} B/binding")
+    print(
+        f"Current layout: {report['bytes_per_binding']} B/binding "
+        f"({report['saved_percent']}% less)"
+    )
+    footprint = report["footprint"]
+    print(
+        f"memory_footprint(): {footprint['total_bytes']} B "
+        f"({footprint['bytes_per_binding']} B/binding, {footprint['locks']} locks)"
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point."""
+    args = parse_args(argv)
+    report = asyncio.run(async_main(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
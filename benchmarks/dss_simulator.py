@@ -0,0 +1,210 @@
+"""Stand-in digitalSTROM Server (dSS) peer for load tests.
+
+Connects to the VDC TCP server like a real dSS would and speaks the vDC API:
+every message is a protobuf ``Message`` preceded by a 2 byte big-endian length
+header. The protobuf classes are taken from the module generated from the vDC
+API ``.proto`` that ships with pyvdcapi.
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import itertools
+import logging
+import struct
+import time
+from collections.abc import Callable
+from types import ModuleType
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PROTO_MODULE = "pyvdcapi.network.genericVDC_pb2"
+DSS_DSUID = "0000000000000000000000000000D55000"
+
+_HEADER = struct.Struct(">H")
+
+
+def load_proto_module(name: str = DEFAULT_PROTO_MODULE) -> ModuleType:
+    """Import the generated vDC API protobuf module."""
+    try:
+        return importlib.import_module(name)
+    except ImportError as err:
+        raise SystemExit(
+            f"Cannot import vDC API protobuf module {name!r}: {err}. "
+            "Pass --proto-module with the module path used by your pyvdcapi."
+        ) from err
+
+
+class SimulatedDss:
+    """Minimal dSS that drives a VDC host over TCP."""
+
+    def __init__(self, host: str, port: int, proto: ModuleType) -> None:
+        """Initialize the simulated dSS."""
+        self.host = host
+        self.port = port
+        self.pb = proto
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task | None = None
+        self._message_ids = itertools.count(1)
+        self._pending: dict[int, asyncio.Future] = {}
+        self._hello_done = asyncio.Event()
+
+        self.announced_devices: dict[str, float] = {}
+        self.on_announce: Callable[[str], None] | None = None
+        self.messages_sent = 0
+        self.messages_received = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.push_notifications = 0
+
+    async def connect(self, timeout: float = 10.0) -> None:
+        """Connect to the VDC host and perform the hello handshake."""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                self._reader, self._writer = await asyncio.open_connection(
+                    self.host, self.port
+                )
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                await asyncio.sleep(0.1)
+
+        self._reader_task = asyncio.create_task(self._read_loop())
+
+        message = self._new_message(self.pb.VDSM_REQUEST_HELLO)
+        message.vdsm_request_hello.dSUID = DSS_DSUID
+        message.vdsm_request_hello.api_version = 2
+        await self._request(message, timeout=timeout)
+        self._hello_done.set()
+
+    async def close(self) -> None:
+        """Say bye and close the connection."""
+        if self._writer is None:
+            return
+        try:
+            message = self._new_message(self.pb.VDSM_SEND_BYE)
+            message.vdsm_send_bye.dSUID = DSS_DSUID
+            self._send(message)
+            await self._writer.drain()
+        except (ConnectionError, AttributeError):
+            pass
+        if self._reader_task:
+            self._reader_task.cancel()
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        self._writer = None
+
+    async def ping(self, dsuid: str, timeout: float = 5.0) -> float:
+        """Ping the VDC host and return the round trip time in seconds."""
+        message = self._new_message(self.pb.VDSM_SEND_PING)
+        message.vdsm_send_ping.dSUID = dsuid
+        start = time.perf_counter()
+        await self._request(message, timeout=timeout)
+        return time.perf_counter() - start
+
+    def call_scene(self, dsuids: list[str], scene: int, force: bool = False) -> None:
+        """Send a callScene notification to one or several vdSDs."""
+        message = self._new_message(self.pb.VDSM_NOTIFICATION_CALL_SCENE, with_id=False)
+        message.vdsm_send_call_scene.dSUID.extend(dsuids)
+        message.vdsm_send_call_scene.scene = scene
+        message.vdsm_send_call_scene.force = force
+        self._send(message)
+
+    def set_output_channel_value(
+        self, dsuids: list[str], channel: int, value: float, apply_now: bool = True
+    ) -> None:
+        """Send a setOutputChannelValue notification."""
+        message = self._new_message(
+            self.pb.VDSM_NOTIFICATION_SET_OUTPUT_CHANNEL_VALUE, with_id=False
+        )
+        notification = message.vdsm_send_output_channel_value
+        notification.dSUID.extend(dsuids)
+        notification.channel = channel
+        notification.value = value
+        notification.apply_now = apply_now
+        self._send(message)
+
+    async def drain(self) -> None:
+        """Wait until the transport buffer is flushed."""
+        if self._writer is not None:
+            await self._writer.drain()
+
+    def _new_message(self, message_type: int, with_id: bool = True) -> Any:
+        """Create a message of the given type."""
+        message = self.pb.Message()
+        message.type = message_type
+        if with_id:
+            message.message_id = next(self._message_ids)
+        return message
+
+    def _send(self, message: Any) -> None:
+        """Frame and write a message."""
+        payload = message.SerializeToString()
+        self._writer.write(_HEADER.pack(len(payload)) + payload)
+        self.messages_sent += 1
+        self.bytes_sent += len(payload) + _HEADER.size
+
+    async def _request(self, message: Any, timeout: float) -> Any:
+        """Send a message and wait for the response with the same message id."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message.message_id] = future
+        self._send(message)
+        await self._writer.drain()
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(message.message_id, None)
+
+    def _respond_ok(self, message_id: int) -> None:
+        """Acknowledge a request from the VDC host."""
+        response = self._new_message(self.pb.GENERIC_RESPONSE, with_id=False)
+        response.message_id = message_id
+        response.generic_response.code = 0  # ERR_OK
+        self._send(response)
+
+    async def _read_loop(self) -> None:
+        """Read and dispatch messages from the VDC host."""
+        pb = self.pb
+        try:
+            while True:
+                header = await self._reader.readexactly(_HEADER.size)
+                (length,) = _HEADER.unpack(header)
+                payload = await self._reader.readexactly(length)
+                self.messages_received += 1
+                self.bytes_received += length + _HEADER.size
+
+                message = pb.Message()
+                message.ParseFromString(payload)
+
+                future = self._pending.get(message.message_id)
+                if future is not None and not future.done():
+                    future.set_result(message)
+                    continue
+
+                if message.type == pb.VDC_SEND_ANNOUNCE_DEVICE:
+                    dsuid = message.vdc_send_announce_device.dSUID
+                    self.announced_devices[dsuid] = time.perf_counter()
+                    self._respond_ok(message.message_id)
+                    if self.on_announce:
+                        self.on_announce(dsuid)
+                elif message.type == pb.VDC_SEND_ANNOUNCE_VDC:
+                    self._respond_ok(message.message_id)
+                elif message.type == pb.VDC_SEND_PUSH_PROPERTY:
+                    self.push_notifications += 1
+                elif message.type == pb.VDC_SEND_PONG:
+                    # Pongs carry no message id; resolve the oldest ping
+                    for future in self._pending.values():
+                        if not future.done():
+                            future.set_result(message)
+                            break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            _LOGGER.debug("Connection to VDC host closed")
+        except asyncio.CancelledError:
+            pass
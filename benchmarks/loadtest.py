@@ -0,0 +1,419 @@
+"""Load test for VDCHostManager, DeviceManager and BindingRegistry.
+
+Runs the integration's managers against a real pyvdcapi VDC TCP server inside
+an offline Home Assistant core, connects a simulated dSS, announces N vdSDs and
+drives scene calls, channel writes (dSS → VDC and HA → VDC) and sensor pushes
+at configurable rates. Reports p50/p99 latency, throughput and memory.
+
+Usage::
+
+    python -m benchmarks.loadtest --devices 2000 --duration 30 \\
+        --scene-rate 50 --channel-rate 200 --ha-write-rate 200 --sensor-rate 500
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.digitalstrom_vdc.const import (
+    CONF_ANNOUNCE_SERVICE,
+    CONF_DSUID,
+    CONF_PORT,
+    CONF_VDC_NAME,
+    DATA_BINDINGS,
+    DOMAIN,
+)
+from custom_components.digitalstrom_vdc.device_manager import DeviceManager
+from custom_components.digitalstrom_vdc.entity_binding import BindingRegistry
+from custom_components.digitalstrom_vdc.vdc_manager import VDCHostManager
+
+from .dss_simulator import DEFAULT_PROTO_MODULE, SimulatedDss, load_proto_module
+
+_LOGGER = logging.getLogger(__name__)
+
+VDC_HOST_DSUID = "0000000042A8708F29EE543E7693000000"
+
+
+def rss_bytes() -> int:
+    """Return the resident set size of this process (Linux)."""
+    with open("/proc/self/status", encoding="ascii") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+class LatencyStats:
+    """Collect latency samples of one operation type."""
+
+    def __init__(self) -> None:
+        """Initialize empty stats."""
+        self.samples: list[float] = []
+        self.sent = 0
+
+    def add(self, seconds: float) -> None:
+        """Record a latency sample."""
+        self.samples.append(seconds)
+
+    def summary(self, duration: float) -> dict[str, Any]:
+        """Return count, throughput and latency percentiles in milliseconds."""
+        samples = sorted(self.samples)
+        count = len(samples)
+
+        def percentile(fraction: float) -> float | None:
+            if not samples:
+                return None
+            index = min(count - 1, int(fraction * count))
+            return round(samples[index] * 1000.0, 3)
+
+        return {
+            "sent": self.sent,
+            "completed": count,
+            "throughput_per_s": round(count / duration, 1) if duration else None,
+            "p50_ms": percentile(0.50),
+            "p99_ms": percentile(0.99),
+            "max_ms": round(samples[-1] * 1000.0, 3) if samples else None,
+        }
+
+
+async def run_at_rate(
+    rate: float, duration: float, operation: Callable[[int], Any]
+) -> None:
+    """Call operation(n) rate times per second for duration seconds."""
+    if rate <= 0:
+        return
+    loop = asyncio.get_running_loop()
+    interval = 1.0 / rate
+    start = loop.time()
+    count = 0
+    while count * interval < duration:
+        delay = start + count * interval - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        result = operation(count)
+        if asyncio.iscoroutine(result):
+            await result
+        count += 1
+
+
+class LoadTest:
+    """Set up the integration stack and drive it from a simulated dSS."""
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        """Initialize the load test."""
+        self.args = args
+        self.hass: HomeAssistant | None = None
+        self.vdc_manager: VDCHostManager | None = None
+        self.device_manager: DeviceManager | None = None
+        self.binding_registry: BindingRegistry | None = None
+        self.dss: SimulatedDss | None = None
+        self.devices: list[Any] = []
+        self._numbers: dict[str, int] = {}
+        self._scene_dsuids: set[str] = set()
+        self.stats: dict[str, LatencyStats] = {
+            name: LatencyStats()
+            for name in (
+                "announce",
+                "scene_call",
+                "dss_channel",
+                "ha_write",
+                "sensor",
+                "ping",
+            )
+        }
+        # Send timestamps by dsUID, one map per device-addressed workload
+        self._dss_pending: dict[str, float] = {}
+        self._ha_pending: dict[str, float] = {}
+        self._announce_started = 0.0
+        self.report: dict[str, Any] = {}
+
+    async def async_setup(self, config_dir: str) -> None:
+        """Start the VDC host and create the vdSDs with bindings."""
+        args = self.args
+        self.report["rss_start_mb"] = round(rss_bytes() / 2**20, 1)
+
+        self.hass = HomeAssistant(config_dir)
+        self.vdc_manager = VDCHostManager(
+            self.hass,
+            {
+                CONF_PORT: args.port,
+                CONF_VDC_NAME: "Load Test VDC",
+                CONF_DSUID: VDC_HOST_DSUID,
+                CONF_ANNOUNCE_SERVICE: False,
+            },
+        )
+        if not await self.vdc_manager.async_initialize():
+            raise SystemExit("VDC host failed to start")
+
+        self.binding_registry = BindingRegistry(self.hass, per_entity_events=False)
+        self.hass.data[DOMAIN] = {"loadtest": {DATA_BINDINGS: self.binding_registry}}
+        self.device_manager = DeviceManager(self.vdc_manager.vdc, self.hass)
+
+        start = time.perf_counter()
+        for number in range(args.devices):
+            device = await self.device_manager.create_device_manual(
+                device_config={"name": f"Load Test Light {number}", "primary_group": 1},
+                inputs=[{"type": "sensor", "sensor_type": 1, "unit": "°C"}],
+                outputs=[{"channels": [{"channel_type": 0}]}],
+                entity_bindings={
+                    "output_channel_0": f"light.loadtest_{number}",
+                    "sensor_0": f"sensor.loadtest_{number}",
+                },
+            )
+            self._numbers[device.dSUID] = number
+            self.devices.append(device)
+        setup_time = time.perf_counter() - start
+        self.report["setup"] = {
+            "devices": args.devices,
+            "bindings": len(self.binding_registry.get_all_bindings()),
+            "seconds": round(setup_time, 3),
+            "devices_per_s": round(args.devices / setup_time, 1),
+        }
+        self.report["rss_after_setup_mb"] = round(rss_bytes() / 2**20, 1)
+
+        # Completion hooks for the latency measurements
+        self.vdc_manager.async_add_device_listener(self._on_dss_message_dispatched)
+        self.binding_registry.async_add_device_listener(self._on_binding_update)
+
+    async def async_connect(self) -> None:
+        """Connect the simulated dSS and announce all vdSDs."""
+        proto = load_proto_module(self.args.proto_module)
+        self.dss = SimulatedDss("127.0.0.1", self.args.port, proto)
+        self.dss.on_announce = self._on_announced
+        await self.dss.connect()
+
+        self._announce_started = time.perf_counter()
+        self.stats["announce"].sent = len(self.devices)
+        batch = self.args.announce_batch
+        for index in range(0, len(self.devices), batch):
+            await asyncio.gather(
+                *(device.announce() for device in self.devices[index : index + batch]),
+                return_exceptions=True,
+            )
+        deadline = time.monotonic() + 30.0
+        while (
+            len(self.dss.announced_devices) < len(self.devices)
+            and time.monotonic() < deadline
+        ):
+            await asyncio.sleep(0.05)
+
+    async def async_run(self) -> None:
+        """Drive all workloads concurrently for the configured duration."""
+        args = self.args
+        groups = [self.devices[index::4] for index in range(4)]
+        scene_devices, dss_channel_devices, ha_devices, sensor_devices = groups
+        self._scene_dsuids = {device.dSUID for device in scene_devices}
+        duration = args.duration
+
+        def scene_call(_count: int) -> None:
+            device = random.choice(scene_devices)
+            self._dss_pending[device.dSUID] = time.perf_counter()
+            self.stats["scene_call"].sent += 1
+            self.dss.call_scene([device.dSUID], random.choice((0, 5, 17, 18)))
+
+        def dss_channel_write(_count: int) -> None:
+            device = random.choice(dss_channel_devices)
+            self._dss_pending[device.dSUID] = time.perf_counter()
+            self.stats["dss_channel"].sent += 1
+            self.dss.set_output_channel_value(
+                [device.dSUID], 0, random.uniform(0.0, 100.0)
+            )
+
+        def ha_write(_count: int) -> None:
+            device = random.choice(ha_devices)
+            # Writes coalesce per binding; time from the first queued state
+            self._ha_pending.setdefault(device.dSUID, time.perf_counter())
+            self.stats["ha_write"].sent += 1
+            self.hass.states.async_set(
+                f"light.loadtest_{self._numbers[device.dSUID]}",
+                "on",
+                {"brightness": random.randint(1, 255)},
+            )
+
+        async def sensor_push(_count: int) -> None:
+            device = random.choice(sensor_devices)
+            binding = self.binding_registry.get_binding(f"{device.dSUID}_sensor_0")
+            if binding is None or binding._vdc_callback is None:
+                return
+            self.stats["sensor"].sent += 1
+            start = time.perf_counter()
+            await binding._vdc_callback(random.uniform(15.0, 25.0))
+            self.stats["sensor"].add(time.perf_counter() - start)
+
+        async def ping(_count: int) -> None:
+            self.stats["ping"].sent += 1
+            try:
+                rtt = await self.dss.ping(VDC_HOST_DSUID)
+            except TimeoutError:
+                return
+            self.stats["ping"].add(rtt)
+
+        async def flush_transport(_count: int) -> None:
+            await self.dss.drain()
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            run_at_rate(args.scene_rate, duration, scene_call),
+            run_at_rate(args.channel_rate, duration, dss_channel_write),
+            run_at_rate(args.ha_write_rate, duration, ha_write),
+            run_at_rate(args.sensor_rate, duration, sensor_push),
+            run_at_rate(1.0, duration, ping),
+            run_at_rate(20.0, duration, flush_transport),
+        )
+        # Give in-flight operations a moment to complete
+        await asyncio.sleep(1.0)
+        elapsed = time.perf_counter() - start
+
+        self.report["duration_s"] = round(elapsed, 2)
+        self.report["operations"] = {
+            name: stats.summary(elapsed if name != "announce" else self._announce_span())
+            for name, stats in self.stats.items()
+        }
+        self.report["transport"] = {
+            "messages_sent": self.dss.messages_sent,
+            "messages_received": self.dss.messages_received,
+            "bytes_sent": self.dss.bytes_sent,
+            "bytes_received": self.dss.bytes_received,
+            "push_notifications": self.dss.push_notifications,
+        }
+        self.report["rss_end_mb"] = round(rss_bytes() / 2**20, 1)
+        self.report["rss_per_device_kb"] = round(
+            (self.report["rss_after_setup_mb"] - self.report["rss_start_mb"])
+            * 1024
+            / max(1, self.args.devices),
+            2,
+        )
+
+    async def async_teardown(self) -> None:
+        """Stop the simulated dSS and the integration stack."""
+        if self.dss:
+            await self.dss.close()
+        if self.binding_registry:
+            start = time.perf_counter()
+            await self.binding_registry.async_remove_all()
+            self.report["teardown_bindings_s"] = round(time.perf_counter() - start, 3)
+        if self.vdc_manager:
+            await self.vdc_manager.async_shutdown()
+        if self.hass:
+            await self.hass.async_stop(force=True)
+
+    def _announce_span(self) -> float:
+        """Return the time from first announce to the last acknowledged one."""
+        if not self.dss or not self.dss.announced_devices:
+            return 0.0
+        return max(self.dss.announced_devices.values()) - self._announce_started
+
+    def _on_announced(self, dsuid: str) -> None:
+        """Record the announce latency of a vdSD."""
+        self.stats["announce"].add(time.perf_counter() - self._announce_started)
+
+    def _on_dss_message_dispatched(self, dsuid: str) -> None:
+        """Record latency of a dSS notification reaching the integration."""
+        sent = self._dss_pending.pop(dsuid, None)
+        if sent is None:
+            return
+        name = "scene_call" if dsuid in self._scene_dsuids else "dss_channel"
+        self.stats[name].add(time.perf_counter() - sent)
+
+    def _on_binding_update(self, dsuid: str) -> None:
+        """Record latency of an HA state change written to the VDC."""
+        sent = self._ha_pending.pop(dsuid, None)
+        if sent is not None:
+            self.stats["ha_write"].add(time.perf_counter() - sent)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--devices", type=int, default=1000, help="number of vdSDs")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds of load")
+    parser.add_argument("--port", type=int, default=18444, help="VDC TCP port")
+    parser.add_argument("--scene-rate", type=float, default=20.0, help="scene calls/s")
+    parser.add_argument(
+        "--channel-rate", type=float, default=100.0, help="dSS channel writes/s"
+    )
+    parser.add_argument(
+        "--ha-write-rate", type=float, default=100.0, help="HA → VDC writes/s"
+    )
+    parser.add_argument("--sensor-rate", type=float, default=200.0, help="sensor pushes/s")
+    parser.add_argument(
+        "--announce-batch", type=int, default=50, help="concurrent announcements"
+    )
+    parser.add_argument(
+        "--proto-module",
+        default=DEFAULT_PROTO_MODULE,
+        help="import path of the generated vDC API protobuf module",
+    )
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    return parser.parse_args(argv)
+
+
+def print_report(report: dict[str, Any]) -> None:
+    """Print a human readable report."""
+    setup = report["setup"]
+    print(
+        f"Setup: {setup['devices']} devices, {setup['bindings']} bindings in "
+        f"{setup['seconds']} s ({setup['devices_per_s']} devices/s)"
+    )
+    print(f"Duration: {report['duration_s']} s")
+    print(
+        f"{'operation':<12} {'sent':>8} {'done':>8} {'ops/s':>9} "
+        f"{'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+    )
+    for name, summary in report["operations"].items():
+        print(
+            f"{name:<12} {summary['sent']:>8} {summary['completed']:>8} "
+            f"{summary['throughput_per_s'] or '-':>9} {summary['p50_ms'] or '-':>9} "
+            f"{summary['p99_ms'] or '-':>9} {summary['max_ms'] or '-':>9}"
+        )
+    transport = report["transport"]
+    print(
+        f"Transport: {transport['messages_sent']} msgs / {transport['bytes_sent']} B out, "
+        f"{transport['messages_received']} msgs / {transport['bytes_received']} B in"
+    )
+    print(
+        f"Memory: RSS {report['rss_start_mb']} → {report['rss_after_setup_mb']} → "
+        f"{report['rss_end_mb']} MB ({report['rss_per_device_kb']} kB/device)"
+    )
+    if "teardown_bindings_s" in report:
+        print(f"Teardown: bindings removed in {report['teardown_bindings_s']} s")
+
+
+async def async_main(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the load test and return the report."""
+    random.seed(args.seed)
+    test = LoadTest(args)
+    with tempfile.TemporaryDirectory(prefix="vdc-loadtest-") as config_dir:
+        try:
+            await test.async_setup(config_dir)
+            await test.async_connect()
+            await test.async_run()
+        finally:
+            await test.async_teardown()
+    return test.report
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point."""
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+    report = asyncio.run(async_main(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,27 +2,44 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable
 import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 
 from .const import (
+    CONF_METRICS,
+    CONF_PER_ENTITY_EVENTS,
+    CONF_RAMP_TICK_RATE,
+    CONF_UNDO_DEPTH,
+    DATA_CONFIG_WRITER,
     DATA_COORDINATOR,
     DATA_DEVICE_MANAGER,
+    DATA_METRICS,
     DATA_TEMPLATE_MANAGER,
     DATA_VDC_MANAGER,
     DATA_BINDINGS,
+    DEFAULT_METRICS,
+    DEFAULT_PER_ENTITY_EVENTS,
+    DEFAULT_RAMP_TICK_RATE,
+    DEFAULT_UNDO_DEPTH,
     DOMAIN,
     PLATFORMS,
+    VDC_CONFIG_FILE,
 )
+from .config_writer import ConfigWriter
 from .coordinator import DigitalStromVDCCoordinator
 from .device_manager import DeviceManager
+from .device_store import DeviceStore
 from .entity_binding import BindingRegistry
-from .template_manager import TemplateManager
+from .metrics import MetricsRegistry
+from .ramp import async_get_ramp_engine
+from .resolver import async_get_resolver
+from .template_manager import async_get_template_manager
 from .vdc_manager import VDCHostManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -38,8 +55,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up digitalSTROM VDC from a config entry."""
     _LOGGER.debug("Setting up digitalSTROM VDC integration")
 
+    # Metrics are cheap enough to stay on, disabled they cost a no-op call
+    metrics = MetricsRegistry(enabled=entry.options.get(CONF_METRICS, DEFAULT_METRICS))
+
     # Initialize VDC manager
-    vdc_manager = VDCHostManager(hass, entry.data)
+    vdc_manager = VDCHostManager(hass, entry.data, entry.options, metrics=metrics)
     
     try:
         # Initialize and connect to DSS
@@ -49,19 +69,57 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("Failed to initialize VDC manager: %s", err)
         raise ConfigEntryNotReady from err
 
+    # The template catalog is shared by all entries and loaded once
+    template_manager = async_get_template_manager(hass)
+    if template_manager.load_stats is None:
+        await template_manager.load_templates()
+
     # Initialize device manager
-    device_manager = DeviceManager(vdc_manager.vdc, hass)
+    device_store = DeviceStore(hass, entry.entry_id)
+    config_writer = ConfigWriter(
+        hass, hass.config.path(DOMAIN, entry.entry_id, VDC_CONFIG_FILE)
+    )
+    device_manager = DeviceManager(
+        vdc_manager.vdc,
+        hass,
+        device_store,
+        config_writer,
+        vdc_manager.announcer,
+        undo_depth=entry.options.get(CONF_UNDO_DEPTH, DEFAULT_UNDO_DEPTH),
+        template_manager=template_manager,
+    )
+    vdc_manager.announcer.device_provider = device_manager.get_all_devices
+    config_writer.async_register_section("vdc_host", vdc_manager.config_snapshot)
+    config_writer.async_register_section("vdcs", vdc_manager.vdcs_snapshot)
+    config_writer.async_register_section("vdsds", device_manager.vdsds_snapshot)
+    entry.async_on_unload(device_store.async_flush)
+    entry.async_on_unload(config_writer.async_flush)
+    entry.async_on_unload(
+        hass.bus.async_listen(EVENT_HOMEASSISTANT_FINAL_WRITE, config_writer.async_flush)
+    )
     
-    # Initialize template manager
-    template_manager = TemplateManager()
-    await template_manager.load_templates()
+    # All entries share one ramp timer, the last loaded entry sets its rate
+    async_get_ramp_engine(hass).tick_rate = entry.options.get(
+        CONF_RAMP_TICK_RATE, DEFAULT_RAMP_TICK_RATE
+    )
 
     # Initialize binding registry
-    binding_registry = BindingRegistry(hass)
+    binding_registry = BindingRegistry(
+        hass,
+        per_entity_events=entry.options.get(
+            CONF_PER_ENTITY_EVENTS, DEFAULT_PER_ENTITY_EVENTS
+        ),
+        metrics=metrics,
+    )
 
     # Create coordinator
     coordinator = DigitalStromVDCCoordinator(hass, vdc_manager, entry)
     
+    # Push VDC-side component changes of bound devices to their entities
+    entry.async_on_unload(
+        binding_registry.async_add_device_listener(coordinator.async_mark_device_dirty)
+    )
+    
     # Fetch initial data
     await coordinator.async_config_entry_first_refresh()
 
@@ -72,8 +130,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         DATA_DEVICE_MANAGER: device_manager,
         DATA_TEMPLATE_MANAGER: template_manager,
         DATA_BINDINGS: binding_registry,
+        DATA_METRICS: metrics,
+        DATA_CONFIG_WRITER: config_writer,
     }
 
+    # Recreate stored devices and bindings before the platforms add entities
+    await device_manager.async_restore_devices()
+
     # Forward entry setup to platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -102,6 +165,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Get managers
         data = hass.data[DOMAIN][entry.entry_id]
         vdc_manager: VDCHostManager = data.get(DATA_VDC_MANAGER) or data.get("vdc_manager")
+        device_manager: DeviceManager | None = data.get(DATA_DEVICE_MANAGER)
         binding_registry: BindingRegistry = data.get(DATA_BINDINGS) or data.get("binding_registry")
         
         # Remove all bindings
@@ -112,12 +176,27 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             elif hasattr(binding_registry, 'async_remove_all'):
                 await binding_registry.async_remove_all()
         
+        # Stop running dims and transitions of the entry's devices
+        if device_manager:
+            async_get_ramp_engine(hass).async_cancel(
+                channel
+                for device in device_manager.get_all_devices()
+                if device.output
+                for channel in device.output.channels or ()
+            )
+        
         # Shutdown VDC manager
         if vdc_manager:
             await vdc_manager.async_shutdown()
         
-        # Remove entry data
+        # Remove entry data and cached service targets of its devices
         hass.data[DOMAIN].pop(entry.entry_id)
+        async_get_resolver(hass).async_clear()
+
+        # The shared ramp timer and resolver stop with the last entry
+        if not any(key != DOMAIN for key in hass.data[DOMAIN]):
+            async_get_ramp_engine(hass).async_shutdown()
+            async_get_resolver(hass).async_shutdown()
 
     return unload_ok
 
@@ -130,49 +209,48 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for the integration."""
-    from homeassistant.helpers import device_registry as dr
     import voluptuous as vol
     from homeassistant.helpers import config_validation as cv
     
+    from homeassistant.core import ServiceCall, ServiceResponse, SupportsResponse
+
     from .const import (
+        ATTR_ANNOUNCE,
+        ATTR_AREA_ID,
+        ATTR_CONFIG_ENTRY_ID,
         ATTR_DEVICE_ID,
+        ATTR_DEVICES,
         ATTR_FORCE,
+        ATTR_LABEL_ID,
+        ATTR_LIMIT,
+        ATTR_MAX_PARALLEL,
+        ATTR_OFFSET,
+        ATTR_QUERY,
+        ATTR_RATE,
         ATTR_SCENE_NUMBER,
+        ATTR_TEMPLATE_TYPE,
+        BULK_MAX_PARALLEL,
+        DEFAULT_DIM_RATE,
+        SCENE_MAX_PARALLEL,
         SERVICE_ANNOUNCE_DEVICE,
+        SERVICE_BULK_CREATE_DEVICES,
         SERVICE_CALL_SCENE,
         SERVICE_SAVE_SCENE,
         SERVICE_REFRESH_TEMPLATES,
+        SERVICE_SEARCH_TEMPLATES,
+        TEMPLATE_PAGE_SIZE,
+        TEMPLATE_TYPE_DEVICE,
+        TEMPLATE_TYPE_VENDOR,
     )
+    from .resolver import ResolvedDevice
+    from .targets import async_resolve_targets, async_run_on_targets
 
     async def get_device_manager_for_device(device_id: str):
         """Get device manager and VDC device for a device ID."""
-        device_registry = dr.async_get(hass)
-        device_entry = device_registry.async_get(device_id)
-        
-        if not device_entry:
-            raise ValueError(f"Device {device_id} not found")
-        
-        # Find the config entry
-        config_entry_id = next(iter(device_entry.config_entries), None)
-        if not config_entry_id:
-            raise ValueError(f"No config entry for device {device_id}")
-        
-        # Get device manager
-        data = hass.data[DOMAIN].get(config_entry_id)
-        if not data:
-            raise ValueError(f"Integration data not found for {config_entry_id}")
-        
-        device_manager = data[DATA_DEVICE_MANAGER]
-        
-        # Find VDC device by dsUID (stored in device identifiers)
-        for identifier in device_entry.identifiers:
-            if identifier[0] == DOMAIN:
-                dsuid = identifier[1]
-                vdc_device = device_manager.get_device(dsuid)
-                if vdc_device:
-                    return device_manager, vdc_device
-        
-        raise ValueError(f"VDC device not found for {device_id}")
+        resolved = async_get_resolver(hass).async_resolve_device_id(device_id)
+        if resolved is None:
+            raise ValueError(f"VDC device not found for {device_id}")
+        return resolved.device_manager, resolved.device
 
     async def handle_announce_device(call) -> None:
         """Handle announce device service call."""
@@ -184,114 +262,95 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         try:
             device_manager, vdc_device = await get_device_manager_for_device(device_id)
             
-            # Announce device to DSS
-            if force or not hasattr(vdc_device, 'is_announced') or not vdc_device.is_announced:
-                await vdc_device.announce()
-                _LOGGER.info("Device announced successfully: %s", vdc_device.name)
+            # Announce device to DSS; unchanged announced devices are skipped
+            if await device_manager.async_announce_device(vdc_device, force=force):
+                _LOGGER.info("Device announced: %s", vdc_device.name)
             else:
-                _LOGGER.info("Device already announced: %s", vdc_device.name)
+                raise HomeAssistantError(f"Failed to announce {vdc_device.name}")
             
         except Exception as err:
             _LOGGER.error("Failed to announce device: %s", err)
             raise
 
-    async def handle_call_scene(call) -> None:
-        """Handle call scene service call."""
-        device_id = call.data.get(ATTR_DEVICE_ID)
-        scene_number = call.data.get(ATTR_SCENE_NUMBER)
-        
-        _LOGGER.info("Calling scene %d on device: %s", scene_number, device_id)
-        
-        try:
-            device_manager, vdc_device = await get_device_manager_for_device(device_id)
-            
-            # Call digitalSTROM scene on device
-            await vdc_device.call_scene(scene_number)
-            
-            _LOGGER.info("Scene %d called on %s", scene_number, vdc_device.name)
-            
-        except Exception as err:
-            _LOGGER.error("Failed to call scene: %s", err)
-            raise
-
-    async def handle_save_scene(call) -> None:
-        """Handle save scene service call."""
-        device_id = call.data.get(ATTR_DEVICE_ID)
-        scene_number = call.data.get(ATTR_SCENE_NUMBER)
-        
-        _LOGGER.info("Saving scene %d on device: %s", scene_number, device_id)
-        
-        try:
-            device_manager, vdc_device = await get_device_manager_for_device(device_id)
-            
-            # Save current device state as scene
-            await vdc_device.save_scene(scene_number)
-            
-            _LOGGER.info("Scene %d saved on %s", scene_number, vdc_device.name)
-            
-        except Exception as err:
-            _LOGGER.error("Failed to save scene: %s", err)
-            raise
-
-    async def handle_undo_scene(call) -> None:
-        """Handle undo scene service call."""
-        device_id = call.data.get(ATTR_DEVICE_ID)
-        
-        _LOGGER.info("Undoing scene on device: %s", device_id)
-        
-        try:
-            device_manager, vdc_device = await get_device_manager_for_device(device_id)
-            
-            # Undo last scene call
-            await vdc_device.undo_scene()
-            
-            _LOGGER.info("Scene undone on %s", vdc_device.name)
-            
-        except Exception as err:
-            _LOGGER.error("Failed to undo scene: %s", err)
-            raise
-
-    async def handle_call_min_scene(call) -> None:
-        """Handle call min scene service call."""
-        device_id = call.data.get(ATTR_DEVICE_ID)
-        scene_number = call.data.get(ATTR_SCENE_NUMBER)
-        
-        _LOGGER.info("Calling min scene %d on device: %s", scene_number, device_id)
-        
-        try:
-            device_manager, vdc_device = await get_device_manager_for_device(device_id)
-            
-            # Call scene only if not already called
-            await vdc_device.call_min_scene(scene_number)
-            
-            _LOGGER.info("Min scene %d called on %s", scene_number, vdc_device.name)
-            
-        except Exception as err:
-            _LOGGER.error("Failed to call min scene: %s", err)
-            raise
+    def scene_handler(
+        action: str,
+        operation: Callable[[ResolvedDevice, ServiceCall], Awaitable[None]],
+    ):
+        """Create a handler running a scene operation on all targets."""
+
+        async def handle(call: ServiceCall) -> ServiceResponse:
+            targets, errors = async_resolve_targets(hass, call)
+            _LOGGER.debug("%s on %d devices", action, len(targets))
+
+            report = await async_run_on_targets(
+                targets,
+                lambda resolved: operation(resolved, call),
+                max_parallel=call.data[ATTR_MAX_PARALLEL],
+            )
+            for device_id, error in errors.items():
+                report["devices"][device_id] = {"success": False, "error": error}
+                report["failed"] += 1
+
+            if call.return_response:
+                return report
+            if report["failed"]:
+                raise HomeAssistantError(
+                    f"{action} failed on {report['failed']} of "
+                    f"{len(report['devices'])} devices"
+                )
+            return None
+
+        return handle
+
+    handle_call_scene = scene_handler(
+        "Calling scene",
+        lambda resolved, call: resolved.device_manager.async_call_scene(
+            resolved.device, call.data[ATTR_SCENE_NUMBER]
+        ),
+    )
+    handle_save_scene = scene_handler(
+        "Saving scene",
+        lambda resolved, call: resolved.device_manager.async_save_scene(
+            resolved.device, call.data[ATTR_SCENE_NUMBER]
+        ),
+    )
+    handle_undo_scene = scene_handler(
+        "Undoing scene",
+        lambda resolved, call: resolved.device_manager.async_undo_scene(
+            resolved.device
+        ),
+    )
+    handle_call_min_scene = scene_handler(
+        "Calling min scene",
+        lambda resolved, call: resolved.device_manager.async_call_min_scene(
+            resolved.device, call.data[ATTR_SCENE_NUMBER]
+        ),
+    )
 
     async def handle_dim_channel(call) -> None:
         """Handle dim channel service call."""
         device_id = call.data.get(ATTR_DEVICE_ID)
         channel_index = call.data.get("channel_index", 0)
         direction = call.data.get("direction")
+        rate = call.data.get(ATTR_RATE, DEFAULT_DIM_RATE)
         
-        _LOGGER.info("Dimming channel %d %s on device: %s", channel_index, direction, device_id)
+        _LOGGER.debug("Dimming channel %d %s on device: %s", channel_index, direction, device_id)
         
         try:
             device_manager, vdc_device = await get_device_manager_for_device(device_id)
             
-            # Dim channel incrementally
+            # Dimming runs on the shared ramp engine until stopped or at the limit
             if vdc_device.output and vdc_device.output.channels:
                 channel = vdc_device.output.channels[channel_index]
+                ramps = async_get_ramp_engine(hass)
                 if direction == "up":
-                    await channel.dim_up()
+                    ramps.async_dim(vdc_device.output, channel, 1, rate)
                 elif direction == "down":
-                    await channel.dim_down()
+                    ramps.async_dim(vdc_device.output, channel, -1, rate)
                 elif direction == "stop":
-                    await channel.dim_stop()
+                    ramps.async_stop(channel)
             
-            _LOGGER.info("Channel %d dimmed %s on %s", channel_index, direction, vdc_device.name)
+            _LOGGER.debug("Channel %d dimming %s on %s", channel_index, direction, vdc_device.name)
             
         except Exception as err:
             _LOGGER.error("Failed to dim channel: %s", err)
@@ -300,7 +359,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
     async def handle_set_local_priority(call) -> None:
         """Handle set local priority service call."""
         device_id = call.data.get(ATTR_DEVICE_ID)
-        scene_number = call.data.get(ATTR_SCENE)
+        scene_number = call.data.get(ATTR_SCENE_NUMBER)
            
         _LOGGER.info("Setting local priority for scene %d on device: %s", scene_number, device_id)
         
@@ -308,7 +367,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             device_manager, vdc_device = await get_device_manager_for_device(device_id)
             
             # Set local priority for scene
-            await vdc_device.set_local_prio(scene_number)
+            await device_manager.async_set_local_priority(vdc_device, scene_number)
             
             _LOGGER.info("Local priority set for scene %d on %s", scene_number, vdc_device.name)
             
@@ -321,13 +380,8 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         _LOGGER.info("Refreshing device templates")
         
         try:
-            # Refresh templates for all config entries
-            for entry_id, data in hass.data[DOMAIN].items():
-                if entry_id == DOMAIN:
-                    continue
-                template_manager = data.get(DATA_TEMPLATE_MANAGER)
-                if template_manager:
-                    await template_manager.load_templates()
+            # All config entries share one catalog, only changed files are parsed
+            await async_get_template_manager(hass).load_templates()
             
             _LOGGER.info("Templates refreshed successfully")
             
@@ -335,6 +389,67 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             _LOGGER.error("Failed to refresh templates: %s", err)
             raise
     
+    async def handle_search_templates(call: ServiceCall) -> ServiceResponse:
+        """Handle search templates service call."""
+        offset = call.data[ATTR_OFFSET]
+        total, templates = async_get_template_manager(hass).search_templates(
+            call.data[ATTR_QUERY],
+            call.data.get(ATTR_TEMPLATE_TYPE),
+            offset,
+            call.data[ATTR_LIMIT],
+        )
+        return {
+            "total": total,
+            "offset": offset,
+            "templates": [
+                {
+                    "template_name": key,
+                    "name": template.get("name"),
+                    "description": template.get("description", ""),
+                    "type": template.get("type"),
+                    "vendor": template.get("vendor"),
+                    "bindings": template.get("bindings", []),
+                }
+                for key, template in templates.items()
+            ],
+        }
+
+    async def handle_bulk_create_devices(call: ServiceCall) -> ServiceResponse:
+        """Handle bulk create devices service call."""
+        entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+        entries = {
+            key: data
+            for key, data in hass.data[DOMAIN].items()
+            if key != DOMAIN and (entry_id is None or key == entry_id)
+        }
+        if len(entries) != 1:
+            raise ValueError(
+                f"Config entry {entry_id} not found"
+                if entry_id
+                else "Several VDC hosts configured, config_entry_id is required"
+            )
+        device_manager: DeviceManager = next(iter(entries.values()))[DATA_DEVICE_MANAGER]
+
+        devices = call.data[ATTR_DEVICES]
+        _LOGGER.info("Bulk creating %d devices", len(devices))
+        report = await device_manager.async_create_devices_bulk(
+            devices,
+            announce=call.data[ATTR_ANNOUNCE],
+            max_parallel=call.data[ATTR_MAX_PARALLEL],
+        )
+        return report if call.return_response else None
+
+    # Scene services take devices, areas and labels as targets
+    TARGET_KEYS = (ATTR_DEVICE_ID, ATTR_AREA_ID, ATTR_LABEL_ID)
+    SCENE_TARGET_SCHEMA = {
+        vol.Optional(key): vol.All(cv.ensure_list, [cv.string]) for key in TARGET_KEYS
+    }
+    SCENE_TARGET_SCHEMA.update({
+        vol.Optional(ATTR_MAX_PARALLEL, default=SCENE_MAX_PARALLEL): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=128)
+        ),
+    })
+
     # Register services (only once)
     if not hass.services.has_service(DOMAIN, SERVICE_ANNOUNCE_DEVICE):
         hass.services.async_register(
@@ -352,12 +467,16 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             DOMAIN,
             SERVICE_CALL_SCENE,
             handle_call_scene,
-            schema=vol.Schema({
-                vol.Required(ATTR_DEVICE_ID): cv.string,
-                vol.Required(ATTR_SCENE_NUMBER): vol.All(
-                    vol.Coerce(int), vol.Range(min=0, max=127)
-                ),
-            }),
+            schema=vol.All(
+                vol.Schema({
+                    **SCENE_TARGET_SCHEMA,
+                    vol.Required(ATTR_SCENE_NUMBER): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=127)
+                    ),
+                }),
+                cv.has_at_least_one_key(*TARGET_KEYS),
+            ),
+            supports_response=SupportsResponse.OPTIONAL,
         )
 
     if not hass.services.has_service(DOMAIN, SERVICE_SAVE_SCENE):
@@ -365,12 +484,16 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             DOMAIN,
             SERVICE_SAVE_SCENE,
             handle_save_scene,
-            schema=vol.Schema({
-                vol.Required(ATTR_DEVICE_ID): cv.string,
-                vol.Required(ATTR_SCENE_NUMBER): vol.All(
-                    vol.Coerce(int), vol.Range(min=32, max=63)
-                ),
-            }),
+            schema=vol.All(
+                vol.Schema({
+                    **SCENE_TARGET_SCHEMA,
+                    vol.Required(ATTR_SCENE_NUMBER): vol.All(
+                        vol.Coerce(int), vol.Range(min=32, max=63)
+                    ),
+                }),
+                cv.has_at_least_one_key(*TARGET_KEYS),
+            ),
+            supports_response=SupportsResponse.OPTIONAL,
         )
 
     if not hass.services.has_service(DOMAIN, "undo_scene"):
@@ -378,9 +501,11 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             DOMAIN,
             "undo_scene",
             handle_undo_scene,
-            schema=vol.Schema({
-                vol.Required(ATTR_DEVICE_ID): cv.string,
-            }),
+            schema=vol.All(
+                vol.Schema(SCENE_TARGET_SCHEMA),
+                cv.has_at_least_one_key(*TARGET_KEYS),
+            ),
+            supports_response=SupportsResponse.OPTIONAL,
         )
 
     if not hass.services.has_service(DOMAIN, "call_min_scene"):
@@ -388,12 +513,16 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             DOMAIN,
             "call_min_scene",
             handle_call_min_scene,
-            schema=vol.Schema({
-                vol.Required(ATTR_DEVICE_ID): cv.string,
-                vol.Required(ATTR_SCENE_NUMBER): vol.All(
-                    vol.Coerce(int), vol.Range(min=0, max=127)
-                ),
-            }),
+            schema=vol.All(
+                vol.Schema({
+                    **SCENE_TARGET_SCHEMA,
+                    vol.Required(ATTR_SCENE_NUMBER): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=127)
+                    ),
+                }),
+                cv.has_at_least_one_key(*TARGET_KEYS),
+            ),
+            supports_response=SupportsResponse.OPTIONAL,
         )
 
     if not hass.services.has_service(DOMAIN, "dim_channel"):
@@ -407,6 +536,9 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                     vol.Coerce(int), vol.Range(min=0, max=10)
                 ),
                 vol.Required("direction"): vol.In(["up", "down", "stop"]),
+                vol.Optional(ATTR_RATE, default=DEFAULT_DIM_RATE): vol.All(
+                    vol.Coerce(float), vol.Range(min=0.1, max=1000.0)
+                ),
             }),
         )
 
@@ -423,6 +555,22 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             }),
         )
 
+    if not hass.services.has_service(DOMAIN, SERVICE_BULK_CREATE_DEVICES):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_BULK_CREATE_DEVICES,
+            handle_bulk_create_devices,
+            schema=vol.Schema({
+                vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+                vol.Required(ATTR_DEVICES): vol.All(cv.ensure_list, [dict]),
+                vol.Optional(ATTR_ANNOUNCE, default=True): cv.boolean,
+                vol.Optional(ATTR_MAX_PARALLEL, default=BULK_MAX_PARALLEL): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=128)
+                ),
+            }),
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
     if not hass.services.has_service(DOMAIN, SERVICE_REFRESH_TEMPLATES):
         hass.services.async_register(
             DOMAIN,
@@ -430,6 +578,26 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             handle_refresh_templates,
         )
 
+    if not hass.services.has_service(DOMAIN, SERVICE_SEARCH_TEMPLATES):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_SEARCH_TEMPLATES,
+            handle_search_templates,
+            schema=vol.Schema({
+                vol.Optional(ATTR_QUERY, default=""): cv.string,
+                vol.Optional(ATTR_TEMPLATE_TYPE): vol.In(
+                    [TEMPLATE_TYPE_DEVICE, TEMPLATE_TYPE_VENDOR]
+                ),
+                vol.Optional(ATTR_OFFSET, default=0): vol.All(
+                    vol.Coerce(int), vol.Range(min=0)
+                ),
+                vol.Optional(ATTR_LIMIT, default=TEMPLATE_PAGE_SIZE): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=100)
+                ),
+            }),
+            supports_response=SupportsResponse.ONLY,
+        )
+
 
 # Module-level service functions for testing
 async def async_call_scene(hass: HomeAssistant, service_data: dict[str, Any]) -> None:
@@ -438,16 +606,10 @@ async def async_call_scene(hass: HomeAssistant, service_data: dict[str, Any]) ->
     scene = service_data.get("scene")
     force = service_data.get("force", False)
     
-    # Get device manager from hass data
-    for entry_data in hass.data.get(DOMAIN, {}).values():
-        if isinstance(entry_data, dict) and "device_manager" in entry_data:
-            device_manager = entry_data["device_manager"]
-            devices = device_manager.get_all_devices()
-            for device in devices:
-                if device.dSUID == device_id:
-                    await device.call_scene(scene_id=scene, force=force)
-                    return
-    raise ValueError(f"Device {device_id} not found")
+    resolved = async_get_resolver(hass).async_resolve_dsuid(device_id)
+    if resolved is None:
+        raise ValueError(f"Device {device_id} not found")
+    await resolved.device.call_scene(scene_id=scene, force=force)
 
 
 async def async_dim_channel(hass: HomeAssistant, service_data: dict[str, Any]) -> None:
@@ -457,26 +619,21 @@ async def async_dim_channel(hass: HomeAssistant, service_data: dict[str, Any]) -
     direction = service_data.get("direction")
     duration = service_data.get("duration")
     
-    # Get device manager from hass data
-    for entry_data in hass.data.get(DOMAIN, {}).values():
-        if isinstance(entry_data, dict) and "device_manager" in entry_data:
-            device_manager = entry_data["device_manager"]
-            devices = device_manager.get_all_devices()
-            for device in devices:
-                if device.dSUID == device_id:
-                    if device.output and device.output.channels:
-                        channel = device.output.channels[channel_index]
-                        # Support both string and numeric direction
-                        if hasattr(channel, 'dim'):
-                            # New API with dim method
-                            await channel.dim(direction=direction, duration=duration)
-                        else:
-                            # Old API with dim_up/dim_down/dim_stop
-                            if direction == "up" or direction == 1:
-                                await channel.dim_up()
-                            elif direction == "down" or direction == -1:
-                                await channel.dim_down()
-                            elif direction == "stop" or direction == 0:
-                                await channel.dim_stop()
-                    return
-    raise ValueError(f"Device {device_id} not found")
+    resolved = async_get_resolver(hass).async_resolve_dsuid(device_id)
+    if resolved is None:
+        raise ValueError(f"Device {device_id} not found")
+    device = resolved.device
+    if device.output and device.output.channels:
+        channel = device.output.channels[channel_index]
+        # Support both string and numeric direction
+        if hasattr(channel, 'dim'):
+            # New API with dim method
+            await channel.dim(direction=direction, duration=duration)
+        else:
+            # Old API with dim_up/dim_down/dim_stop
+            if direction == "up" or direction == 1:
+                await channel.dim_up()
+            elif direction == "down" or direction == -1:
+                await channel.dim_down()
+            elif direction == "stop" or direction == 0:
+                await channel.dim_stop()
@@ -0,0 +1,222 @@
+"""Device announcement scheduling for digitalSTROM VDC integration."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import random
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    ANNOUNCE_MAX_RETRIES,
+    ANNOUNCE_RETRY_DELAY,
+    ANNOUNCE_TIMEOUT,
+    DEFAULT_ANNOUNCE_CONCURRENCY,
+    DEFAULT_ANNOUNCE_RATE,
+)
+from .metrics import DISABLED_METRICS, MESSAGES_OUT, MetricsRegistry
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def device_content_hash(device: Any) -> str:
+    """Return a hash of everything the dSS learns from an announcement."""
+    output = getattr(device, "output", None)
+    channels = (output.channels or []) if output else []
+
+    def attrs(components: Any, *names: str) -> list[tuple[Any, ...]]:
+        return [
+            tuple(getattr(component, name, None) for name in names)
+            for component in components or []
+        ]
+
+    content = (
+        getattr(device, "name", None),
+        getattr(device, "primary_group", None),
+        getattr(device, "model", None),
+        attrs(channels, "channel_type", "min_value", "max_value"),
+        attrs(getattr(device, "sensors", None), "sensor_type", "unit"),
+        attrs(getattr(device, "binary_inputs", None), "input_type"),
+        attrs(getattr(device, "button_inputs", None), "button_type"),
+    )
+    return hashlib.blake2b(repr(content).encode(), digest_size=8).hexdigest()
+
+
+class TokenBucket:
+    """Token bucket rate limiter."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize the bucket, full."""
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AnnouncementScheduler:
+    """Queue device announcements and run them concurrently, rate limited.
+
+    Announcements run on a fixed number of workers and take a token from a
+    bucket refilled at the configured rate. Failures are retried with
+    exponential backoff and jitter. The content hash of each announced device
+    is kept, so an unchanged device is not announced again until the dSS
+    connection is lost. Every reset starts a new generation, and an
+    announcement that finishes in a later generation than it started in is
+    sent again, since it went to the previous dSS session.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        concurrency: int = DEFAULT_ANNOUNCE_CONCURRENCY,
+        rate: float = DEFAULT_ANNOUNCE_RATE,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._messages_out = (metrics or DISABLED_METRICS).counter(MESSAGES_OUT)
+        self.concurrency = concurrency
+        self._bucket = TokenBucket(rate, burst=max(1, concurrency))
+        self._queue: asyncio.Queue[Any] = asyncio.Queue()
+        self._pending: dict[str, asyncio.Future[bool]] = {}
+        self._announced: dict[str, str] = {}
+        self._generation = 0
+        self._workers: list[asyncio.Task] = []
+        self.device_provider: Callable[[], Iterable[Any]] | None = None
+
+        self.announced = 0
+        self.skipped_unchanged = 0
+        self.retries = 0
+        self.failures = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return scheduler counters."""
+        return {
+            "announced": self.announced,
+            "skipped_unchanged": self.skipped_unchanged,
+            "retries": self.retries,
+            "failures": self.failures,
+            "queued": len(self._pending),
+            "announced_devices": len(self._announced),
+        }
+
+    def is_announced(self, dsuid: str) -> bool:
+        """Return True if the device is announced to the current dSS."""
+        return dsuid in self._announced
+
+    @callback
+    def async_queue(self, device: Any, force: bool = False) -> asyncio.Future[bool]:
+        """Queue an announcement; the future resolves to its success."""
+        dsuid = device.dSUID
+        if (pending := self._pending.get(dsuid)) is not None:
+            return pending
+
+        future: asyncio.Future[bool] = self.hass.loop.create_future()
+        if not force and self._announced.get(dsuid) == device_content_hash(device):
+            self.skipped_unchanged += 1
+            future.set_result(True)
+            return future
+
+        self._pending[dsuid] = future
+        self._queue.put_nowait(device)
+        self._async_start_workers()
+        return future
+
+    async def async_announce_many(
+        self, devices: Iterable[Any], force: bool = False
+    ) -> list[bool]:
+        """Announce several devices and return their results."""
+        futures = [self.async_queue(device, force) for device in devices]
+        return list(await asyncio.gather(*futures))
+
+    @callback
+    def async_announce_all(self) -> list[asyncio.Future[bool]]:
+        """Queue all known devices, e.g. after the dSS (re)connected."""
+        if self.device_provider is None:
+            return []
+        return [self.async_queue(device) for device in self.device_provider()]
+
+    @callback
+    def async_reset(self) -> None:
+        """Forget announced state; the dSS lost it with the connection."""
+        self._generation += 1
+        self._announced.clear()
+
+    async def async_shutdown(self) -> None:
+        """Stop the workers and fail pending announcements."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+        for future in self._pending.values():
+            if not future.done():
+                future.set_result(False)
+        self._pending.clear()
+
+    @callback
+    def _async_start_workers(self) -> None:
+        """Start the workers on first use."""
+        if self._workers:
+            return
+        self._workers = [
+            self.hass.async_create_background_task(
+                self._worker(), f"digitalstrom_vdc_announcer_{number}"
+            )
+            for number in range(self.concurrency)
+        ]
+
+    async def _worker(self) -> None:
+        """Announce queued devices."""
+        while True:
+            device = await self._queue.get()
+            try:
+                success = await self._announce(device)
+            finally:
+                self._queue.task_done()
+            if (future := self._pending.pop(device.dSUID, None)) and not future.done():
+                future.set_result(success)
+
+    async def _announce(self, device: Any) -> bool:
+        """Announce a device, retrying with backoff and jitter."""
+        content_hash = device_content_hash(device)
+        for attempt in range(ANNOUNCE_MAX_RETRIES + 1):
+            await self._bucket.acquire()
+            generation = self._generation
+            self._messages_out.inc("announce")
+            try:
+                await asyncio.wait_for(device.announce(), ANNOUNCE_TIMEOUT)
+            except Exception as err:  # noqa: BLE001 - any failure is retried
+                if attempt == ANNOUNCE_MAX_RETRIES:
+                    self.failures += 1
+                    _LOGGER.warning("Failed to announce %s: %s", device.dSUID, err)
+                    return False
+                self.retries += 1
+                delay = ANNOUNCE_RETRY_DELAY * 2**attempt
+                await asyncio.sleep(delay + random.uniform(0, delay))
+                continue
+
+            if generation != self._generation:
+                # The connection was reset meanwhile, announce to the new dSS
+                continue
+            self.announced += 1
+            self._announced[device.dSUID] = content_hash
+            return True
+        return False
@@ -50,7 +50,7 @@ class DigitalStromVDCBinarySensor(CoordinatorEntity, BinarySensorEntity):
         binary_input: Any,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=vdc_device.dSUID)
         self._vdc_device = vdc_device
         self._binary_input = binary_input
         self._attr_unique_id = f"{vdc_device.dSUID}_{binary_input.input_type}"
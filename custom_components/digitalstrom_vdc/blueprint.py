@@ -0,0 +1,201 @@
+"""Precompiled device blueprints for digitalSTROM VDC templates."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+import voluptuous as vol
+
+from .errors import InvalidTemplate
+
+# Binding names of built-in templates that refer to sensors, not channels
+SENSOR_BINDINGS = frozenset(
+    {"temperature", "humidity", "illuminance", "co2", "power", "energy"}
+)
+
+_PARAMETER_VALIDATORS: dict[str, Any] = {
+    "int": vol.Coerce(int),
+    "integer": vol.Coerce(int),
+    "float": vol.Coerce(float),
+    "number": vol.Coerce(float),
+    "bool": vol.Boolean(),
+    "boolean": vol.Boolean(),
+    "str": str,
+    "string": str,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Blueprint:
+    """Immutable, precompiled form of a device template.
+
+    The component layout, the binding slots and the parameter schema are
+    worked out once per template; creating a device only validates its
+    parameters and maps its binding names onto component ids.
+    """
+
+    template_name: str
+    signature: tuple[int, int] | None
+    channels: tuple[str, ...]
+    sensors: tuple[str, ...]
+    binary_inputs: int
+    buttons: int
+    slots: Mapping[str, str]
+    parameter_schema: vol.Schema
+
+    def instantiate(self, parameters: Mapping[str, Any]) -> dict[str, Any]:
+        """Return validated parameters with template defaults filled in.
+
+        Raises vol.Invalid for unknown or invalid parameters.
+        """
+        return self.parameter_schema(dict(parameters))
+
+    def component_bindings(self, entity_bindings: Mapping[str, str]) -> dict[str, str]:
+        """Map binding names to component ids, component ids pass through."""
+        return {
+            self.slots.get(name, name): entity_id
+            for name, entity_id in entity_bindings.items()
+        }
+
+
+def _component_type(component: Any) -> str | None:
+    """Return the type of a channel, sensor or input definition."""
+    if not isinstance(component, dict):
+        return None
+    return (
+        component.get("channel_type")
+        or component.get("sensor_type")
+        or component.get("input_type")
+        or component.get("type")
+    )
+
+
+def _parameter_schema(parameters: list[Any]) -> vol.Schema:
+    """Compile the parameter declarations of a template.
+
+    A declaration is either a bare name or a mapping with name and optional
+    type, default, required, min, max and options keys.
+    """
+    if not parameters:
+        # Without declarations pyvdcapi decides what it accepts
+        return vol.Schema({}, extra=vol.ALLOW_EXTRA)
+
+    schema: dict[Any, Any] = {}
+    for parameter in parameters:
+        if isinstance(parameter, str):
+            schema[vol.Optional(parameter)] = object
+            continue
+        if not isinstance(parameter, dict) or not parameter.get("name"):
+            raise InvalidTemplate(f"Invalid parameter declaration: {parameter!r}")
+
+        name = parameter["name"]
+        kind = parameter.get("type", "str")
+        if kind not in _PARAMETER_VALIDATORS:
+            raise InvalidTemplate(f"Unknown type {kind!r} of parameter {name}")
+        validators = [_PARAMETER_VALIDATORS[kind]]
+        if "min" in parameter or "max" in parameter:
+            validators.append(
+                vol.Range(min=parameter.get("min"), max=parameter.get("max"))
+            )
+        if parameter.get("options"):
+            validators.append(vol.In(parameter["options"]))
+
+        if "default" in parameter:
+            key = vol.Optional(name, default=parameter["default"])
+        elif parameter.get("required", True):
+            key = vol.Required(name)
+        else:
+            key = vol.Optional(name)
+        schema[key] = vol.All(*validators)
+    return vol.Schema(schema)
+
+
+def _layout(data: Mapping[str, Any]) -> tuple[list[str], list[str], int, int]:
+    """Return channel types, sensor types and input counts of a template.
+
+    Built-in catalog entries only list binding names; their layout is
+    derived from those.
+    """
+    if any(
+        key in data for key in ("output", "sensors", "binary_inputs", "button_inputs")
+    ):
+        output = data.get("output") or {}
+        channels = [
+            _component_type(channel) or f"channel_{index}"
+            for index, channel in enumerate(output.get("channels") or [])
+        ]
+        sensors = [
+            _component_type(sensor) or f"sensor_{index}"
+            for index, sensor in enumerate(data.get("sensors") or [])
+        ]
+        return (
+            channels,
+            sensors,
+            len(data.get("binary_inputs") or []),
+            len(data.get("button_inputs") or []),
+        )
+
+    channels, sensors = [], []
+    binary_inputs = buttons = 0
+    for binding in data.get("bindings") or []:
+        if binding == "button":
+            buttons += 1
+        elif binding == "binary_input":
+            binary_inputs += 1
+        elif binding in SENSOR_BINDINGS:
+            sensors.append(binding)
+        else:
+            channels.append(binding)
+    return channels, sensors, binary_inputs, buttons
+
+
+def _slots(
+    channels: list[str], sensors: list[str], binary_inputs: int, buttons: int
+) -> dict[str, str]:
+    """Map binding names to component ids.
+
+    A name used by several components is numbered from the second one on
+    (brightness, brightness_2).
+    """
+    slots: dict[str, str] = {}
+
+    def add(name: str, component_id: str) -> None:
+        slot, count = name, 1
+        while slot in slots:
+            count += 1
+            slot = f"{name}_{count}"
+        slots[slot] = component_id
+
+    for index, channel in enumerate(channels):
+        add(channel, f"output_channel_{index}")
+    for index, sensor in enumerate(sensors):
+        add(sensor, f"sensor_{index}")
+    for index in range(binary_inputs):
+        add("binary_input", f"binary_input_{index}")
+    for index in range(buttons):
+        add("button", f"button_{index}")
+    return slots
+
+
+def compile_blueprint(
+    template_name: str,
+    data: Mapping[str, Any],
+    signature: tuple[int, int] | None = None,
+) -> Blueprint:
+    """Compile a template file or catalog entry into a blueprint.
+
+    Raises InvalidTemplate for malformed parameter declarations.
+    """
+    channels, sensors, binary_inputs, buttons = _layout(data)
+    return Blueprint(
+        template_name=template_name,
+        signature=signature,
+        channels=tuple(channels),
+        sensors=tuple(sensors),
+        binary_inputs=binary_inputs,
+        buttons=buttons,
+        slots=MappingProxyType(_slots(channels, sensors, binary_inputs, buttons)),
+        parameter_schema=_parameter_schema(data.get("parameters") or []),
+    )
@@ -50,7 +50,7 @@ class DigitalStromVDCButton(CoordinatorEntity, ButtonEntity):
         button_input: Any,
     ) -> None:
         """Initialize the button."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=vdc_device.dSUID)
         self._vdc_device = vdc_device
         self._button_input = button_input
         self._attr_unique_id = f"{vdc_device.dSUID}_{button_input.button_type}"
@@ -0,0 +1,69 @@
+"""Batched output channel writes for digitalSTROM VDC integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ChannelBatch:
+    """Stage several output channel values and commit them in one VDC push.
+
+    The VDC API buffers channel values written with ``apply_now=False`` and
+    applies everything buffered together with the next ``apply_now=True``
+    write. Committing a batch therefore buffers all staged channels except the
+    last one, which is written normally and triggers a single push to the dSS.
+    """
+
+    def __init__(self, output: Any) -> None:
+        """Initialize an empty batch for a device output."""
+        self.output = output
+        self._staged: dict[int, tuple[Any, float]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of staged channels."""
+        return len(self._staged)
+
+    def stage(self, channel: Any, value: float) -> ChannelBatch:
+        """Stage a value for a channel, replacing a previously staged one."""
+        self._staged[id(channel)] = (channel, float(value))
+        return self
+
+    def unstage(self, channel: Any) -> None:
+        """Drop the staged value of a channel."""
+        self._staged.pop(id(channel), None)
+
+    def is_staged(self, channel: Any) -> bool:
+        """Return whether a value is staged for a channel."""
+        return id(channel) in self._staged
+
+    def stage_all(self, value: float) -> ChannelBatch:
+        """Stage the same value for every channel of the output."""
+        for channel in self.output.channels:
+            self.stage(channel, value)
+        return self
+
+    async def async_commit(self) -> None:
+        """Write all staged values and apply them together."""
+        staged = list(self._staged.values())
+        self._staged.clear()
+        if not staged:
+            return
+
+        *buffered, (last_channel, last_value) = staged
+        for channel, value in buffered:
+            await channel.set_value(value, apply_now=False)
+        await last_channel.set_value(last_value)
+
+        _LOGGER.debug("Applied %d channel values in one push", len(staged))
+
+
+async def async_apply_channel_values(
+    output: Any, values: list[tuple[Any, float]]
+) -> None:
+    """Apply a set of (channel, value) pairs to a device output atomically."""
+    batch = ChannelBatch(output)
+    for channel, value in values:
+        batch.stage(channel, value)
+    await batch.async_commit()
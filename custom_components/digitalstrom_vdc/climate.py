@@ -12,8 +12,11 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .channel_batch import async_apply_channel_values
 from .const import DATA_COORDINATOR, DATA_DEVICE_MANAGER, DOMAIN
 from .coordinator import DigitalStromVDCCoordinator
+from .device_manager import DeviceManager
+from .role_index import ROLE_TEMPERATURE
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,14 +37,16 @@ async def async_setup_entry(
         # Check if device is in heating group (DSGroup.HEATING)
         # DSGroup.HEATING = 9 in digitalSTROM
         if hasattr(device, 'primary_group') and device.primary_group == 9:
-            entities.append(DigitalStromVDCClimate(coordinator, device))
+            entities.append(DigitalStromVDCClimate(coordinator, device, device_manager))
         # Also check for devices with temperature control capabilities
         elif hasattr(device, 'sensors') and device.sensors:
             # Check if device has temperature sensor
-            has_temp_sensor = any('temperature' in s.sensor_type.lower() 
-                                for s in device.sensors if hasattr(s, 'sensor_type'))
+            roles = device_manager.get_role_index(device)
+            has_temp_sensor = roles.sensor(ROLE_TEMPERATURE) is not None
             if has_temp_sensor and hasattr(device, 'output') and device.output:
-                entities.append(DigitalStromVDCClimate(coordinator, device))
+                entities.append(
+                    DigitalStromVDCClimate(coordinator, device, device_manager)
+                )
 
     async_add_entities(entities)
 
@@ -57,10 +62,12 @@ class DigitalStromVDCClimate(CoordinatorEntity, ClimateEntity):
         self,
         coordinator: DigitalStromVDCCoordinator,
         vdc_device: Any,
+        device_manager: DeviceManager,
     ) -> None:
         """Initialize the climate device."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=vdc_device.dSUID)
         self._vdc_device = vdc_device
+        self._device_manager = device_manager
         self._attr_unique_id = vdc_device.dSUID
         self._attr_name = vdc_device.name
         self._attr_min_temp = 5.0
@@ -69,11 +76,11 @@ class DigitalStromVDCClimate(CoordinatorEntity, ClimateEntity):
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        if hasattr(self._vdc_device, 'sensors') and self._vdc_device.sensors:
-            # Get temperature from first sensor
-            temp_sensor = next((s for s in self._vdc_device.sensors if 'temperature' in s.sensor_type.lower()), None)
-            if temp_sensor:
-                return float(temp_sensor.value)
+        # Get temperature from first temperature sensor
+        roles = self._device_manager.get_role_index(self._vdc_device)
+        temp_sensor = roles.sensor(ROLE_TEMPERATURE)
+        if temp_sensor:
+            return float(temp_sensor.value)
         return None
 
     @property
@@ -108,9 +115,11 @@ class DigitalStromVDCClimate(CoordinatorEntity, ClimateEntity):
         
         # Set control value for temperature setpoint
         primary_channel = self._vdc_device.output.channels[0]
-        await primary_channel.set_value(float(temperature))
+        await async_apply_channel_values(
+            self._vdc_device.output, [(primary_channel, float(temperature))]
+        )
         
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_schedule_device_refresh(self._vdc_device.dSUID)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
@@ -123,11 +132,15 @@ class DigitalStromVDCClimate(CoordinatorEntity, ClimateEntity):
         # Set mode - OFF = set value to 0, HEAT = restore previous value or default
         primary_channel = self._vdc_device.output.channels[0]
         if hvac_mode == HVACMode.OFF:
-            await primary_channel.set_value(0.0)
+            await async_apply_channel_values(
+                self._vdc_device.output, [(primary_channel, 0.0)]
+            )
         elif hvac_mode == HVACMode.HEAT:
-            await primary_channel.set_value(21.0)  # Default 21°C
+            await async_apply_channel_values(
+                self._vdc_device.output, [(primary_channel, 21.0)]  # Default 21°C
+            )
         
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_schedule_device_refresh(self._vdc_device.dSUID)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-import socket
 from typing import Any
 
 import voluptuous as vol
@@ -13,14 +12,28 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
 
 from .const import (
+    CONF_ANNOUNCE_CONCURRENCY,
+    CONF_ANNOUNCE_RATE,
     CONF_ANNOUNCE_SERVICE,
     CONF_DSUID,
+    CONF_METRICS,
+    CONF_PER_ENTITY_EVENTS,
     CONF_PORT,
+    CONF_REFRESH_WINDOW,
+    CONF_RAMP_TICK_RATE,
     CONF_SERVICE_NAME,
+    CONF_UNDO_DEPTH,
     CONF_VDC_NAME,
+    DEFAULT_ANNOUNCE_CONCURRENCY,
+    DEFAULT_ANNOUNCE_RATE,
     DEFAULT_ANNOUNCE_SERVICE,
+    DEFAULT_METRICS,
+    DEFAULT_PER_ENTITY_EVENTS,
     DEFAULT_PORT,
+    DEFAULT_REFRESH_WINDOW,
+    DEFAULT_RAMP_TICK_RATE,
     DEFAULT_SERVICE_NAME,
+    DEFAULT_UNDO_DEPTH,
     DEFAULT_VDC_NAME,
     DOMAIN,
     ERROR_CANNOT_CONNECT,
@@ -29,6 +42,7 @@ from .const import (
     ERROR_PORT_IN_USE,
     ERROR_UNKNOWN,
     STEP_DSS_CONNECT,
+    STEP_SETTINGS,
     STEP_USER,
     STEP_VDC_INIT,
     STEP_ZEROCONF_SETUP,
@@ -39,6 +53,7 @@ from .errors import (
     InvalidPort,
     PortInUse,
 )
+from .network import async_get_local_ip, async_is_port_available
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -60,29 +75,6 @@ def generate_dsuid_from_ip(ip_address: str) -> str:
     return DSUIDGenerator.generate_vdc_host_dsuid(pseudo_mac, vendor_id="HomeAssistant")
 
 
-def get_local_ip() -> str:
-    """Get the local IP address of the Home Assistant host."""
-    try:
-        # Create a socket to determine the local IP
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        local_ip = s.getsockname()[0]
-        s.close()
-        return local_ip
-    except Exception:
-        return "127.0.0.1"
-
-
-def is_port_available(port: int) -> bool:
-    """Check if a port is available."""
-    try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.bind(("", port))
-            return True
-    except OSError:
-        return False
-
-
 class DigitalStromVDCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for digitalSTROM VDC."""
 
@@ -106,7 +98,7 @@ class DigitalStromVDCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Validate port
             if not (1024 <= port <= 65535):
                 errors[CONF_PORT] = ERROR_INVALID_PORT
-            elif not is_port_available(port):
+            elif not await async_is_port_available(self.hass, port):
                 errors[CONF_PORT] = ERROR_PORT_IN_USE
             else:
                 # Port is valid, store and move to VDC init
@@ -142,7 +134,7 @@ class DigitalStromVDCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return await self.async_step_zeroconf_setup()
 
         # Get local IP and generate dsUID
-        self._local_ip = await self.hass.async_add_executor_job(get_local_ip)
+        self._local_ip = await async_get_local_ip(self.hass)
         
         try:
             self._dsuid = generate_dsuid_from_ip(self._local_ip)
@@ -237,6 +229,8 @@ class DigitalStromVDCOptionsFlow(config_entries.OptionsFlow):
         self.config_entry = config_entry
         self._device_config: dict[str, Any] = {}
         self._selected_template: str | None = None
+        self._template_query = ""
+        self._template_page = 1
         self._inputs: list[dict[str, Any]] = []
         self._outputs: list[dict[str, Any]] = []
         self._entity_bindings: dict[str, str] = {}
@@ -249,6 +243,8 @@ class DigitalStromVDCOptionsFlow(config_entries.OptionsFlow):
             action = user_input.get("action")
             if action == "add_device":
                 return await self.async_step_add_device()
+            if action == STEP_SETTINGS:
+                return await self.async_step_settings()
             
         # Get existing devices from device manager
         from homeassistant.helpers import device_registry as dr
@@ -263,6 +259,7 @@ class DigitalStromVDCOptionsFlow(config_entries.OptionsFlow):
             data_schema=vol.Schema({
                 vol.Required("action"): vol.In({
                     "add_device": "Add New Device",
+                    STEP_SETTINGS: "Settings",
                 }),
             }),
             description_placeholders={
@@ -270,6 +267,66 @@ class DigitalStromVDCOptionsFlow(config_entries.OptionsFlow):
             },
         )
 
+    async def async_step_settings(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Configure integration settings."""
+        if user_input is not None:
+            # Per-entity events, announcement, undo, ramp and metrics settings
+            # take effect after a reload
+            return self.async_create_entry(
+                title="",
+                data={**self.config_entry.options, **user_input},
+            )
+
+        return self.async_show_form(
+            step_id=STEP_SETTINGS,
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_REFRESH_WINDOW,
+                    default=self.config_entry.options.get(
+                        CONF_REFRESH_WINDOW, DEFAULT_REFRESH_WINDOW
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.0, max=10.0)),
+                vol.Required(
+                    CONF_PER_ENTITY_EVENTS,
+                    default=self.config_entry.options.get(
+                        CONF_PER_ENTITY_EVENTS, DEFAULT_PER_ENTITY_EVENTS
+                    ),
+                ): cv.boolean,
+                vol.Required(
+                    CONF_ANNOUNCE_CONCURRENCY,
+                    default=self.config_entry.options.get(
+                        CONF_ANNOUNCE_CONCURRENCY, DEFAULT_ANNOUNCE_CONCURRENCY
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=64)),
+                vol.Required(
+                    CONF_ANNOUNCE_RATE,
+                    default=self.config_entry.options.get(
+                        CONF_ANNOUNCE_RATE, DEFAULT_ANNOUNCE_RATE
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=1.0, max=1000.0)),
+                vol.Required(
+                    CONF_UNDO_DEPTH,
+                    default=self.config_entry.options.get(
+                        CONF_UNDO_DEPTH, DEFAULT_UNDO_DEPTH
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=64)),
+                vol.Required(
+                    CONF_RAMP_TICK_RATE,
+                    default=self.config_entry.options.get(
+                        CONF_RAMP_TICK_RATE, DEFAULT_RAMP_TICK_RATE
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=1.0, max=50.0)),
+                vol.Required(
+                    CONF_METRICS,
+                    default=self.config_entry.options.get(
+                        CONF_METRICS, DEFAULT_METRICS
+                    ),
+                ): cv.boolean,
+            }),
+        )
+
     async def async_step_add_device(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -294,17 +351,37 @@ class DigitalStromVDCOptionsFlow(config_entries.OptionsFlow):
     async def async_step_template_select(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Select device template."""
-        from .const import DATA_TEMPLATE_MANAGER, DOMAIN
+        """Search and select device template.
+
+        Large vendor catalogs are shown one page at a time. Submitting a
+        changed search or page shows the matching page again.
+        """
+        from .const import DATA_TEMPLATE_MANAGER, DOMAIN, TEMPLATE_PAGE_SIZE
         
+        errors: dict[str, str] = {}
         if user_input is not None:
-            self._selected_template = user_input["template"]
-            return await self.async_step_template_configure()
+            query = user_input.get("query", "").strip()
+            page = user_input.get("page", self._template_page)
+            if query != self._template_query:
+                self._template_query = query
+                self._template_page = 1
+            elif page != self._template_page:
+                self._template_page = page
+            elif user_input.get("template"):
+                self._selected_template = user_input["template"]
+                return await self.async_step_template_configure()
+            else:
+                errors["base"] = "select_template"
 
-        # Get available templates
+        # Get one page of matching templates
         data = self.hass.data[DOMAIN][self.config_entry.entry_id]
         template_manager = data[DATA_TEMPLATE_MANAGER]
-        templates = template_manager.get_available_templates()
+        total, templates = template_manager.search_templates(
+            self._template_query,
+            offset=(self._template_page - 1) * TEMPLATE_PAGE_SIZE,
+            limit=TEMPLATE_PAGE_SIZE,
+        )
+        pages = max(1, -(-total // TEMPLATE_PAGE_SIZE))
         
         # Create selection dict with template names and descriptions
         template_choices = {
@@ -312,11 +389,24 @@ class DigitalStromVDCOptionsFlow(config_entries.OptionsFlow):
             for name, info in templates.items()
         }
 
+        schema_dict: dict[Any, Any] = {
+            vol.Optional("query", default=self._template_query): cv.string,
+            vol.Optional("page", default=self._template_page): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=pages)
+            ),
+        }
+        if template_choices:
+            schema_dict[vol.Optional("template")] = vol.In(template_choices)
+
         return self.async_show_form(
             step_id="template_select",
-            data_schema=vol.Schema({
-                vol.Required("template"): vol.In(template_choices),
-            }),
+            data_schema=vol.Schema(schema_dict),
+            errors=errors,
+            description_placeholders={
+                "count": str(total),
+                "page": str(self._template_page),
+                "pages": str(pages),
+            },
         )
 
     async def async_step_template_configure(
@@ -350,7 +440,7 @@ class DigitalStromVDCOptionsFlow(config_entries.OptionsFlow):
                 
                 return self.async_create_entry(
                     title="Device Created",
-                    data={},
+                    data=dict(self.config_entry.options),
                 )
             except Exception as err:
                 _LOGGER.error("Failed to create device: %s", err)
@@ -523,6 +613,10 @@ class DigitalStromVDCOptionsFlow(config_entries.OptionsFlow):
                 "min_value": user_input.get("min_value", 0.0),
                 "max_value": user_input.get("max_value", 100.0),
                 "unit": user_input.get("unit", ""),
+                "deadband": user_input.get("deadband", 0.0),
+                "relative_deadband": user_input.get("relative_deadband", 0.0),
+                "min_interval": user_input.get("min_interval", 0.0),
+                "max_age": user_input.get("max_age", 0.0),
             })
             
             # Bind to entity
@@ -545,6 +639,12 @@ class DigitalStromVDCOptionsFlow(config_entries.OptionsFlow):
                 vol.Optional("min_value", default=0.0): cv.small_float,
                 vol.Optional("max_value", default=100.0): cv.small_float,
                 vol.Optional("unit", default=""): cv.string,
+                vol.Optional("deadband", default=0.0): cv.positive_float,
+                vol.Optional("relative_deadband", default=0.0): vol.All(
+                    vol.Coerce(float), vol.Range(min=0.0, max=1.0)
+                ),
+                vol.Optional("min_interval", default=0.0): cv.positive_float,
+                vol.Optional("max_age", default=0.0): cv.positive_float,
                 vol.Required("entity_id"): selector.EntitySelector(
                     selector.EntitySelectorConfig(domain="sensor")
                 ),
@@ -639,7 +739,7 @@ class DigitalStromVDCOptionsFlow(config_entries.OptionsFlow):
             
             return self.async_create_entry(
                 title="Device Created",
-                data={},
+                data=dict(self.config_entry.options),
             )
         except Exception as err:
             _LOGGER.error("Failed to create device: %s", err)
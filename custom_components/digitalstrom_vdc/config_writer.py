@@ -0,0 +1,217 @@
+"""Write-behind persistence of the VDC configuration YAML."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from typing import Any
+
+import yaml
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import CONFIG_WRITE_DELAY, CONFIG_WRITE_MAX_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def write_atomic(path: str, content: bytes, backup: bool = True) -> None:
+    """Replace a file atomically, keeping the previous version as .bak.
+
+    Blocking, run in the executor. The content goes to a temp file in the same
+    directory, is fsynced and renamed over the target, so readers see either
+    the old or the new file and a crash never leaves a truncated one.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(content)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+
+        if backup and os.path.exists(path):
+            # A hard link keeps the old version without copying it
+            backup_path = f"{path}.bak"
+            if os.path.exists(backup_path):
+                os.unlink(backup_path)
+            try:
+                os.link(path, backup_path)
+            except OSError:
+                _LOGGER.debug("Cannot hard link %s, skipping backup", path)
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    # Make the rename itself durable
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+class ConfigWriter:
+    """Debounced, section-wise writer for vdc_config.yaml.
+
+    Each top level section (vdc_host, vdcs, vdsds) has a provider returning a
+    snapshot of its data. Changes only mark their section dirty. After a quiet
+    period the dirty sections are snapshotted on the event loop, dumped to
+    YAML in the executor and the file is replaced atomically. Clean sections
+    reuse their last dump. A continuous stream of changes still flushes after
+    CONFIG_WRITE_MAX_DELAY seconds.
+
+    pyvdcapi does not expose its own configuration serializer, so this is
+    the integration's copy of the configuration, kept per config entry next
+    to the device store rather than in pyvdcapi's persistence path.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: str,
+        quiet_period: float = CONFIG_WRITE_DELAY,
+        max_delay: float = CONFIG_WRITE_MAX_DELAY,
+    ) -> None:
+        """Initialize the writer."""
+        self.hass = hass
+        self.path = path
+        self.quiet_period = quiet_period
+        self.max_delay = max_delay
+        self._providers: dict[str, Callable[[], Any]] = {}
+        self._rendered: dict[str, str] = {}
+        self._dirty: set[str] = set()
+        self._first_dirty: float | None = None
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        self._lock = asyncio.Lock()
+        self._content_hash: bytes | None = None
+
+        self.flushes = 0
+        self.writes_skipped = 0
+        self.sections_dumped = 0
+        self.bytes_written = 0
+        self.last_flush_latency: float | None = None
+        self.max_flush_latency = 0.0
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Return writer metrics."""
+        return {
+            "flushes": self.flushes,
+            "writes_skipped": self.writes_skipped,
+            "sections_dumped": self.sections_dumped,
+            "bytes_written": self.bytes_written,
+            "last_flush_latency": self.last_flush_latency,
+            "max_flush_latency": self.max_flush_latency,
+            "dirty_sections": sorted(self._dirty),
+        }
+
+    @callback
+    def async_register_section(self, name: str, provider: Callable[[], Any]) -> None:
+        """Register a top level section and its snapshot provider."""
+        self._providers[name] = provider
+        self.async_mark_dirty(name)
+
+    @callback
+    def async_mark_dirty(self, name: str) -> None:
+        """Mark a section changed and (re)start the quiet period."""
+        now = time.monotonic()
+        self._dirty.add(name)
+        if self._first_dirty is None:
+            self._first_dirty = now
+        if self._unsub_flush:
+            self._unsub_flush()
+        delay = min(
+            self.quiet_period, max(0.0, self._first_dirty + self.max_delay - now)
+        )
+        self._unsub_flush = async_call_later(self.hass, delay, self._async_flush_later)
+
+    @callback
+    def _async_flush_later(self, _now: Any) -> None:
+        """Flush after the quiet period."""
+        self._unsub_flush = None
+        self.hass.async_create_task(self.async_flush())
+
+    async def async_flush(self, _event: Event | None = None) -> None:
+        """Write all dirty sections now."""
+        if self._unsub_flush:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+        async with self._lock:
+            if not self._dirty:
+                return
+            dirty = self._dirty
+            self._dirty = set()
+            self._first_dirty = None
+
+            # Snapshot on the loop, the providers read live objects
+            order = list(self._providers)
+            snapshots = {
+                name: self._providers[name]() for name in order if name in dirty
+            }
+
+            start = time.perf_counter()
+            try:
+                written = await self.hass.async_add_executor_job(
+                    self._write, order, snapshots
+                )
+            except (OSError, yaml.YAMLError) as err:
+                _LOGGER.error("Failed to write %s: %s", self.path, err)
+                # Retry with the next change or flush
+                self._dirty |= dirty
+                return
+            latency = time.perf_counter() - start
+
+        self.flushes += 1
+        self.sections_dumped += len(snapshots)
+        self.last_flush_latency = latency
+        self.max_flush_latency = max(self.max_flush_latency, latency)
+        if written:
+            self.bytes_written += written
+        else:
+            self.writes_skipped += 1
+        _LOGGER.debug(
+            "Flushed %d sections of %s in %.3f s (%d bytes)",
+            len(snapshots),
+            self.path,
+            latency,
+            written,
+        )
+
+    def _write(self, order: list[str], snapshots: dict[str, Any]) -> int:
+        """Dump the dirty sections and replace the file.
+
+        Runs in the executor. Returns the number of bytes written, 0 if the
+        content did not change.
+        """
+        for name, data in snapshots.items():
+            self._rendered[name] = yaml.safe_dump(
+                {name: data}, sort_keys=False, allow_unicode=True
+            )
+        content = "".join(
+            self._rendered[name] for name in order if name in self._rendered
+        ).encode("utf-8")
+
+        # Unchanged content is not rewritten, sparing the SD card
+        content_hash = hashlib.sha1(content).digest()
+        if content_hash == self._content_hash:
+            return 0
+        write_atomic(self.path, content)
+        self._content_hash = content_hash
+        return len(content)
@@ -0,0 +1,94 @@
+"""dSS connection supervision helpers for digitalSTROM VDC integration."""
+from __future__ import annotations
+
+import random
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Any
+
+from .const import (
+    CONNECTION_HISTORY,
+    PING_TIMEOUT_MAX,
+    PING_TIMEOUT_MIN,
+    RECONNECT_BASE_DELAY,
+    RECONNECT_MAX_DELAY,
+    RTT_BUCKETS_MS,
+    RTT_SAMPLES,
+)
+
+
+def backoff_delay(attempt: int) -> float:
+    """Return the delay before a reconnection attempt.
+
+    The delay doubles per attempt up to RECONNECT_MAX_DELAY and is drawn
+    from its upper half, so vDCs restarted together do not reconnect in step.
+    """
+    delay = min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2**attempt)
+    return random.uniform(delay / 2, delay)
+
+
+class ConnectionStats:
+    """State transitions and ping round trip times of the dSS connection."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.transitions: deque[dict[str, Any]] = deque(maxlen=CONNECTION_HISTORY)
+        self.reconnects = 0
+        self.reconnect_attempts = 0
+        self.pings = 0
+        self.pings_skipped = 0
+        self.ping_failures = 0
+        self.last_rtt: float | None = None
+        self._rtts: deque[float] = deque(maxlen=RTT_SAMPLES)
+        # One bucket per bound in RTT_BUCKETS_MS plus one for slower pings
+        self.histogram = [0] * (len(RTT_BUCKETS_MS) + 1)
+
+    def record_transition(self, old: str, new: str) -> None:
+        """Record a connection state change."""
+        self.transitions.append({"time": time.time(), "from": old, "to": new})
+
+    def record_rtt(self, seconds: float) -> None:
+        """Record the round trip time of a ping."""
+        rtt_ms = seconds * 1000
+        self.pings += 1
+        self.last_rtt = rtt_ms
+        self._rtts.append(rtt_ms)
+        self.histogram[bisect_left(RTT_BUCKETS_MS, rtt_ms)] += 1
+
+    def rtt_percentile(self, percentile: float) -> float | None:
+        """Return a percentile of the recent round trip times in ms."""
+        if not self._rtts:
+            return None
+        ordered = sorted(self._rtts)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))]
+
+    @property
+    def ping_timeout(self) -> float:
+        """Return a ping timeout in seconds derived from recent round trips."""
+        p95 = self.rtt_percentile(95)
+        if p95 is None:
+            return PING_TIMEOUT_MAX
+        return min(PING_TIMEOUT_MAX, max(PING_TIMEOUT_MIN, 4 * p95 / 1000))
+
+    @property
+    def rtt_histogram(self) -> dict[str, int]:
+        """Return the ping count per round trip bucket."""
+        labels = [f"le_{bound}ms" for bound in RTT_BUCKETS_MS]
+        labels.append(f"gt_{RTT_BUCKETS_MS[-1]}ms")
+        return dict(zip(labels, self.histogram, strict=True))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics."""
+        return {
+            "reconnects": self.reconnects,
+            "reconnect_attempts": self.reconnect_attempts,
+            "pings": self.pings,
+            "pings_skipped": self.pings_skipped,
+            "ping_failures": self.ping_failures,
+            "rtt_ms": self.last_rtt,
+            "rtt_p50_ms": self.rtt_percentile(50),
+            "rtt_p95_ms": self.rtt_percentile(95),
+            "rtt_histogram": self.rtt_histogram,
+            "transitions": list(self.transitions),
+        }
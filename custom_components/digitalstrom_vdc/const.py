@@ -10,12 +10,27 @@ CONF_VDC_NAME: Final = "vdc_name"
 CONF_DSUID: Final = "dsuid"
 CONF_SERVICE_NAME: Final = "service_name"
 CONF_ANNOUNCE_SERVICE: Final = "announce_service"
+CONF_REFRESH_WINDOW: Final = "refresh_window"
+CONF_PER_ENTITY_EVENTS: Final = "per_entity_events"
+CONF_ANNOUNCE_CONCURRENCY: Final = "announce_concurrency"
+CONF_ANNOUNCE_RATE: Final = "announce_rate"
+CONF_UNDO_DEPTH: Final = "undo_depth"
+CONF_RAMP_TICK_RATE: Final = "ramp_tick_rate"
+CONF_METRICS: Final = "metrics"
 
 # Defaults
 DEFAULT_PORT: Final = 8444
 DEFAULT_VDC_NAME: Final = "Home Assistant VDC"
 DEFAULT_SERVICE_NAME: Final = "ha-vdc"
 DEFAULT_ANNOUNCE_SERVICE: Final = True
+DEFAULT_REFRESH_WINDOW: Final = 0.25  # seconds
+DEFAULT_PER_ENTITY_EVENTS: Final = True
+DEFAULT_ANNOUNCE_CONCURRENCY: Final = 8
+DEFAULT_ANNOUNCE_RATE: Final = 100.0  # announcements per second
+DEFAULT_UNDO_DEPTH: Final = 5  # scene snapshots per device
+DEFAULT_RAMP_TICK_RATE: Final = 20.0  # ramp updates per second
+DEFAULT_DIM_RATE: Final = 25.0  # channel units per second
+DEFAULT_METRICS: Final = True
 
 # Connection states
 STATE_DISCONNECTED: Final = "disconnected"
@@ -23,6 +38,20 @@ STATE_CONNECTING: Final = "connecting"
 STATE_CONNECTED: Final = "connected"
 STATE_ACTIVE: Final = "active"
 
+# Connection supervision
+KEEPALIVE_INTERVAL: Final = 30.0  # seconds without traffic before a ping
+RECONNECT_BASE_DELAY: Final = 1.0  # seconds, doubled per failed attempt
+RECONNECT_MAX_DELAY: Final = 300.0  # seconds
+PING_TIMEOUT_MIN: Final = 2.0  # seconds
+PING_TIMEOUT_MAX: Final = 10.0  # seconds
+RTT_SAMPLES: Final = 100
+RTT_BUCKETS_MS: Final = (5, 10, 25, 50, 100, 250, 500, 1000)
+CONNECTION_HISTORY: Final = 20  # state transitions kept
+
+# Metrics
+LATENCY_BUCKETS_MS: Final = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+EVENT_BATCH_BUCKETS: Final = (1, 2, 5, 10, 25, 50, 100)
+
 # Device creation methods
 DEVICE_METHOD_TEMPLATE: Final = "template"
 DEVICE_METHOD_MANUAL: Final = "manual"
@@ -34,18 +63,35 @@ BINDING_TYPE_SENSOR: Final = "sensor"
 BINDING_TYPE_BINARY_INPUT: Final = "binary_input"
 
 # Update intervals
-SCAN_INTERVAL: Final = 30  # seconds
+# State changes are pushed; polling is only a low-frequency consistency sweep
+SCAN_INTERVAL: Final = 300  # seconds
 
 # Service names
 SERVICE_ANNOUNCE_DEVICE: Final = "announce_device"
 SERVICE_CALL_SCENE: Final = "call_scene"
 SERVICE_SAVE_SCENE: Final = "save_scene"
 SERVICE_REFRESH_TEMPLATES: Final = "refresh_templates"
+SERVICE_BULK_CREATE_DEVICES: Final = "bulk_create_devices"
+SERVICE_SEARCH_TEMPLATES: Final = "search_templates"
+
+# Events
+EVENT_BATCH_UPDATE: Final = f"{DOMAIN}_batch_update"
 
 # Attributes
 ATTR_DEVICE_ID: Final = "device_id"
 ATTR_SCENE_NUMBER: Final = "scene_number"
 ATTR_FORCE: Final = "force"
+ATTR_CONFIG_ENTRY_ID: Final = "config_entry_id"
+ATTR_DEVICES: Final = "devices"
+ATTR_ANNOUNCE: Final = "announce"
+ATTR_MAX_PARALLEL: Final = "max_parallel"
+ATTR_AREA_ID: Final = "area_id"
+ATTR_LABEL_ID: Final = "label_id"
+ATTR_RATE: Final = "rate"
+ATTR_QUERY: Final = "query"
+ATTR_TEMPLATE_TYPE: Final = "template_type"
+ATTR_OFFSET: Final = "offset"
+ATTR_LIMIT: Final = "limit"
 
 # Platforms
 PLATFORMS: Final = [
@@ -82,10 +128,13 @@ STEP_ADD_INPUTS: Final = "add_inputs"
 STEP_ADD_OUTPUT: Final = "add_output"
 STEP_ADD_CHANNEL: Final = "add_channel"
 STEP_FINALIZE_DEVICE: Final = "finalize_device"
+STEP_SETTINGS: Final = "settings"
 
 # Device template types
 TEMPLATE_TYPE_DEVICE: Final = "deviceType"
 TEMPLATE_TYPE_VENDOR: Final = "vendorType"
+BLUEPRINT_CACHE_SIZE: Final = 64  # compiled templates kept in memory
+TEMPLATE_PAGE_SIZE: Final = 25  # templates per search page
 
 # Data keys
 DATA_VDC_MANAGER: Final = "vdc_manager"
@@ -93,3 +142,35 @@ DATA_COORDINATOR: Final = "coordinator"
 DATA_DEVICE_MANAGER: Final = "device_manager"
 DATA_TEMPLATE_MANAGER: Final = "template_manager"
 DATA_BINDINGS: Final = "bindings"
+DATA_METRICS: Final = "metrics"
+DATA_CONFIG_WRITER: Final = "config_writer"
+
+# Shared data keys (stored under hass.data[DOMAIN][DOMAIN])
+DATA_RAMP_ENGINE: Final = "ramp_engine"
+
+# Storage
+STORAGE_VERSION: Final = 1
+STORAGE_KEY_DEVICES: Final = f"{DOMAIN}.devices"
+STORAGE_KEY_TEMPLATE_INDEX: Final = f"{DOMAIN}.template_index"
+DEVICE_STORE_SAVE_DELAY: Final = 1  # seconds
+
+# VDC configuration file (written behind, see config_writer.py)
+VDC_CONFIG_FILE: Final = "vdc_config.yaml"
+CONFIG_WRITE_DELAY: Final = 2.0  # seconds of quiet before a flush
+CONFIG_WRITE_MAX_DELAY: Final = 30.0  # seconds a flush may be postponed
+
+# Multi-target scene services
+SCENE_MAX_PARALLEL: Final = 32
+
+# Dimming and transitions
+RAMP_MIN_STEP: Final = 0.1  # smallest channel change worth a write
+
+# Bulk provisioning
+BULK_MAX_PARALLEL: Final = 16
+BULK_ANNOUNCE_BATCH_SIZE: Final = 25
+
+# Device announcement
+ANNOUNCE_TIMEOUT: Final = 10.0  # seconds
+ANNOUNCE_MAX_RETRIES: Final = 3
+ANNOUNCE_RETRY_DELAY: Final = 0.5  # seconds, doubled per retry
+DATA_RESOLVER: Final = "resolver"
@@ -1,22 +1,35 @@
 """Data update coordinator for digitalSTROM VDC integration."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
 from datetime import timedelta
 import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, SCAN_INTERVAL
+from .const import CONF_REFRESH_WINDOW, DEFAULT_REFRESH_WINDOW, DOMAIN, SCAN_INTERVAL
 from .vdc_manager import VDCHostManager
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class DigitalStromVDCCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Class to manage fetching digitalSTROM VDC data."""
+    """Push hub for digitalSTROM VDC entity updates.
+
+    State changes are pushed per device: VDC callbacks mark a device dirty and
+    only entities registered with that device's dsUID as listener context are
+    updated. The periodic refresh is a low-frequency consistency sweep that
+    updates every entity.
+
+    Entity commands request refreshes through async_schedule_device_refresh,
+    which coalesces all requests inside the refresh window into one update of
+    the affected devices.
+    """
 
     def __init__(self, hass: HomeAssistant, vdc_manager: VDCHostManager, config_entry: ConfigEntry | None = None) -> None:
         """Initialize the coordinator."""
@@ -28,15 +41,123 @@ class DigitalStromVDCCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             config_entry=config_entry,
         )
         self.vdc_manager = vdc_manager
+        self._dirty_devices: set[str] = set()
+        # Update callbacks by the dsUID they were registered with as context
+        self._device_callbacks: dict[str, list[CALLBACK_TYPE]] = {}
+        self._flush_handle: asyncio.Handle | None = None
+        self._unsub_vdc_updates = vdc_manager.async_add_device_listener(
+            self.async_mark_device_dirty
+        )
+
+        # Refresh scheduler for entity commands
+        self._refresh_devices: set[str] = set()
+        self._unsub_command_refresh: CALLBACK_TYPE | None = None
+        self._pending_refresh_requests = 0
+        self.refresh_requests = 0
+        self.refreshes_run = 0
+        self.refreshes_saved = 0
+
+    @property
+    def refresh_window(self) -> float:
+        """Return the window in seconds in which refresh requests coalesce."""
+        if self.config_entry is None:
+            return DEFAULT_REFRESH_WINDOW
+        return self.config_entry.options.get(CONF_REFRESH_WINDOW, DEFAULT_REFRESH_WINDOW)
+
+    @property
+    def refresh_stats(self) -> dict[str, int]:
+        """Return refresh scheduler counters."""
+        return {
+            "requested": self.refresh_requests,
+            "run": self.refreshes_run,
+            "saved": self.refreshes_saved,
+        }
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, and for pushes to the device in context."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        if context is None:
+            return remove_listener
+        self._device_callbacks.setdefault(context, []).append(update_callback)
+
+        @callback
+        def remove_device_listener() -> None:
+            remove_listener()
+            callbacks = self._device_callbacks.get(context)
+            if callbacks and update_callback in callbacks:
+                callbacks.remove(update_callback)
+                if not callbacks:
+                    del self._device_callbacks[context]
+
+        return remove_device_listener
+
+    @callback
+    def async_schedule_device_refresh(self, dsuid: str) -> None:
+        """Request a refresh of a device's entities after a command."""
+        self.refresh_requests += 1
+        self._pending_refresh_requests += 1
+        self._refresh_devices.add(dsuid)
+        if self._unsub_command_refresh is None:
+            self._unsub_command_refresh = async_call_later(
+                self.hass, self.refresh_window, self._async_run_scheduled_refresh
+            )
+
+    @callback
+    def _async_run_scheduled_refresh(self, _now: Any) -> None:
+        """Update the entities of all devices commanded during the window."""
+        self._unsub_command_refresh = None
+        self.refreshes_run += 1
+        # Every request beyond the first in this window was a refresh saved
+        self.refreshes_saved += self._pending_refresh_requests - 1
+        self._pending_refresh_requests = 0
+        self._dirty_devices.update(self._refresh_devices)
+        self._refresh_devices.clear()
+        self._async_flush_dirty()
+
+    @callback
+    def async_mark_device_dirty(self, dsuid: str) -> None:
+        """Mark a device as changed; its entities update on the next loop pass."""
+        self._dirty_devices.add(dsuid)
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_soon(self._async_flush_dirty)
+
+    @callback
+    def _async_flush_dirty(self) -> None:
+        """Update the entities of all devices marked dirty."""
+        self._flush_handle = None
+        if not self._dirty_devices:
+            return
+        dirty = self._dirty_devices
+        self._dirty_devices = set()
+
+        for dsuid in dirty:
+            for update_callback in list(self._device_callbacks.get(dsuid, ())):
+                update_callback()
+
+    async def async_shutdown(self) -> None:
+        """Stop push updates and shut down the coordinator."""
+        if self._unsub_vdc_updates:
+            self._unsub_vdc_updates()
+            self._unsub_vdc_updates = None
+        if self._unsub_command_refresh:
+            self._unsub_command_refresh()
+            self._unsub_command_refresh = None
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        await super().async_shutdown()
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from VDC."""
+        """Run the consistency sweep."""
         try:
-            # Query device states and return updated data
-            # This will be expanded when devices are implemented
+            # Device state lives on the VdSD components and is read by the
+            # entities directly; the sweep only refreshes connection state.
+            self._dirty_devices.clear()
             return {
                 "connection_state": self.vdc_manager.connection_state,
-                "devices": {},  # Will be populated with actual device data
             }
         except Exception as err:
             _LOGGER.error("Error updating VDC data: %s", err)
@@ -14,8 +14,11 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .channel_batch import async_apply_channel_values
 from .const import DATA_COORDINATOR, DATA_DEVICE_MANAGER, DOMAIN
 from .coordinator import DigitalStromVDCCoordinator
+from .device_manager import DeviceManager
+from .role_index import ROLE_POSITION
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,13 +39,14 @@ async def async_setup_entry(
         # Check if device is in blind group (DSGroup.BLIND)
         # DSGroup.BLIND = 4 in digitalSTROM
         if hasattr(device, 'primary_group') and device.primary_group == 4:
-            entities.append(DigitalStromVDCCover(coordinator, device))
+            entities.append(DigitalStromVDCCover(coordinator, device, device_manager))
         # Also check for devices with shade/blind capabilities
         elif hasattr(device, 'output') and device.output:
             # Check if device has position control (typical for covers)
-            if any(hasattr(ch, 'channel_type') and 'position' in ch.channel_type.lower() 
-                   for ch in device.output.channels):
-                entities.append(DigitalStromVDCCover(coordinator, device))
+            if device_manager.get_role_index(device).has_channel(ROLE_POSITION):
+                entities.append(
+                    DigitalStromVDCCover(coordinator, device, device_manager)
+                )
 
     async_add_entities(entities)
 
@@ -61,22 +65,32 @@ class DigitalStromVDCCover(CoordinatorEntity, CoverEntity):
         self,
         coordinator: DigitalStromVDCCoordinator,
         vdc_device: Any,
+        device_manager: DeviceManager,
     ) -> None:
         """Initialize the cover."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=vdc_device.dSUID)
         self._vdc_device = vdc_device
+        self._device_manager = device_manager
         self._attr_unique_id = vdc_device.dSUID
         self._attr_name = vdc_device.name
 
+    def _position_channel(self) -> Any | None:
+        """Return the position channel, falling back to the first channel."""
+        roles = self._device_manager.get_role_index(self._vdc_device)
+        position_channel = roles.channel(ROLE_POSITION)
+        if position_channel is None:
+            return roles.primary_channel
+        return position_channel
+
     @property
     def current_cover_position(self) -> int | None:
         """Return current position of cover (0 closed, 100 open)."""
         if not self._vdc_device.output or not self._vdc_device.output.channels:
             return None
             
-        # Get position from first output channel
-        primary_channel = self._vdc_device.output.channels[0]
-        return int(primary_channel.value)
+        # Get position from the position channel
+        position_channel = self._position_channel()
+        return int(position_channel.value)
 
     @property
     def is_closed(self) -> bool | None:
@@ -95,10 +109,12 @@ class DigitalStromVDCCover(CoordinatorEntity, CoverEntity):
             return
         
         # Set position to 100 (fully open)
-        primary_channel = self._vdc_device.output.channels[0]
-        await primary_channel.set_value(100.0)
+        position_channel = self._position_channel()
+        await async_apply_channel_values(
+            self._vdc_device.output, [(position_channel, 100.0)]
+        )
         
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_schedule_device_refresh(self._vdc_device.dSUID)
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close the cover."""
@@ -109,10 +125,12 @@ class DigitalStromVDCCover(CoordinatorEntity, CoverEntity):
             return
         
         # Set position to 0 (fully closed)
-        primary_channel = self._vdc_device.output.channels[0]
-        await primary_channel.set_value(0.0)
+        position_channel = self._position_channel()
+        await async_apply_channel_values(
+            self._vdc_device.output, [(position_channel, 0.0)]
+        )
         
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_schedule_device_refresh(self._vdc_device.dSUID)
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop the cover."""
@@ -120,7 +138,7 @@ class DigitalStromVDCCover(CoordinatorEntity, CoverEntity):
         
         # Stop command - keep current position
         
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_schedule_device_refresh(self._vdc_device.dSUID)
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         """Move the cover to a specific position."""
@@ -132,10 +150,12 @@ class DigitalStromVDCCover(CoordinatorEntity, CoverEntity):
             return
         
         # Set position value (0-100)
-        primary_channel = self._vdc_device.output.channels[0]
-        await primary_channel.set_value(float(position))
+        position_channel = self._position_channel()
+        await async_apply_channel_values(
+            self._vdc_device.output, [(position_channel, float(position))]
+        )
         
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_schedule_device_refresh(self._vdc_device.dSUID)
 
     @property
     def device_info(self) -> dict[str, Any]:
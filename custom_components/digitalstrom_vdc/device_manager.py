@@ -1,28 +1,438 @@
 """Device manager for digitalSTROM VDC integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import Any
 
 from pyvdcapi.entities.vdc import Vdc
 from pyvdcapi.entities.vdsd import VdSD
 
+import voluptuous as vol
+
 from homeassistant.core import HomeAssistant
 
-from .errors import DeviceAnnounceFailed, TemplateNotFound
+from .announcer import AnnouncementScheduler
+from .channel_batch import async_apply_channel_values
+from .config_writer import ConfigWriter
+from .const import BULK_ANNOUNCE_BATCH_SIZE, BULK_MAX_PARALLEL, DEFAULT_UNDO_DEPTH
+from .device_store import KIND_MANUAL, KIND_TEMPLATE, DeviceStore
+from .entity_binding import SensorFilter
+from .errors import DeviceAnnounceFailed, InvalidTemplate, TemplateNotFound
+from .resolver import async_get_resolver
+from .role_index import DeviceRoleIndex
+from .scene_table import SceneTable
+from .template_manager import TemplateManager
+from .undo_history import UndoHistory
 
 _LOGGER = logging.getLogger(__name__)
 
+_BINDINGS_SCHEMA = vol.Schema({str: str})
+
+TEMPLATE_SPEC_SCHEMA = vol.Schema(
+    {
+        vol.Required("kind"): KIND_TEMPLATE,
+        vol.Required("template_name"): str,
+        vol.Required("instance_name"): str,
+        vol.Optional("parameters", default=dict): dict,
+        vol.Optional("entity_bindings", default=dict): _BINDINGS_SCHEMA,
+    }
+)
+
+MANUAL_SPEC_SCHEMA = vol.Schema(
+    {
+        vol.Required("kind"): KIND_MANUAL,
+        vol.Required("device_config"): vol.Schema(
+            {vol.Required("name"): str}, extra=vol.ALLOW_EXTRA
+        ),
+        vol.Optional("inputs", default=list): [
+            vol.Schema(
+                {vol.Required("type"): vol.In(["button", "binary_input", "sensor"])},
+                extra=vol.ALLOW_EXTRA,
+            )
+        ],
+        vol.Optional("outputs", default=list): [dict],
+        vol.Optional("entity_bindings", default=dict): _BINDINGS_SCHEMA,
+    }
+)
+
+
+def validate_device_spec(spec: Any) -> dict[str, Any]:
+    """Validate a template or manual device spec."""
+    if not isinstance(spec, dict):
+        raise vol.Invalid("device spec must be a mapping")
+    if spec.get("kind") == KIND_TEMPLATE:
+        return TEMPLATE_SPEC_SCHEMA(spec)
+    if spec.get("kind") == KIND_MANUAL:
+        return MANUAL_SPEC_SCHEMA(spec)
+    raise vol.Invalid(f"kind must be {KIND_TEMPLATE!r} or {KIND_MANUAL!r}")
+
 
 class DeviceManager:
     """Manage VDC device creation and lifecycle."""
 
-    def __init__(self, vdc: Vdc, hass: HomeAssistant) -> None:
+    def __init__(
+        self,
+        vdc: Vdc,
+        hass: HomeAssistant,
+        device_store: DeviceStore | None = None,
+        config_writer: ConfigWriter | None = None,
+        announcer: AnnouncementScheduler | None = None,
+        undo_depth: int = DEFAULT_UNDO_DEPTH,
+        template_manager: TemplateManager | None = None,
+    ) -> None:
         """Initialize device manager."""
         self.vdc = vdc
         self.hass = hass
         self._devices: dict[str, VdSD] = {}
+        self._role_indexes: dict[str, DeviceRoleIndex] = {}
         self._entity_bindings: dict[str, Any] = {}
+        self._device_store = device_store
+        self._config_writer = config_writer
+        self._announcer = announcer
+        self._template_manager = template_manager
+        self._scene_tables: dict[str, SceneTable] = {}
+        self._undo_histories: dict[str, UndoHistory] = {}
+        self.undo_depth = undo_depth
+        self._restoring = False
+        self.restore_stats: dict[str, Any] = {}
+
+    async def async_restore_devices(self) -> int:
+        """Recreate all stored devices and their bindings in one pass."""
+        if self._device_store is None:
+            return 0
+
+        start = time.perf_counter()
+        specs = await self._device_store.async_load()
+        restored: dict[str, dict[str, Any]] = {}
+        renamed: dict[str, str] = {}
+        failed = 0
+
+        self._restoring = True
+        try:
+            for spec in specs:
+                try:
+                    device = await self._async_create_from_spec(spec)
+                except DeviceAnnounceFailed:
+                    _LOGGER.error("Failed to restore device %s", spec["dsuid"])
+                    # Keep the spec so the device is not lost for good
+                    restored[spec["dsuid"]] = spec
+                    failed += 1
+                    continue
+                restored[device.dSUID] = spec
+                if device.dSUID != spec["dsuid"]:
+                    renamed[spec["dsuid"]] = device.dSUID
+                if (scenes := self._device_store.scenes(spec["dsuid"])) is not None:
+                    self._scene_tables[device.dSUID] = SceneTable.from_dict(scenes)
+        finally:
+            self._restoring = False
+
+        # pyvdcapi may assign new dsUIDs, re-key the store if it did
+        if renamed:
+            self._device_store.async_replace(restored, renamed)
+            self._mark_config_dirty()
+
+        self.restore_stats = {
+            "devices": len(specs) - failed,
+            "failed": failed,
+            "load_seconds": self._device_store.load_time,
+            "restore_seconds": time.perf_counter() - start,
+        }
+        _LOGGER.info(
+            "Restored %d devices in %.3f s",
+            self.restore_stats["devices"],
+            self.restore_stats["restore_seconds"],
+        )
+        return self.restore_stats["devices"]
+
+    async def async_create_devices_bulk(
+        self,
+        specs: list[dict[str, Any]],
+        announce: bool = True,
+        max_parallel: int = BULK_MAX_PARALLEL,
+        announce_batch_size: int = BULK_ANNOUNCE_BATCH_SIZE,
+    ) -> dict[str, Any]:
+        """Create many devices and return a per-item report.
+
+        All specs are validated first, template specs also against their
+        blueprint, so unknown templates and bad parameters are found before
+        anything is created; if any is invalid nothing is created. Devices
+        and their bindings are created with bounded parallelism, then
+        announced to the dSS in batches.
+        """
+        start = time.perf_counter()
+        items: list[dict[str, Any]] = []
+        validated: list[dict[str, Any] | None] = []
+        for index, spec in enumerate(specs):
+            item: dict[str, Any] = {"index": index, "name": _spec_name(spec)}
+            try:
+                valid_spec = validate_device_spec(spec)
+                await self._async_check_template_spec(valid_spec)
+            except vol.Invalid as err:
+                validated.append(None)
+                item["status"] = "invalid"
+                item["error"] = str(err)
+            else:
+                validated.append(valid_spec)
+                item["status"] = "pending"
+            items.append(item)
+
+        if any(item["status"] == "invalid" for item in items):
+            for item in items:
+                if item["status"] == "pending":
+                    item["status"] = "skipped"
+            return _bulk_report(items, start)
+
+        semaphore = asyncio.Semaphore(max_parallel)
+        created: list[tuple[dict[str, Any], VdSD]] = []
+
+        async def create(item: dict[str, Any], spec: dict[str, Any]) -> None:
+            async with semaphore:
+                try:
+                    device = await self._async_create_from_spec(spec)
+                except DeviceAnnounceFailed as err:
+                    item["status"] = "failed"
+                    item["error"] = str(err.__cause__ or err)
+                    return
+            item["status"] = "created"
+            item["dsuid"] = device.dSUID
+            created.append((item, device))
+
+        await asyncio.gather(
+            *(create(item, spec) for item, spec in zip(items, validated, strict=True))
+        )
+
+        if announce:
+            results = await self._async_announce_devices(
+                [device for _item, device in created], announce_batch_size
+            )
+            for (item, _device), success in zip(created, results, strict=True):
+                item["announced"] = success
+                if not success:
+                    item["error"] = "announce failed"
+
+        report = _bulk_report(items, start)
+        _LOGGER.info(
+            "Bulk created %d of %d devices in %.2f s",
+            report["created"],
+            len(items),
+            report["seconds"],
+        )
+        return report
+
+    async def async_call_scene(self, device: VdSD, scene: int) -> None:
+        """Call a digitalSTROM scene on a device.
+
+        Scenes whose table entry is verified are recalled locally: their
+        channel values are pushed in one batched write and the device is not
+        called. A saved scene is verified once the device applied exactly
+        those values on its own, so every other scene still goes to the
+        device. A dontCare or locally prioritized scene never verifies, since
+        the device leaves the outputs alone. If the device ends up with other
+        values the table entry is stale and dropped. The channel values
+        before the call are kept for undo.
+        """
+        channels = device.output.channels if device.output else None
+        table = self._scene_tables.get(device.dSUID)
+        values = table.get(scene) if table and channels else None
+        if values is not None and len(values) != len(channels):
+            values = None
+        verified = values is not None and table.is_verified(scene)
+
+        self._push_undo_snapshot(device)
+        try:
+            if verified:
+                await async_apply_channel_values(
+                    device.output, list(zip(channels, values, strict=True))
+                )
+            else:
+                await device.call_scene(scene)
+        except Exception:
+            self._pop_undo_snapshot(device)
+            raise
+
+        if values is None or verified:
+            return
+        current = self._channel_values(device)
+        if current and table.matches(scene, current):
+            table.verify(scene)
+        else:
+            table.discard(scene)
+        if self._device_store is not None:
+            self._device_store.async_set_scenes(device.dSUID, table.as_dict())
+
+    async def async_set_local_priority(self, device: VdSD, scene: int) -> None:
+        """Give a scene local priority on a device.
+
+        Scene calls may now be ignored by the device, so the saved scenes
+        have to be verified again before they are pushed from the table.
+        """
+        await device.set_local_prio(scene)
+        table = self._scene_tables.get(device.dSUID)
+        if (
+            table is not None
+            and table.unverify_all()
+            and self._device_store is not None
+        ):
+            self._device_store.async_set_scenes(device.dSUID, table.as_dict())
+
+    async def async_save_scene(self, device: VdSD, scene: int) -> None:
+        """Save the current device state as a scene."""
+        await device.save_scene(scene)
+
+        channels = device.output.channels if device.output else None
+        if not channels:
+            return
+        table = self._scene_tables.get(device.dSUID)
+        if table is None or table.channel_count != len(channels):
+            table = self._scene_tables[device.dSUID] = SceneTable(len(channels))
+        table.save(scene, [float(channel.value or 0.0) for channel in channels])
+        if self._device_store is not None:
+            self._device_store.async_set_scenes(device.dSUID, table.as_dict())
+
+    @property
+    def scene_stats(self) -> dict[str, int]:
+        """Return local scene table statistics."""
+        tables = self._scene_tables.values()
+        return {
+            "tables": len(self._scene_tables),
+            "hits": sum(table.hits for table in tables),
+            "misses": sum(table.misses for table in tables),
+            "memory_bytes": sum(table.memory_bytes for table in tables),
+        }
+
+    async def async_undo_scene(self, device: VdSD) -> None:
+        """Restore the channel values from before the last scene call."""
+        snapshot = self._pop_undo_snapshot(device)
+        channels = device.output.channels if device.output else None
+        if snapshot is None or not channels or len(snapshot) != len(channels):
+            await device.undo_scene()
+            return
+        await async_apply_channel_values(
+            device.output, list(zip(channels, snapshot, strict=True))
+        )
+
+    async def async_call_min_scene(self, device: VdSD, scene: int) -> None:
+        """Call a scene only if the device is below its minimum."""
+        before = self._push_undo_snapshot(device)
+        try:
+            await device.call_min_scene(scene)
+        except Exception:
+            self._pop_undo_snapshot(device)
+            raise
+        # Nothing to undo if the device was not below its minimum
+        if before is not None and before == self._channel_values(device):
+            self._pop_undo_snapshot(device)
+
+    @staticmethod
+    def _channel_values(device: VdSD) -> list[float] | None:
+        """Return the current channel values of a device."""
+        if not device.output or not device.output.channels:
+            return None
+        return [float(channel.value or 0.0) for channel in device.output.channels]
+
+    def _push_undo_snapshot(self, device: VdSD) -> list[float] | None:
+        """Keep the current channel values for undo and return them."""
+        values = self._channel_values(device)
+        if values is None or self.undo_depth <= 0:
+            return None
+        history = self._undo_histories.get(device.dSUID)
+        if history is None or history.channel_count != len(values):
+            history = UndoHistory(self.undo_depth, len(values))
+            self._undo_histories[device.dSUID] = history
+        history.push(values)
+        return values
+
+    def _pop_undo_snapshot(self, device: VdSD) -> list[float] | None:
+        """Remove and return the most recent undo snapshot."""
+        history = self._undo_histories.get(device.dSUID)
+        return history.pop() if history is not None else None
+
+    def undo_memory_report(self) -> dict[str, dict[str, int]]:
+        """Return undo history size and memory use per device."""
+        return {
+            dsuid: {
+                "snapshots": len(history),
+                "depth": history.depth,
+                "memory_bytes": history.memory_bytes,
+            }
+            for dsuid, history in self._undo_histories.items()
+        }
+
+    async def async_announce_device(self, device: VdSD, force: bool = False) -> bool:
+        """Announce a device to the dSS unless it is announced unchanged."""
+        if self._announcer is not None:
+            return await self._announcer.async_queue(device, force)
+        await device.announce()
+        return True
+
+    async def _async_announce_devices(
+        self, devices: list[VdSD], batch_size: int
+    ) -> list[bool]:
+        """Announce devices through the scheduler, or in plain batches."""
+        if self._announcer is not None:
+            return await self._announcer.async_announce_many(devices)
+
+        results: list[bool] = []
+        for batch_start in range(0, len(devices), batch_size):
+            batch = devices[batch_start : batch_start + batch_size]
+            outcomes = await asyncio.gather(
+                *(device.announce() for device in batch), return_exceptions=True
+            )
+            results.extend(not isinstance(outcome, Exception) for outcome in outcomes)
+        return results
+
+    async def _async_check_template_spec(self, spec: dict[str, Any]) -> None:
+        """Instantiate the blueprint of a template spec, raise vol.Invalid if not."""
+        if spec["kind"] != KIND_TEMPLATE or self._template_manager is None:
+            return
+        template_name = spec["template_name"]
+        try:
+            blueprint = await self._template_manager.async_get_blueprint(
+                template_name
+            )
+        except InvalidTemplate as err:
+            raise vol.Invalid(f"template {template_name}: {err}") from err
+        if blueprint is None:
+            raise vol.Invalid(f"unknown template {template_name!r}")
+        blueprint.instantiate(spec.get("parameters", {}))
+
+    async def _async_create_from_spec(self, spec: dict[str, Any]) -> VdSD:
+        """Create a device from a stored spec."""
+        if spec["kind"] == KIND_TEMPLATE:
+            return await self.create_device_from_template(
+                template_name=spec["template_name"],
+                instance_name=spec["instance_name"],
+                parameters=spec.get("parameters", {}),
+                entity_bindings=spec.get("entity_bindings", {}),
+            )
+        return await self.create_device_manual(
+            device_config=spec["device_config"],
+            inputs=spec.get("inputs", []),
+            outputs=spec.get("outputs", []),
+            entity_bindings=spec.get("entity_bindings", {}),
+        )
+
+    def _store_device(self, device: VdSD, spec: dict[str, Any]) -> None:
+        """Record how a device was created so it can be restored."""
+        if self._device_store is not None and not self._restoring:
+            self._device_store.async_set(device.dSUID, spec)
+        self._mark_config_dirty()
+
+    def _mark_config_dirty(self) -> None:
+        """Schedule a write of the vdsds section of vdc_config.yaml."""
+        if self._config_writer is not None:
+            self._config_writer.async_mark_dirty("vdsds")
+
+    def vdsds_snapshot(self) -> list[dict[str, Any]]:
+        """Return the vdsds section of vdc_config.yaml."""
+        if self._device_store is not None:
+            return self._device_store.specs
+        return [
+            {"dsuid": dsuid, "name": getattr(device, "name", None)}
+            for dsuid, device in self._devices.items()
+        ]
 
     async def create_device_from_template(
         self,
@@ -31,23 +441,50 @@ class DeviceManager:
         parameters: dict[str, Any],
         entity_bindings: dict[str, str],
     ) -> VdSD:
-        """Create device from template."""
+        """Create device from template.
+
+        With a template manager the template's compiled blueprint validates
+        the parameters and maps binding names such as brightness onto
+        component ids before pyvdcapi builds the device.
+        """
         _LOGGER.info("Creating device from template: %s", template_name)
         
         try:
+            component_bindings = entity_bindings
+            vdsd_parameters = parameters
+            if self._template_manager is not None:
+                blueprint = await self._template_manager.async_get_blueprint(
+                    template_name
+                )
+                # pyvdcapi may know templates the catalog does not list
+                if blueprint is not None:
+                    vdsd_parameters = blueprint.instantiate(parameters)
+                    component_bindings = blueprint.component_bindings(
+                        entity_bindings
+                    )
+
             # Create device from template using pyvdcapi
             device = self.vdc.create_vdsd_from_template(
                 template_name=template_name,
                 instance_name=instance_name,
-                **parameters
+                **vdsd_parameters
             )
             
             # Set up entity bindings
-            for component_id, entity_id in entity_bindings.items():
+            for component_id, entity_id in component_bindings.items():
                 await self.setup_entity_binding(device, component_id, entity_id)
             
-            # Store device
-            self._devices[device.dSUID] = device
+            self._add_device(device)
+            self._store_device(
+                device,
+                {
+                    "kind": KIND_TEMPLATE,
+                    "template_name": template_name,
+                    "instance_name": instance_name,
+                    "parameters": parameters,
+                    "entity_bindings": entity_bindings,
+                },
+            )
             
             _LOGGER.info("Device created successfully: %s", instance_name)
             return device
@@ -77,16 +514,38 @@ class DeviceManager:
             for input_config in inputs:
                 await self._add_input_to_device(device, input_config)
             
+            # Deadband/rate limit settings of sensor inputs, keyed like the
+            # component ids the options flow assigns ("sensor_<input number>")
+            sensor_filters = {
+                f"sensor_{number}": SensorFilter.from_config(input_config)
+                for number, input_config in enumerate(inputs, start=1)
+                if input_config["type"] == "sensor"
+            }
+            
             # Add outputs
             for output_config in outputs:
                 await self._add_output_to_device(device, output_config)
             
             # Set up entity bindings
             for component_id, entity_id in entity_bindings.items():
-                await self.setup_entity_binding(device, component_id, entity_id)
+                await self.setup_entity_binding(
+                    device,
+                    component_id,
+                    entity_id,
+                    sensor_filter=sensor_filters.get(component_id),
+                )
             
-            # Store device
-            self._devices[device.dSUID] = device
+            self._add_device(device)
+            self._store_device(
+                device,
+                {
+                    "kind": KIND_MANUAL,
+                    "device_config": device_config,
+                    "inputs": inputs,
+                    "outputs": outputs,
+                    "entity_bindings": entity_bindings,
+                },
+            )
             
             _LOGGER.info("Device created successfully: %s", device_config["name"])
             return device
@@ -100,6 +559,7 @@ class DeviceManager:
     ) -> None:
         """Add input component to device."""
         input_type = input_config["type"]
+        self.invalidate_role_index(device)
         
         if input_type == "button":
             device.add_button_input(
@@ -123,6 +583,8 @@ class DeviceManager:
         self, device: VdSD, output_config: dict[str, Any]
     ) -> None:
         """Add output component to device."""
+        self.invalidate_role_index(device)
+        
         # Create output container if it doesn't exist
         output = device.create_output()
         
@@ -140,6 +602,7 @@ class DeviceManager:
         device: VdSD,
         component_id: str,
         entity_id: str,
+        sensor_filter: SensorFilter | None = None,
     ) -> None:
         """Bind VDC component to HA entity."""
         from .const import DATA_BINDINGS, DOMAIN
@@ -202,12 +665,31 @@ class DeviceManager:
                         entity_id,
                         component,
                         binding_type,
+                        vdc_device_id=device.dSUID,
+                        sensor_filter=sensor_filter,
                     )
                 
                 _LOGGER.debug("Set up entity binding: %s -> %s", component_id, entity_id)
                 self._entity_bindings[component_id] = entity_id
                 break
 
+    def _add_device(self, device: VdSD) -> None:
+        """Store a device, index its channel/sensor roles and make it resolvable."""
+        self._devices[device.dSUID] = device
+        self.get_role_index(device)
+        async_get_resolver(self.hass).async_devices_changed()
+
+    def get_role_index(self, device: VdSD) -> DeviceRoleIndex:
+        """Return the role index of a device, building it on first use."""
+        index = self._role_indexes.get(device.dSUID)
+        if index is None:
+            index = self._role_indexes[device.dSUID] = DeviceRoleIndex(device)
+        return index
+
+    def invalidate_role_index(self, device: VdSD) -> None:
+        """Drop the role index after a structural change of the device."""
+        self._role_indexes.pop(device.dSUID, None)
+
     def get_device(self, dsuid: str) -> VdSD | None:
         """Get device by dsUID."""
         return self._devices.get(dsuid)
@@ -215,3 +697,25 @@ class DeviceManager:
     def get_all_devices(self) -> list[VdSD]:
         """Get all devices."""
         return list(self._devices.values())
+
+
+def _spec_name(spec: Any) -> str | None:
+    """Return the device name of a spec, for reporting."""
+    if not isinstance(spec, dict):
+        return None
+    if "instance_name" in spec:
+        return spec["instance_name"]
+    device_config = spec.get("device_config")
+    if isinstance(device_config, dict):
+        return device_config.get("name")
+    return None
+
+
+def _bulk_report(items: list[dict[str, Any]], start: float) -> dict[str, Any]:
+    """Summarize the per-item results of a bulk creation."""
+    return {
+        "created": sum(item["status"] == "created" for item in items),
+        "failed": sum(item["status"] != "created" for item in items),
+        "seconds": round(time.perf_counter() - start, 3),
+        "items": items,
+    }
@@ -0,0 +1,101 @@
+"""Persistent device store for digitalSTROM VDC integration."""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DEVICE_STORE_SAVE_DELAY, STORAGE_KEY_DEVICES, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+# Creation kinds
+KIND_MANUAL = "manual"
+KIND_TEMPLATE = "template"
+
+
+class DeviceStore:
+    """Store the creation specs of all vdSDs of a config entry.
+
+    A spec holds exactly the arguments the device was created with, so a
+    restore replays the creation calls in one pass. Specs are kept in
+    creation order and keyed by dsUID. Saved scene tables are stored next to
+    the specs.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the device store."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{STORAGE_KEY_DEVICES}.{entry_id}"
+        )
+        self._specs: dict[str, dict[str, Any]] = {}
+        self._scenes: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self.load_time: float | None = None
+
+    @property
+    def specs(self) -> list[dict[str, Any]]:
+        """Return the stored specs in creation order."""
+        return list(self._specs.values())
+
+    async def async_load(self) -> list[dict[str, Any]]:
+        """Load the stored specs."""
+        start = time.perf_counter()
+        data = await self._store.async_load()
+        self._specs = {
+            spec["dsuid"]: spec for spec in (data or {}).get("devices", [])
+        }
+        self._scenes = (data or {}).get("scenes", {})
+        self.load_time = time.perf_counter() - start
+        _LOGGER.debug(
+            "Loaded %d device specs in %.3f s", len(self._specs), self.load_time
+        )
+        return self.specs
+
+    @callback
+    def async_set(self, dsuid: str, spec: dict[str, Any]) -> None:
+        """Record the spec of a created device."""
+        self._specs[dsuid] = {"dsuid": dsuid, **spec}
+        self._async_schedule_save()
+
+    @callback
+    def async_replace(
+        self, specs: dict[str, dict[str, Any]], renamed: dict[str, str]
+    ) -> None:
+        """Replace all specs after a restore assigned new dsUIDs."""
+        self._specs = {dsuid: {**spec, "dsuid": dsuid} for dsuid, spec in specs.items()}
+        self._scenes = {
+            renamed.get(dsuid, dsuid): scenes for dsuid, scenes in self._scenes.items()
+        }
+        self._async_schedule_save()
+
+    def scenes(self, dsuid: str) -> dict[str, Any] | None:
+        """Return the stored scene table of a device."""
+        return self._scenes.get(dsuid)
+
+    @callback
+    def async_set_scenes(self, dsuid: str, scenes: dict[str, Any]) -> None:
+        """Record the scene table of a device."""
+        self._scenes[dsuid] = scenes
+        self._async_schedule_save()
+
+    async def async_flush(self) -> None:
+        """Write pending changes now."""
+        if self._dirty:
+            await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Save after a short delay so bulk changes are written once."""
+        self._dirty = True
+        self._store.async_delay_save(self._data_to_save, DEVICE_STORE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        self._dirty = False
+        return {"devices": list(self._specs.values()), "scenes": self._scenes}
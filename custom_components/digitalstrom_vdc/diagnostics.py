@@ -0,0 +1,68 @@
+"""Diagnostics support for digitalSTROM VDC integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_DSUID,
+    DATA_BINDINGS,
+    DATA_CONFIG_WRITER,
+    DATA_COORDINATOR,
+    DATA_DEVICE_MANAGER,
+    DATA_METRICS,
+    DATA_VDC_MANAGER,
+    DOMAIN,
+)
+from .ramp import async_get_ramp_engine
+from .resolver import async_get_resolver
+from .template_manager import async_get_template_manager
+
+TO_REDACT = {CONF_DSUID}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data = hass.data[DOMAIN][entry.entry_id]
+    vdc_manager = data[DATA_VDC_MANAGER]
+    device_manager = data[DATA_DEVICE_MANAGER]
+    bindings = data[DATA_BINDINGS]
+    template_manager = async_get_template_manager(hass)
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "connection": {
+            "state": vdc_manager.connection_state,
+            **vdc_manager.connection_stats.as_dict(),
+        },
+        "metrics": data[DATA_METRICS].snapshot(),
+        "announcer": vdc_manager.announcer.stats,
+        "devices": {
+            "count": len(device_manager.get_all_devices()),
+            "restore": device_manager.restore_stats,
+            "scenes": device_manager.scene_stats,
+            "undo": device_manager.undo_memory_report(),
+        },
+        "bindings": {
+            "count": len(bindings.get_all_bindings()),
+            "batches_fired": bindings.batches_fired,
+            "batched_updates": bindings.batched_updates,
+            "memory": bindings.memory_footprint(),
+        },
+        "refresh": data[DATA_COORDINATOR].refresh_stats,
+        "config_writer": data[DATA_CONFIG_WRITER].metrics,
+        "resolver": async_get_resolver(hass).stats,
+        "ramps": async_get_ramp_engine(hass).stats,
+        "templates": {
+            "load": template_manager.load_stats,
+            "blueprints": template_manager.blueprint_stats,
+        },
+    }
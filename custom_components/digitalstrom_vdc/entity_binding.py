@@ -3,11 +3,27 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
+import time
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable
-
-from homeassistant.core import Event, HomeAssistant, State, callback
-from homeassistant.helpers.event import async_track_state_change_event
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+
+from .const import EVENT_BATCH_BUCKETS, EVENT_BATCH_UPDATE
+from .metrics import (
+    BINDING_QUEUE_DEPTH,
+    BINDING_WRITES_IN_FLIGHT,
+    DISABLED_METRICS,
+    EVENT_BATCH_SIZE,
+    EVENTS_FIRED,
+    MESSAGES_OUT,
+    SET_VALUE_LATENCY,
+    MetricsRegistry,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,8 +37,80 @@ class BindingType(Enum):
     BINARY_INPUT = "binary_input"  # VDC -> HA entity (binary state)
 
 
+@dataclass(frozen=True)
+class SensorFilter:
+    """Deadband and rate limit settings for a sensor binding (VDC → HA)."""
+
+    absolute_deadband: float = 0.0  # minimum absolute change to report
+    relative_deadband: float = 0.0  # minimum change as fraction of last value
+    min_interval: float = 0.0  # seconds between reported values
+    max_age: float | None = None  # seconds after which a value is always reported
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> SensorFilter | None:
+        """Create a filter from sensor input configuration, if any is set."""
+        sensor_filter = cls(
+            absolute_deadband=float(config.get("deadband", 0.0)),
+            relative_deadband=float(config.get("relative_deadband", 0.0)),
+            min_interval=float(config.get("min_interval", 0.0)),
+            max_age=float(config["max_age"]) if config.get("max_age") else None,
+        )
+        if sensor_filter == cls():
+            return None
+        return sensor_filter
+
+    def exceeds_deadband(self, last_value: Any, value: Any) -> bool:
+        """Return True if the change from last_value to value is significant."""
+        try:
+            delta = abs(float(value) - float(last_value))
+            threshold = max(
+                self.absolute_deadband,
+                self.relative_deadband * abs(float(last_value)),
+            )
+        except (TypeError, ValueError):
+            # Non-numeric values are reported whenever they change
+            return value != last_value
+        return delta >= threshold if threshold else True
+
+
 class EntityBinding:
-    """Bidirectional binding between HA entity and VDC component."""
+    """Bidirectional binding between HA entity and VDC component.
+
+    Installations can have tens of thousands of bindings, so instances are
+    slotted and the sync lock is only created once two updates actually
+    overlap.
+    """
+
+    __slots__ = (
+        "hass",
+        "ha_entity_id",
+        "vdc_component",
+        "binding_type",
+        "component_type",
+        "vdc_device_id",
+        "_on_vdc_update",
+        "_emit_event",
+        "_vdc_callback",
+        "_busy",
+        "_sync_lock",
+        "_pending_state",
+        "_write_task",
+        "writes_requested",
+        "writes_completed",
+        "writes_failed",
+        "writes_coalesced",
+        "writes_dropped",
+        "_set_value_latency",
+        "_messages_out",
+        "sensor_filter",
+        "_last_reported_value",
+        "_last_report_time",
+        "_deferred_report",
+        "sensor_reported",
+        "sensor_suppressed_deadband",
+        "sensor_rate_limited",
+        "sensor_forced",
+    )
 
     def __init__(
         self,
@@ -30,15 +118,49 @@ class EntityBinding:
         ha_entity_id: str,
         vdc_component: Any,
         binding_type: BindingType,
+        vdc_device_id: str | None = None,
+        on_vdc_update: Callable[[str], None] | None = None,
+        sensor_filter: SensorFilter | None = None,
+        emit_event: Callable[[str, dict[str, Any]], None] | None = None,
+        metrics: MetricsRegistry | None = None,
+        component_type: str = "component",
     ) -> None:
         """Initialize entity binding."""
         self.hass = hass
         self.ha_entity_id = ha_entity_id
         self.vdc_component = vdc_component
         self.binding_type = binding_type
-        self._ha_listener = None
-        self._vdc_callback = None
-        self._sync_lock = asyncio.Lock()
+        self.component_type = component_type
+        self.vdc_device_id = vdc_device_id
+        self._on_vdc_update = on_vdc_update
+        # VDC → HA events go through the registry's batching stage if given
+        self._emit_event = emit_event or hass.bus.async_fire
+        self._vdc_callback: Callable[..., Any] | None = None
+        self._busy = False
+        self._sync_lock: asyncio.Lock | None = None
+
+        # HA → VDC write queue: at most one write in flight plus one pending
+        # value. Newer values replace the pending one ("latest value wins").
+        self._pending_state: State | None = None
+        self._write_task: asyncio.Task | None = None
+        self.writes_requested = 0
+        self.writes_completed = 0
+        self.writes_failed = 0
+        self.writes_coalesced = 0
+        self.writes_dropped = 0
+        metrics = metrics or DISABLED_METRICS
+        self._set_value_latency = metrics.histogram(SET_VALUE_LATENCY)
+        self._messages_out = metrics.counter(MESSAGES_OUT)
+
+        # VDC → HA sensor filtering
+        self.sensor_filter = sensor_filter
+        self._last_reported_value: Any = None
+        self._last_report_time: float | None = None
+        self._deferred_report: asyncio.TimerHandle | None = None
+        self.sensor_reported = 0
+        self.sensor_suppressed_deadband = 0
+        self.sensor_rate_limited = 0
+        self.sensor_forced = 0
 
     async def async_setup(self) -> None:
         """Set up the binding."""
@@ -48,82 +170,150 @@ class EntityBinding:
             await self._setup_vdc_to_ha()
 
     async def _setup_ha_to_vdc(self) -> None:
-        """Set up HA → VDC control binding for outputs."""
+        """Set up HA → VDC control binding for outputs.
+
+        State changes are not subscribed here; the BindingRegistry owns a single
+        state-change dispatcher and calls async_queue_write for this binding.
+        """
         _LOGGER.debug(
             "Setting up HA → VDC binding: %s -> VDC component",
             self.ha_entity_id,
         )
 
-        @callback
-        def state_changed(event: Event) -> None:
-            """Handle HA entity state change."""
-            new_state: State | None = event.data.get("new_state")
-            if new_state is None:
+    @callback
+    def async_queue_write(self, state: State) -> None:
+        """Queue an HA → VDC write, replacing any value still pending."""
+        self.writes_requested += 1
+        if self._pending_state is not None:
+            # The pending value was never sent and is superseded by this one
+            self.writes_coalesced += 1
+        self._pending_state = state
+
+        if self._write_task is None or self._write_task.done():
+            self._write_task = self.hass.async_create_task(
+                self._process_write_queue()
+            )
+
+    async def _process_write_queue(self) -> None:
+        """Write pending values to the VDC until the queue is empty."""
+        while self._pending_state is not None:
+            state = self._pending_state
+            self._pending_state = None
+            if await self._update_vdc_from_ha(state):
+                self.writes_completed += 1
+            else:
+                self.writes_failed += 1
+        self._notify_vdc_update()
+
+    @property
+    def write_in_flight(self) -> bool:
+        """Return True while a write to the VDC is running."""
+        return self._write_task is not None and not self._write_task.done()
+
+    @property
+    def write_pending(self) -> bool:
+        """Return True if a value is waiting to be written."""
+        return self._pending_state is not None
+
+    async def _async_set_vdc_value(self, value: float) -> None:
+        """Write a value to the VDC component and record the latency."""
+        start = time.perf_counter()
+        await self.vdc_component.set_value(value)
+        self._set_value_latency.observe((time.perf_counter() - start) * 1000)
+        self._messages_out.inc("set_value")
+
+    @property
+    def write_stats(self) -> dict[str, int]:
+        """Return counters of the HA → VDC write queue."""
+        return {
+            "requested": self.writes_requested,
+            "completed": self.writes_completed,
+            "failed": self.writes_failed,
+            "coalesced": self.writes_coalesced,
+            "dropped": self.writes_dropped,
+            "pending": int(self._pending_state is not None),
+        }
+
+    async def _async_acquire(self) -> None:
+        """Acquire the sync lock, creating it on the first contention.
+
+        Without contention a flag is enough. When a second update arrives
+        while one is running, the lock is created already held on behalf of
+        the running update, and is used by all updates from then on.
+        """
+        if self._sync_lock is None:
+            if not self._busy:
+                self._busy = True
                 return
-
-            # Schedule async update
-            asyncio.create_task(self._update_vdc_from_ha(new_state))
-
-        # Listen to HA entity state changes
-        self._ha_listener = async_track_state_change_event(
-            self.hass,
-            [self.ha_entity_id],
-            state_changed,
-        )
-
-    async def _update_vdc_from_ha(self, state: State) -> None:
-        """Update VDC component from HA state."""
-        async with self._sync_lock:
-            try:
-                # Extract value based on entity domain
-                domain = state.domain
+            self._sync_lock = asyncio.Lock()
+            # Acquiring a new lock does not suspend
+            await self._sync_lock.acquire()
+        await self._sync_lock.acquire()
+
+    def _release(self) -> None:
+        """Release the sync lock."""
+        if self._sync_lock is None:
+            self._busy = False
+        else:
+            self._sync_lock.release()
+
+    async def _update_vdc_from_ha(self, state: State) -> bool:
+        """Update VDC component from HA state and return whether it succeeded."""
+        await self._async_acquire()
+        try:
+            # Extract value based on entity domain
+            domain = state.domain
+            
+            if domain == "light":
+                # Get brightness and convert to VDC range (0-100)
+                brightness = state.attributes.get("brightness", 0)
+                vdc_value = (brightness / 255.0) * 100.0 if brightness else 0.0
+                
+                # Set VDC output channel value
+                if hasattr(self.vdc_component, 'set_value'):
+                    await self._async_set_vdc_value(vdc_value)
+                _LOGGER.debug(
+                    "Updated VDC from HA light: %s -> %.1f",
+                    self.ha_entity_id,
+                    vdc_value,
+                )
+                
+            elif domain == "switch":
+                # Convert on/off to 0/100
+                vdc_value = 100.0 if state.state == "on" else 0.0
+                
+                # Set VDC output channel value
+                if hasattr(self.vdc_component, 'set_value'):
+                    await self._async_set_vdc_value(vdc_value)
+                _LOGGER.debug(
+                    "Updated VDC from HA switch: %s -> %.1f",
+                    self.ha_entity_id,
+                    vdc_value,
+                )
                 
-                if domain == "light":
-                    # Get brightness and convert to VDC range (0-100)
-                    brightness = state.attributes.get("brightness", 0)
-                    vdc_value = (brightness / 255.0) * 100.0 if brightness else 0.0
-                    
-                    # Set VDC output channel value
-                    if hasattr(self.vdc_component, 'set_value'):
-                        await self.vdc_component.set_value(vdc_value)
-                    _LOGGER.debug(
-                        "Updated VDC from HA light: %s -> %.1f",
-                        self.ha_entity_id,
-                        vdc_value,
-                    )
-                    
-                elif domain == "switch":
-                    # Convert on/off to 0/100
-                    vdc_value = 100.0 if state.state == "on" else 0.0
-                    
-                    # Set VDC output channel value
-                    if hasattr(self.vdc_component, 'set_value'):
-                        await self.vdc_component.set_value(vdc_value)
-                    _LOGGER.debug(
-                        "Updated VDC from HA switch: %s -> %.1f",
-                        self.ha_entity_id,
-                        vdc_value,
-                    )
-                    
-                elif domain == "cover":
-                    # Get position
-                    position = state.attributes.get("current_position", 0)
-                    
-                    # Set VDC output channel value
-                    if hasattr(self.vdc_component, 'set_value'):
-                        await self.vdc_component.set_value(float(position))
-                    _LOGGER.debug(
-                        "Updated VDC from HA cover: %s -> %d",
-                        self.ha_entity_id,
-                        position,
-                    )
-                    
-            except Exception as err:
-                _LOGGER.error(
-                    "Error updating VDC from HA entity %s: %s",
+            elif domain == "cover":
+                # Get position
+                position = state.attributes.get("current_position", 0)
+                
+                # Set VDC output channel value
+                if hasattr(self.vdc_component, 'set_value'):
+                    await self._async_set_vdc_value(float(position))
+                _LOGGER.debug(
+                    "Updated VDC from HA cover: %s -> %d",
                     self.ha_entity_id,
-                    err,
+                    position,
                 )
+                
+        except Exception as err:
+            _LOGGER.error(
+                "Error updating VDC from HA entity %s: %s",
+                self.ha_entity_id,
+                err,
+            )
+            return False
+        finally:
+            self._release()
+        return True
 
     async def _setup_vdc_to_ha(self) -> None:
         """Set up VDC → HA state reporting binding for inputs/sensors."""
@@ -132,9 +322,8 @@ class EntityBinding:
             self.ha_entity_id,
         )
 
-        async def vdc_value_changed(value: Any = None) -> None:
-            """Handle VDC component value change."""
-            await self._update_ha_from_vdc(value)
+        # A bound method is smaller than a closure and needs no cell
+        vdc_value_changed = self._async_vdc_value_changed
 
         # Register callback with VDC component based on type
         if self.binding_type == BindingType.SENSOR:
@@ -168,60 +357,153 @@ class EntityBinding:
         
         self._vdc_callback = vdc_value_changed
 
-    async def _update_ha_from_vdc(self, value: Any) -> None:
+    async def _async_vdc_value_changed(self, value: Any = None) -> None:
+        """Handle VDC component value change."""
+        await self._update_ha_from_vdc(value)
+
+    @property
+    def filter_stats(self) -> dict[str, int]:
+        """Return counters of the sensor deadband and rate limit filter."""
+        return {
+            "reported": self.sensor_reported,
+            "suppressed_deadband": self.sensor_suppressed_deadband,
+            "rate_limited": self.sensor_rate_limited,
+            "forced": self.sensor_forced,
+        }
+
+    @callback
+    def _async_filter_sensor_value(self, value: Any) -> bool:
+        """Return True if a sensor value passes deadband and rate limit."""
+        sensor_filter = self.sensor_filter
+        now = time.monotonic()
+        self._cancel_deferred_report()
+
+        if sensor_filter is None or self._last_report_time is None:
+            return self._accept_sensor_value(value, now)
+
+        age = now - self._last_report_time
+        if sensor_filter.max_age is not None and age >= sensor_filter.max_age:
+            self.sensor_forced += 1
+            return self._accept_sensor_value(value, now)
+
+        if not sensor_filter.exceeds_deadband(self._last_reported_value, value):
+            self.sensor_suppressed_deadband += 1
+            return False
+
+        if age < sensor_filter.min_interval:
+            # Report the latest significant value once the interval has passed
+            self.sensor_rate_limited += 1
+            self._deferred_report = self.hass.loop.call_later(
+                sensor_filter.min_interval - age, self._async_report_deferred, value
+            )
+            return False
+
+        return self._accept_sensor_value(value, now)
+
+    def _accept_sensor_value(self, value: Any, now: float) -> bool:
+        """Record a sensor value as reported."""
+        self._last_reported_value = value
+        self._last_report_time = now
+        self.sensor_reported += 1
+        return True
+
+    @callback
+    def _async_report_deferred(self, value: Any) -> None:
+        """Report a value held back by the rate limit.
+
+        The value already passed the filter when it was held back. It is not
+        filtered again, so a timer firing a little early cannot defer and
+        count it a second time.
+        """
+        self._deferred_report = None
+        self._accept_sensor_value(value, time.monotonic())
+        self.hass.async_create_task(
+            self._update_ha_from_vdc(value, apply_filter=False)
+        )
+
+    def _cancel_deferred_report(self) -> None:
+        """Cancel a pending rate-limited report."""
+        if self._deferred_report is not None:
+            self._deferred_report.cancel()
+            self._deferred_report = None
+
+    async def _update_ha_from_vdc(self, value: Any, apply_filter: bool = True) -> None:
         """Update HA entity from VDC value."""
-        async with self._sync_lock:
-            try:
-                if self.binding_type == BindingType.SENSOR:
-                    # Update sensor entity state
-                    _LOGGER.debug(
-                        "VDC sensor value changed: %s -> %s",
-                        self.ha_entity_id,
-                        value,
-                    )
-                    # Fire event to update HA state
-                    self.hass.bus.async_fire(
-                        "digitalstrom_vdc_sensor_changed",
-                        {"entity_id": self.ha_entity_id, "value": value}
-                    )
-                    
-                elif self.binding_type == BindingType.BINARY_INPUT:
-                    # Update binary sensor state
-                    _LOGGER.debug(
-                        "VDC binary input changed: %s -> %s",
-                        self.ha_entity_id,
-                        value,
-                    )
-                    # Fire event to update HA state
-                    self.hass.bus.async_fire(
-                        "digitalstrom_vdc_binary_input_changed",
-                        {"entity_id": self.ha_entity_id, "state": value}
-                    )
-                    
-                elif self.binding_type == BindingType.INPUT:
-                    # Button press event
-                    _LOGGER.debug(
-                        "VDC button pressed: %s",
-                        self.ha_entity_id,
-                    )
-                    # Fire event for button press
-                    self.hass.bus.async_fire(
-                        "digitalstrom_vdc_button_press",
-                        {"entity_id": self.ha_entity_id, "event": value}
-                    )
-                    
-            except Exception as err:
-                _LOGGER.error(
-                    "Error updating HA from VDC: %s",
-                    err,
+        if apply_filter and self.binding_type == BindingType.SENSOR:
+            if not self._async_filter_sensor_value(value):
+                return
+
+        await self._async_acquire()
+        try:
+            if self.binding_type == BindingType.SENSOR:
+                # Update sensor entity state
+                _LOGGER.debug(
+                    "VDC sensor value changed: %s -> %s",
+                    self.ha_entity_id,
+                    value,
+                )
+                # Fire event to update HA state
+                self._emit_event(
+                    "digitalstrom_vdc_sensor_changed",
+                    {"entity_id": self.ha_entity_id, "value": value}
+                )
+                
+            elif self.binding_type == BindingType.BINARY_INPUT:
+                # Update binary sensor state
+                _LOGGER.debug(
+                    "VDC binary input changed: %s -> %s",
+                    self.ha_entity_id,
+                    value,
                 )
+                # Fire event to update HA state
+                self._emit_event(
+                    "digitalstrom_vdc_binary_input_changed",
+                    {"entity_id": self.ha_entity_id, "state": value}
+                )
+                
+            elif self.binding_type == BindingType.INPUT:
+                # Button press event
+                _LOGGER.debug(
+                    "VDC button pressed: %s",
+                    self.ha_entity_id,
+                )
+                # Fire event for button press
+                self._emit_event(
+                    "digitalstrom_vdc_button_press",
+                    {"entity_id": self.ha_entity_id, "event": value}
+                )
+                
+        except Exception as err:
+            _LOGGER.error(
+                "Error updating HA from VDC: %s",
+                err,
+            )
+        finally:
+            self._release()
+
+        self._notify_vdc_update()
+
+    @callback
+    def _notify_vdc_update(self) -> None:
+        """Let the entities of the bound VdSD know that it changed."""
+        if self._on_vdc_update and self.vdc_device_id:
+            self._on_vdc_update(self.vdc_device_id)
 
     async def async_remove(self) -> None:
         """Remove the binding."""
-        # Remove HA listener
-        if self._ha_listener:
-            self._ha_listener()
-            self._ha_listener = None
+        self._cancel_deferred_report()
+
+        # Discard a value still waiting to be written and stop the writer
+        if self._pending_state is not None:
+            self._pending_state = None
+            self.writes_dropped += 1
+        if self._write_task and not self._write_task.done():
+            self._write_task.cancel()
+            try:
+                await self._write_task
+            except asyncio.CancelledError:
+                pass
+        self._write_task = None
 
         # Remove VDC callback
         if self._vdc_callback:
@@ -241,14 +523,173 @@ class EntityBinding:
         _LOGGER.debug("Removed binding for %s", self.ha_entity_id)
 
 
+class ComponentView(Mapping[str, dict[str, Any]]):
+    """Read-only view of bindings as {component_type: vdc_component}.
+
+    The mappings are built on access from the canonical binding table, so
+    the registry does not store every component a second time.
+    """
+
+    __slots__ = ("_bindings",)
+
+    def __init__(self, bindings: Mapping[str, EntityBinding]) -> None:
+        """Initialize the view."""
+        self._bindings = bindings
+
+    def __getitem__(self, binding_id: str) -> dict[str, Any]:
+        """Return the component of a binding keyed by its type."""
+        binding = self._bindings[binding_id]
+        return {binding.component_type: binding.vdc_component}
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over binding ids."""
+        return iter(self._bindings)
+
+    def __len__(self) -> int:
+        """Return the number of bindings."""
+        return len(self._bindings)
+
+
 class BindingRegistry:
-    """Registry for managing entity bindings."""
+    """Registry for managing entity bindings.
+
+    _binding_objects is the only table of bindings. The entity index and
+    the _bindings component view are derived from it.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        per_entity_events: bool = True,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        """Initialize binding registry.
 
-    def __init__(self, hass: HomeAssistant) -> None:
-        """Initialize binding registry."""
+        VDC → HA updates are collected per event loop iteration and emitted as
+        one digitalstrom_vdc_batch_update event. The per-entity events are
+        still fired immediately unless per_entity_events is False.
+        """
         self.hass = hass
-        self._bindings: dict[str, dict[str, Any]] = {}
+        self.metrics = metrics or DISABLED_METRICS
+        self._events_fired = self.metrics.counter(EVENTS_FIRED)
+        self._event_batch_size = self.metrics.histogram(
+            EVENT_BATCH_SIZE, EVENT_BATCH_BUCKETS
+        )
+        self.metrics.gauge(
+            BINDING_QUEUE_DEPTH,
+            lambda: sum(b.write_pending for b in self._binding_objects.values()),
+        )
+        self.metrics.gauge(
+            BINDING_WRITES_IN_FLIGHT,
+            lambda: sum(b.write_in_flight for b in self._binding_objects.values()),
+        )
+        self.per_entity_events = per_entity_events
+        self._pending_updates: list[dict[str, Any]] = []
+        self._batch_flush: asyncio.Handle | None = None
+        self.batches_fired = 0
+        self.batched_updates = 0
         self._binding_objects: dict[str, EntityBinding] = {}
+        self._bindings: Mapping[str, dict[str, Any]] = ComponentView(
+            self._binding_objects
+        )
+        # Output bindings indexed by the HA entity they follow; almost every
+        # entity has one, and a tuple is smaller than a list
+        self._entity_index: dict[str, tuple[EntityBinding, ...]] = {}
+        self._unsub_state_changed: CALLBACK_TYPE | None = None
+        self._device_listeners: list[Callable[[str], None]] = []
+
+    @callback
+    def async_add_device_listener(
+        self, listener: Callable[[str], None]
+    ) -> CALLBACK_TYPE:
+        """Register a listener called with the dsUID of a device a VDC callback changed."""
+        self._device_listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            if listener in self._device_listeners:
+                self._device_listeners.remove(listener)
+
+        return remove_listener
+
+    @callback
+    def _async_emit_event(self, event_type: str, event_data: dict[str, Any]) -> None:
+        """Queue a VDC → HA update for the batch event of this loop iteration."""
+        if self.per_entity_events:
+            self.hass.bus.async_fire(event_type, event_data)
+            self._events_fired.inc(event_type)
+
+        self._pending_updates.append({"event_type": event_type, **event_data})
+        if self._batch_flush is None:
+            self._batch_flush = self.hass.loop.call_soon(self._async_flush_batch)
+
+    @callback
+    def _async_flush_batch(self) -> None:
+        """Emit all VDC → HA updates collected in this loop iteration."""
+        self._batch_flush = None
+        if not self._pending_updates:
+            return
+        updates = self._pending_updates
+        self._pending_updates = []
+        self.batches_fired += 1
+        self.batched_updates += len(updates)
+        self.hass.bus.async_fire(EVENT_BATCH_UPDATE, {"updates": updates})
+        self._events_fired.inc(EVENT_BATCH_UPDATE)
+        self._event_batch_size.observe(len(updates))
+
+    @callback
+    def _async_notify_device_update(self, dsuid: str) -> None:
+        """Notify device listeners about a VDC-side change."""
+        for listener in self._device_listeners:
+            listener(dsuid)
+
+    @callback
+    def _async_index_binding(self, binding: EntityBinding) -> None:
+        """Route state changes of the binding's HA entity to it."""
+        entity_id = binding.ha_entity_id
+        bindings = self._entity_index.get(entity_id, ())
+        self._entity_index[entity_id] = (*bindings, binding)
+        if self._unsub_state_changed is None:
+            self._unsub_state_changed = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_dispatch_state_changed,
+                event_filter=self._async_filter_state_changed,
+            )
+
+    @callback
+    def _async_unindex_binding(self, binding: EntityBinding) -> None:
+        """Stop routing state changes to the binding."""
+        bindings = self._entity_index.get(binding.ha_entity_id)
+        if not bindings:
+            return
+        remaining = tuple(other for other in bindings if other is not binding)
+        if remaining:
+            self._entity_index[binding.ha_entity_id] = remaining
+        else:
+            del self._entity_index[binding.ha_entity_id]
+        if not self._entity_index:
+            self._async_unsubscribe_state_changed()
+
+    @callback
+    def _async_unsubscribe_state_changed(self) -> None:
+        """Drop the shared state-change subscription."""
+        if self._unsub_state_changed is not None:
+            self._unsub_state_changed()
+            self._unsub_state_changed = None
+
+    @callback
+    def _async_filter_state_changed(self, event_data: Any) -> bool:
+        """Only let state changes of bound entities through."""
+        return event_data["entity_id"] in self._entity_index
+
+    @callback
+    def _async_dispatch_state_changed(self, event: Event) -> None:
+        """Dispatch an HA state change to the bindings following the entity."""
+        new_state: State | None = event.data.get("new_state")
+        if new_state is None:
+            return
+        for binding in self._entity_index.get(event.data["entity_id"], ()):
+            binding.async_queue_write(new_state)
 
     async def async_add_binding(
         self,
@@ -257,22 +698,33 @@ class BindingRegistry:
         vdc_component: Any,
         binding_type: BindingType,
         component_type: str = "component",
+        vdc_device_id: str | None = None,
+        sensor_filter: SensorFilter | None = None,
     ) -> None:
         """Add a new binding."""
+        if binding_id in self._binding_objects:
+            # Replace rather than leave the old binding subscribed
+            await self.async_remove_binding(binding_id)
+
         binding = EntityBinding(
             self.hass,
             ha_entity_id,
             vdc_component,
             binding_type,
+            vdc_device_id=vdc_device_id,
+            on_vdc_update=self._async_notify_device_update,
+            sensor_filter=sensor_filter,
+            emit_event=self._async_emit_event,
+            metrics=self.metrics,
+            component_type=component_type,
         )
         
         await binding.async_setup()
         self._binding_objects[binding_id] = binding
+        if binding_type == BindingType.OUTPUT:
+            self._async_index_binding(binding)
         
-        # Store in format expected by tests
-        self._bindings[binding_id] = {component_type: vdc_component}
-        
-        _LOGGER.info(
+        _LOGGER.debug(
             "Added binding: %s (%s) <-> %s",
             binding_id,
             binding_type.value,
@@ -283,16 +735,23 @@ class BindingRegistry:
         """Remove a binding."""
         binding = self._binding_objects.pop(binding_id, None)
         if binding:
+            self._async_unindex_binding(binding)
             await binding.async_remove()
-        self._bindings.pop(binding_id, None)
-        _LOGGER.info("Removed binding: %s", binding_id)
+        _LOGGER.debug("Removed binding: %s", binding_id)
 
     async def async_remove_all(self) -> None:
         """Remove all bindings."""
+        # Drop the shared subscription once instead of per binding
+        self._async_unsubscribe_state_changed()
+        if self._batch_flush is not None:
+            self._batch_flush.cancel()
+            self._batch_flush = None
+        self._pending_updates.clear()
+        self._entity_index.clear()
         for binding_id in list(self._binding_objects.keys()):
             await self.async_remove_binding(binding_id)
-        # Also clear the _bindings dict in case it was manually set
-        self._bindings.clear()
+        # The component view follows the binding table, clear it in place
+        self._binding_objects.clear()
 
     def get_binding(self, binding_id: str) -> EntityBinding | None:
         """Get a binding by ID."""
@@ -302,6 +761,38 @@ class BindingRegistry:
         """Get all bindings."""
         return self._binding_objects.copy()
 
+    def memory_footprint(self) -> dict[str, Any]:
+        """Return the shallow size in bytes of what the registry holds.
+
+        Counts the binding objects with their callbacks and locks, the
+        binding ids and the tables. VDC components and shared objects such
+        as hass are not included.
+        """
+        binding_bytes = 0
+        locks = 0
+        for binding_id, binding in self._binding_objects.items():
+            binding_bytes += sys.getsizeof(binding) + sys.getsizeof(binding_id)
+            if binding._vdc_callback is not None:
+                binding_bytes += sys.getsizeof(binding._vdc_callback)
+            if binding._sync_lock is not None:
+                binding_bytes += sys.getsizeof(binding._sync_lock)
+                locks += 1
+        table_bytes = (
+            sys.getsizeof(self._binding_objects)
+            + sys.getsizeof(self._entity_index)
+            + sum(sys.getsizeof(entry) for entry in self._entity_index.values())
+        )
+        count = len(self._binding_objects)
+        total = binding_bytes + table_bytes
+        return {
+            "bindings": count,
+            "locks": locks,
+            "binding_bytes": binding_bytes,
+            "table_bytes": table_bytes,
+            "total_bytes": total,
+            "bytes_per_binding": round(total / count, 1) if count else None,
+        }
+
     async def register_channel_binding(
         self,
         entity_id: str,
@@ -316,6 +807,7 @@ class BindingRegistry:
             channel,
             BindingType.OUTPUT,
             component_type="channel",
+            vdc_device_id=vdc_device_id,
         )
 
     async def register_sensor_binding(
@@ -323,6 +815,7 @@ class BindingRegistry:
         entity_id: str,
         sensor: Any,
         vdc_device_id: str | None = None,
+        sensor_filter: SensorFilter | None = None,
     ) -> None:
         """Register a sensor binding (VDC → HA)."""
         binding_id = entity_id
@@ -332,6 +825,8 @@ class BindingRegistry:
             sensor,
             BindingType.SENSOR,
             component_type="sensor",
+            vdc_device_id=vdc_device_id,
+            sensor_filter=sensor_filter,
         )
 
     async def register_binary_input_binding(
@@ -348,6 +843,7 @@ class BindingRegistry:
             binary_input,
             BindingType.BINARY_INPUT,
             component_type="binary_input",
+            vdc_device_id=vdc_device_id,
         )
 
     async def register_button_binding(
@@ -364,6 +860,7 @@ class BindingRegistry:
             button_input,
             BindingType.INPUT,
             component_type="button",
+            vdc_device_id=vdc_device_id,
         )
 
     async def unregister_binding(self, binding_id: str) -> None:
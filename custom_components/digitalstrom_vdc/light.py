@@ -8,8 +8,10 @@ from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
     ATTR_HS_COLOR,
     ATTR_RGB_COLOR,
+    ATTR_TRANSITION,
     ColorMode,
     LightEntity,
+    LightEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -18,6 +20,14 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DATA_COORDINATOR, DATA_DEVICE_MANAGER, DOMAIN
 from .coordinator import DigitalStromVDCCoordinator
+from .device_manager import DeviceManager
+from .ramp import async_get_ramp_engine
+from .role_index import (
+    ROLE_BRIGHTNESS,
+    ROLE_COLOR_TEMPERATURE,
+    ROLE_HUE,
+    ROLE_SATURATION,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,7 +47,7 @@ async def async_setup_entry(
     for device in device_manager.get_all_devices():
         # Check if device has light-compatible outputs
         # This would be based on primary_group == DSGroup.LIGHT or output channels
-        entities.append(DigitalStromVDCLight(coordinator, device))
+        entities.append(DigitalStromVDCLight(coordinator, device, device_manager))
 
     async_add_entities(entities)
 
@@ -45,14 +55,18 @@ async def async_setup_entry(
 class DigitalStromVDCLight(CoordinatorEntity, LightEntity):
     """Representation of a digitalSTROM VDC light."""
 
+    _attr_supported_features = LightEntityFeature.TRANSITION
+
     def __init__(
         self,
         coordinator: DigitalStromVDCCoordinator,
         vdc_device: Any,
+        device_manager: DeviceManager,
     ) -> None:
         """Initialize the light."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=vdc_device.dSUID)
         self._vdc_device = vdc_device
+        self._device_manager = device_manager
         self._attr_unique_id = vdc_device.dSUID
         self._attr_name = vdc_device.name
         
@@ -66,12 +80,12 @@ class DigitalStromVDCLight(CoordinatorEntity, LightEntity):
         
         # Determine supported color modes based on available channels
         if self._vdc_device.output and self._vdc_device.output.channels:
-            channels = self._vdc_device.output.channels
+            roles = self._device_manager.get_role_index(self._vdc_device)
             # Check for RGB channels (hue and saturation)
-            has_hue = any(ch.channel_type == "hue" for ch in channels)
-            has_saturation = any(ch.channel_type == "saturation" for ch in channels)
+            has_hue = roles.has_channel(ROLE_HUE)
+            has_saturation = roles.has_channel(ROLE_SATURATION)
             # Check for color temperature channel
-            has_ct = any(ch.channel_type == "colorTemperature" for ch in channels)
+            has_ct = roles.has_channel(ROLE_COLOR_TEMPERATURE)
             
             if has_hue and has_saturation:
                 self._attr_color_mode = ColorMode.HS
@@ -112,9 +126,9 @@ class DigitalStromVDCLight(CoordinatorEntity, LightEntity):
         if not self._vdc_device.output or not self._vdc_device.output.channels:
             return None
             
-        channels = self._vdc_device.output.channels
-        hue_channel = next((ch for ch in channels if ch.channel_type == "hue"), None)
-        sat_channel = next((ch for ch in channels if ch.channel_type == "saturation"), None)
+        roles = self._device_manager.get_role_index(self._vdc_device)
+        hue_channel = roles.channel(ROLE_HUE)
+        sat_channel = roles.channel(ROLE_SATURATION)
         
         if hue_channel and sat_channel:
             # Convert from VDC range (0-360 for hue, 0-100 for saturation) to HA range
@@ -124,14 +138,20 @@ class DigitalStromVDCLight(CoordinatorEntity, LightEntity):
         
         return None
 
+    def _brightness_channel(self) -> Any | None:
+        """Return the brightness channel, falling back to the first channel."""
+        roles = self._device_manager.get_role_index(self._vdc_device)
+        brightness_channel = roles.channel(ROLE_BRIGHTNESS)
+        if brightness_channel is None:
+            return roles.primary_channel
+        return brightness_channel
+
     def _get_brightness(self) -> float:
         """Get brightness value from VDC device."""
         if not self._vdc_device.output or not self._vdc_device.output.channels:
             return 0.0
             
-        # Get brightness from first channel (usually the brightness channel)
-        primary_channel = self._vdc_device.output.channels[0]
-        return float(primary_channel.value)
+        return float(self._brightness_channel().value)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
@@ -152,27 +172,27 @@ class DigitalStromVDCLight(CoordinatorEntity, LightEntity):
         # Extract color if provided
         hs_color = kwargs.get(ATTR_HS_COLOR)
         
+        # Collect all channel values so they are applied in a single push
+        values: list[tuple[Any, float]] = []
+        
         # Handle color if provided
         if hs_color:
             hue, saturation = hs_color
-            channels = self._vdc_device.output.channels
+            roles = self._device_manager.get_role_index(self._vdc_device)
             
-            # Set hue channel
-            hue_channel = next((ch for ch in channels if ch.channel_type == "hue"), None)
+            # Hue channel
+            hue_channel = roles.channel(ROLE_HUE)
             if hue_channel:
-                await hue_channel.set_value(hue)
+                values.append((hue_channel, hue))
             
-            # Set saturation channel
-            sat_channel = next((ch for ch in channels if ch.channel_type == "saturation"), None)
+            # Saturation channel
+            sat_channel = roles.channel(ROLE_SATURATION)
             if sat_channel:
-                await sat_channel.set_value(saturation)
+                values.append((sat_channel, saturation))
         
-        # Set brightness on primary channel
-        primary_channel = self._vdc_device.output.channels[0]
-        await primary_channel.set_value(vdc_brightness)
-        
-        # Request coordinator update
-        await self.coordinator.async_request_refresh()
+        # Brightness last, it triggers the push
+        values.append((self._brightness_channel(), vdc_brightness))
+        await self._async_apply(values, kwargs.get(ATTR_TRANSITION))
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the light off."""
@@ -182,12 +202,35 @@ class DigitalStromVDCLight(CoordinatorEntity, LightEntity):
             _LOGGER.error("Device %s has no output channels", self.name)
             return
         
-        # Set all output channels to 0
-        for channel in self._vdc_device.output.channels:
-            await channel.set_value(0.0)
+        # Set all output channels to 0 in a single push
+        await self._async_apply(
+            [(channel, 0.0) for channel in self._vdc_device.output.channels],
+            kwargs.get(ATTR_TRANSITION),
+        )
+
+    async def _async_apply(
+        self, values: list[tuple[Any, float]], transition: float | None
+    ) -> None:
+        """Apply channel values, ramping them over the transition if given."""
+        output = self._vdc_device.output
+        dsuid = self._vdc_device.dSUID
+
+        if transition:
+            # Ramps of one output share a batched write per tick
+            ramps = async_get_ramp_engine(self.hass)
+            futures = [
+                ramps.async_ramp(output, channel, value, transition)
+                for channel, value in values
+            ]
+            futures[-1].add_done_callback(
+                lambda _: self.coordinator.async_schedule_device_refresh(dsuid)
+            )
+        else:
+            # A direct write replaces any running transition
+            await async_get_ramp_engine(self.hass).async_write(output, values)
         
         # Request coordinator update
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_schedule_device_refresh(dsuid)
 
     @property
     def device_info(self) -> dict[str, Any]:
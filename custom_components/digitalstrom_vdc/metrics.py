@@ -0,0 +1,158 @@
+"""Lightweight metrics for digitalSTROM VDC integration."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable
+from typing import Any
+
+from .const import LATENCY_BUCKETS_MS
+
+# Metric names
+MESSAGES_IN = "vdc_messages_in"
+MESSAGES_OUT = "vdc_messages_out"
+SET_VALUE_LATENCY = "set_value_latency_ms"
+BINDING_QUEUE_DEPTH = "binding_queue_depth"
+BINDING_WRITES_IN_FLIGHT = "binding_writes_in_flight"
+EVENTS_FIRED = "events_fired"
+EVENT_BATCH_SIZE = "event_batch_size"
+RECONNECTS = "reconnects"
+
+
+class Counter:
+    """Monotonic counter, optionally split by a label such as a method name."""
+
+    __slots__ = ("values",)
+
+    def __init__(self) -> None:
+        """Initialize the counter."""
+        self.values: dict[str, int] = {}
+
+    def inc(self, label: str = "total", amount: int = 1) -> None:
+        """Increment the counter of a label."""
+        self.values[label] = self.values.get(label, 0) + amount
+
+    def snapshot(self) -> dict[str, int]:
+        """Return the counts per label."""
+        return dict(self.values)
+
+
+class Gauge:
+    """Value read from a provider when a snapshot is taken.
+
+    Reading on demand keeps gauges off the hot path entirely.
+    """
+
+    __slots__ = ("provider",)
+
+    def __init__(self, provider: Callable[[], Any]) -> None:
+        """Initialize the gauge."""
+        self.provider = provider
+
+    def snapshot(self) -> Any:
+        """Return the current value."""
+        return self.provider()
+
+
+class Histogram:
+    """Latency histogram with fixed bucket bounds in milliseconds."""
+
+    __slots__ = ("bounds", "buckets", "count", "total")
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS_MS) -> None:
+        """Initialize the histogram."""
+        self.bounds = bounds
+        # One bucket per bound plus one for larger values
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of all recorded values."""
+        return self.total / self.count if self.count else None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the count, mean and bucket counts."""
+        labels = [f"le_{bound}" for bound in self.bounds]
+        labels.append(f"gt_{self.bounds[-1]}")
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "buckets": dict(zip(labels, self.buckets, strict=True)),
+        }
+
+
+class _NullMetric:
+    """Stand-in for every metric type of a disabled registry."""
+
+    __slots__ = ()
+    count = 0
+    mean = None
+
+    def inc(self, label: str = "total", amount: int = 1) -> None:
+        """Do nothing."""
+
+    def observe(self, value: float) -> None:
+        """Do nothing."""
+
+    def snapshot(self) -> None:
+        """Return nothing."""
+        return None
+
+
+NULL_METRIC = _NullMetric()
+
+
+class MetricsRegistry:
+    """Named counters, gauges and histograms of one config entry.
+
+    Hot paths look their metrics up once and keep the object. When the
+    registry is disabled every lookup returns the same no-op metric, so an
+    instrumented call costs one empty method call.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        """Initialize the registry."""
+        self.enabled = enabled
+        self._metrics: dict[str, Counter | Gauge | Histogram] = {}
+
+    def counter(self, name: str) -> Counter:
+        """Return the counter of a name, creating it if needed."""
+        if not self.enabled:
+            return NULL_METRIC  # type: ignore[return-value]
+        return self._metrics.setdefault(name, Counter())  # type: ignore[return-value]
+
+    def gauge(self, name: str, provider: Callable[[], Any]) -> Gauge:
+        """Register a gauge read from a provider."""
+        if not self.enabled:
+            return NULL_METRIC  # type: ignore[return-value]
+        gauge = self._metrics[name] = Gauge(provider)
+        return gauge
+
+    def histogram(
+        self, name: str, bounds: tuple[float, ...] = LATENCY_BUCKETS_MS
+    ) -> Histogram:
+        """Return the histogram of a name, creating it if needed."""
+        if not self.enabled:
+            return NULL_METRIC  # type: ignore[return-value]
+        return self._metrics.setdefault(  # type: ignore[return-value]
+            name, Histogram(bounds)
+        )
+
+    def value(self, name: str) -> Any:
+        """Return the current value of a metric, None if unknown."""
+        metric = self._metrics.get(name)
+        return metric.snapshot() if metric is not None else None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current values of all metrics."""
+        return {name: metric.snapshot() for name, metric in self._metrics.items()}
+
+
+DISABLED_METRICS = MetricsRegistry(enabled=False)
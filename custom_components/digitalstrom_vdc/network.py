@@ -0,0 +1,44 @@
+"""Local network helpers for digitalSTROM VDC integration."""
+from __future__ import annotations
+
+import logging
+import socket
+
+from homeassistant.components import network
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+_LOGGER = logging.getLogger(__name__)
+
+FALLBACK_IP = "127.0.0.1"
+
+
+def probe_port_available(port: int) -> bool:
+    """Check if a TCP port is available.
+
+    Blocking, run in the executor.
+    """
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("", port))
+            return True
+    except OSError:
+        return False
+
+
+async def async_get_local_ip(hass: HomeAssistant) -> str:
+    """Return the local IP address of the Home Assistant host.
+
+    Uses the network integration, which follows the adapters configured in
+    Home Assistant and keeps them up to date without blocking the loop.
+    """
+    try:
+        return await network.async_get_source_ip(hass)
+    except HomeAssistantError as err:
+        _LOGGER.debug("No source IP for local network: %s", err)
+        return FALLBACK_IP
+
+
+async def async_is_port_available(hass: HomeAssistant, port: int) -> bool:
+    """Check if a TCP port is available."""
+    return await hass.async_add_executor_job(probe_port_available, port)
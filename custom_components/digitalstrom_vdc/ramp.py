@@ -0,0 +1,285 @@
+"""Dimming and transition ramps for digitalSTROM VDC integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .channel_batch import ChannelBatch, async_apply_channel_values
+from .const import DATA_RAMP_ENGINE, DEFAULT_RAMP_TICK_RATE, DOMAIN, RAMP_MIN_STEP
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Ramp:
+    """Linear change of one output channel towards a target value."""
+
+    __slots__ = (
+        "output",
+        "channel",
+        "start",
+        "target",
+        "start_time",
+        "duration",
+        "last",
+        "future",
+    )
+
+    def __init__(
+        self,
+        output: Any,
+        channel: Any,
+        start: float,
+        target: float,
+        start_time: float,
+        duration: float,
+        future: asyncio.Future[bool],
+    ) -> None:
+        """Initialize the ramp."""
+        self.output = output
+        self.channel = channel
+        self.start = start
+        self.target = target
+        self.start_time = start_time
+        self.duration = duration
+        self.last = start
+        self.future = future
+
+    def value_at(self, now: float) -> float:
+        """Return the channel value at a point in time."""
+        if self.duration <= 0:
+            return self.target
+        progress = min(1.0, (now - self.start_time) / self.duration)
+        return self.start + (self.target - self.start) * progress
+
+    def finished(self, now: float) -> bool:
+        """Return whether the target has been reached."""
+        return now - self.start_time >= self.duration
+
+
+class RampEngine:
+    """Run all active dims and transitions on one shared timer.
+
+    A single tick advances every active ramp, stages the new values per
+    device output and writes each output with one batched push. Writes are
+    coalesced: while a push is still in flight, later ticks only replace the
+    staged values, so a slow device never builds up a queue. The timer only
+    runs while ramps are active.
+
+    Direct writes go through async_write so they cancel the ramps of their
+    channels and cannot be overtaken by a ramp write already in flight.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, tick_rate: float = DEFAULT_RAMP_TICK_RATE
+    ) -> None:
+        """Initialize the ramp engine."""
+        self.hass = hass
+        self.tick_rate = tick_rate
+        self.clock: Callable[[], float] = time.monotonic
+        self._ramps: dict[int, Ramp] = {}
+        self._pending: dict[int, ChannelBatch] = {}
+        self._writer: asyncio.Task | None = None
+        # Outputs whose staged batch is being committed right now
+        self._in_flight: dict[int, asyncio.Future[None]] = {}
+        self._unsub_tick: Callable[[], None] | None = None
+        self.ticks = 0
+        self.writes = 0
+        self.coalesced = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return ramp engine counters."""
+        return {
+            "active": len(self._ramps),
+            "ticks": self.ticks,
+            "writes": self.writes,
+            "coalesced": self.coalesced,
+        }
+
+    def is_active(self, channel: Any) -> bool:
+        """Return whether a channel is ramping."""
+        return id(channel) in self._ramps
+
+    @callback
+    def async_ramp(
+        self, output: Any, channel: Any, target: float, duration: float
+    ) -> asyncio.Future[bool]:
+        """Ramp a channel to a target value over a duration in seconds.
+
+        A running ramp of the channel is retargeted from its current value.
+        The returned future resolves to True when the target is reached and
+        to False when the ramp is stopped or retargeted.
+        """
+        now = self.clock()
+        key = id(channel)
+        if (previous := self._ramps.get(key)) is not None:
+            start = previous.value_at(now)
+            self._async_resolve(previous, False)
+        else:
+            start = float(channel.value or 0.0)
+
+        ramp = Ramp(
+            output,
+            channel,
+            start,
+            float(target),
+            now,
+            max(0.0, duration),
+            self.hass.loop.create_future(),
+        )
+        self._ramps[key] = ramp
+        self._async_schedule_tick()
+        return ramp.future
+
+    @callback
+    def async_dim(
+        self, output: Any, channel: Any, direction: int, rate: float
+    ) -> asyncio.Future[bool]:
+        """Dim a channel towards its minimum or maximum at a rate per second.
+
+        Dimming the other way while a dim is running reverses it from the
+        current value.
+        """
+        min_value = float(getattr(channel, "min_value", 0.0))
+        max_value = float(getattr(channel, "max_value", 100.0))
+        target = max_value if direction > 0 else min_value
+        ramp = self._ramps.get(id(channel))
+        current = (
+            ramp.value_at(self.clock()) if ramp else float(channel.value or 0.0)
+        )
+        return self.async_ramp(output, channel, target, abs(target - current) / rate)
+
+    @callback
+    def async_stop(self, channel: Any) -> float | None:
+        """Stop a ramp at its current value and return that value."""
+        ramp = self._ramps.pop(id(channel), None)
+        if ramp is None:
+            return None
+        value = ramp.value_at(self.clock())
+        self._async_stage(ramp, value)
+        self._async_resolve(ramp, False)
+        self._async_start_writer()
+        return value
+
+    @callback
+    def async_cancel(self, channels: Iterable[Any]) -> None:
+        """Drop the ramps of channels about to be written directly."""
+        for channel in channels:
+            if (ramp := self._ramps.pop(id(channel), None)) is not None:
+                self._async_resolve(ramp, False)
+                batch = self._pending.get(id(ramp.output))
+                if batch is not None:
+                    batch.unstage(channel)
+
+    async def async_write(self, output: Any, values: list[tuple[Any, float]]) -> None:
+        """Write channel values of an output directly in one push.
+
+        Running ramps of the channels are dropped, and a ramp write of the
+        output that is already in flight is awaited first so it cannot land
+        after the direct values.
+        """
+        self.async_cancel(channel for channel, _ in values)
+        while (in_flight := self._in_flight.get(id(output))) is not None:
+            await asyncio.shield(in_flight)
+        await async_apply_channel_values(output, values)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop the timer and the writer and drop all ramps."""
+        if self._unsub_tick:
+            self._unsub_tick()
+            self._unsub_tick = None
+        if self._writer is not None and not self._writer.done():
+            self._writer.cancel()
+        self._writer = None
+        for ramp in self._ramps.values():
+            self._async_resolve(ramp, False)
+        self._ramps.clear()
+        self._pending.clear()
+
+    @callback
+    def _async_schedule_tick(self) -> None:
+        """Start the shared timer if it is not running."""
+        if self._unsub_tick is None and self._ramps:
+            self._unsub_tick = async_call_later(
+                self.hass, 1 / self.tick_rate, self._async_tick
+            )
+
+    @callback
+    def _async_tick(self, _now: Any = None) -> None:
+        """Advance all ramps and write the new values."""
+        self._unsub_tick = None
+        self.ticks += 1
+        now = self.clock()
+
+        for key, ramp in list(self._ramps.items()):
+            if ramp.finished(now):
+                del self._ramps[key]
+                self._async_stage(ramp, ramp.target)
+                self._async_resolve(ramp, True)
+                continue
+            value = ramp.value_at(now)
+            if abs(value - ramp.last) >= RAMP_MIN_STEP:
+                self._async_stage(ramp, value)
+
+        self._async_start_writer()
+        self._async_schedule_tick()
+
+    @callback
+    def _async_stage(self, ramp: Ramp, value: float) -> None:
+        """Stage a ramp value in the batch of its output."""
+        ramp.last = value
+        batch = self._pending.get(id(ramp.output))
+        if batch is None:
+            batch = self._pending[id(ramp.output)] = ChannelBatch(ramp.output)
+        elif batch.is_staged(ramp.channel):
+            self.coalesced += 1
+        batch.stage(ramp.channel, value)
+
+    @callback
+    def _async_start_writer(self) -> None:
+        """Write the staged values unless a write is already running."""
+        if self._pending and (self._writer is None or self._writer.done()):
+            self._writer = self.hass.async_create_background_task(
+                self._async_write(), f"{DOMAIN}_ramp_write"
+            )
+
+    async def _async_write(self) -> None:
+        """Push the staged values until none are left."""
+        while self._pending:
+            # Take one output at a time so batches still waiting stay in
+            # _pending, where async_cancel can drop their channels
+            key = next(iter(self._pending))
+            batch = self._pending.pop(key)
+            if not batch:
+                continue
+            done = self._in_flight[key] = self.hass.loop.create_future()
+            try:
+                await batch.async_commit()
+            except Exception as err:  # noqa: BLE001 - keep ramping other outputs
+                _LOGGER.warning("Failed to write ramp values: %s", err)
+            finally:
+                del self._in_flight[key]
+                done.set_result(None)
+            self.writes += 1
+
+    @staticmethod
+    def _async_resolve(ramp: Ramp, reached: bool) -> None:
+        """Resolve the future of a finished ramp."""
+        if not ramp.future.done():
+            ramp.future.set_result(reached)
+
+
+@callback
+def async_get_ramp_engine(hass: HomeAssistant) -> RampEngine:
+    """Return the shared ramp engine."""
+    shared = hass.data.setdefault(DOMAIN, {}).setdefault(DOMAIN, {})
+    if DATA_RAMP_ENGINE not in shared:
+        shared[DATA_RAMP_ENGINE] = RampEngine(hass)
+    return shared[DATA_RAMP_ENGINE]
@@ -0,0 +1,148 @@
+"""Service target resolution for digitalSTROM VDC integration."""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+
+from .const import DATA_DEVICE_MANAGER, DATA_RESOLVER, DOMAIN
+
+if TYPE_CHECKING:
+    from .device_manager import DeviceManager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ResolvedDevice:
+    """A VDC device with the config entry and manager it belongs to."""
+
+    entry_id: str
+    device_manager: DeviceManager
+    device: Any
+
+
+class DeviceResolver:
+    """Map HA device ids and dsUIDs to VDC devices in constant time.
+
+    HA device ids are cached after the first registry lookup and dropped on
+    device registry updates. The dsUID index is rebuilt from the device
+    managers on the first miss after devices were added, an entry was
+    unloaded or the device registry changed. Other misses are answered from
+    the current index.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the resolver."""
+        self.hass = hass
+        self._by_device_id: dict[str, ResolvedDevice] = {}
+        self._by_dsuid: dict[str, ResolvedDevice] = {}
+        self._dsuid_index_stale = True
+        self.hits = 0
+        self.misses = 0
+        self.rebuilds = 0
+        self._unsub_registry: CALLBACK_TYPE | None = hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_registry_updated
+        )
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return cache counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "rebuilds": self.rebuilds,
+            "device_ids": len(self._by_device_id),
+            "dsuids": len(self._by_dsuid),
+        }
+
+    @callback
+    def async_resolve_dsuid(self, dsuid: str) -> ResolvedDevice | None:
+        """Resolve a dsUID."""
+        if (resolved := self._by_dsuid.get(dsuid)) is not None:
+            self.hits += 1
+            return resolved
+        self.misses += 1
+        if self._dsuid_index_stale:
+            self._async_rebuild_dsuid_index()
+        return self._by_dsuid.get(dsuid)
+
+    @callback
+    def async_resolve_device_id(self, device_id: str) -> ResolvedDevice | None:
+        """Resolve a Home Assistant device id."""
+        if (resolved := self._by_device_id.get(device_id)) is not None:
+            self.hits += 1
+            return resolved
+        self.misses += 1
+
+        device_entry = dr.async_get(self.hass).async_get(device_id)
+        if device_entry is None:
+            return None
+        for domain, dsuid in device_entry.identifiers:
+            if domain != DOMAIN:
+                continue
+            resolved = self._by_dsuid.get(dsuid)
+            if resolved is None and self._dsuid_index_stale:
+                self._async_rebuild_dsuid_index()
+                resolved = self._by_dsuid.get(dsuid)
+            if resolved is not None and resolved.entry_id in device_entry.config_entries:
+                self._by_device_id[device_id] = resolved
+                return resolved
+        return None
+
+    @callback
+    def async_clear(self) -> None:
+        """Drop all cached resolutions, e.g. after an entry was unloaded."""
+        self._by_device_id.clear()
+        self._by_dsuid.clear()
+        self._dsuid_index_stale = True
+
+    @callback
+    def async_devices_changed(self) -> None:
+        """Rebuild the dsUID index on the next miss."""
+        self._dsuid_index_stale = True
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop listening to device registry updates and drop the resolver."""
+        if self._unsub_registry is not None:
+            self._unsub_registry()
+            self._unsub_registry = None
+        self.async_clear()
+        shared = self.hass.data.get(DOMAIN, {}).get(DOMAIN, {})
+        if shared.get(DATA_RESOLVER) is self:
+            del shared[DATA_RESOLVER]
+
+    @callback
+    def _async_rebuild_dsuid_index(self) -> None:
+        """Index the devices of all loaded entries by dsUID."""
+        index: dict[str, ResolvedDevice] = {}
+        for entry_id, data in self.hass.data.get(DOMAIN, {}).items():
+            if entry_id == DOMAIN or not isinstance(data, dict):
+                continue
+            device_manager = data.get(DATA_DEVICE_MANAGER)
+            if device_manager is None:
+                continue
+            for device in device_manager.get_all_devices():
+                index[device.dSUID] = ResolvedDevice(entry_id, device_manager, device)
+        self._by_dsuid = index
+        self._dsuid_index_stale = False
+        self.rebuilds += 1
+
+    @callback
+    def _async_device_registry_updated(self, event: Event) -> None:
+        """Drop the cached resolution of a changed or removed device."""
+        self._by_device_id.pop(event.data["device_id"], None)
+        self._dsuid_index_stale = True
+
+
+@callback
+def async_get_resolver(hass: HomeAssistant) -> DeviceResolver:
+    """Return the shared resolver."""
+    shared = hass.data.setdefault(DOMAIN, {}).setdefault(DOMAIN, {})
+    if DATA_RESOLVER not in shared:
+        shared[DATA_RESOLVER] = DeviceResolver(hass)
+    return shared[DATA_RESOLVER]
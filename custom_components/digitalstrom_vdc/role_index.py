@@ -0,0 +1,83 @@
+"""Channel and sensor role index for digitalSTROM VDC devices."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Channel roles
+ROLE_BRIGHTNESS = "brightness"
+ROLE_HUE = "hue"
+ROLE_SATURATION = "saturation"
+ROLE_COLOR_TEMPERATURE = "colorTemperature"
+ROLE_POSITION = "position"
+
+# Sensor roles
+ROLE_TEMPERATURE = "temperature"
+
+_EXACT_CHANNEL_ROLES = {
+    ROLE_BRIGHTNESS,
+    ROLE_HUE,
+    ROLE_SATURATION,
+    ROLE_COLOR_TEMPERATURE,
+}
+
+
+def _channel_role(channel_type: Any) -> str | None:
+    """Map a channel type to its role."""
+    channel_type = str(channel_type)
+    if channel_type in _EXACT_CHANNEL_ROLES:
+        return channel_type
+    # Blind channels come in several flavours (shadePositionOutside, ...)
+    if ROLE_POSITION in channel_type.lower():
+        return ROLE_POSITION
+    return None
+
+
+def _sensor_role(sensor_type: Any) -> str | None:
+    """Map a sensor type to its role."""
+    if ROLE_TEMPERATURE in str(sensor_type).lower():
+        return ROLE_TEMPERATURE
+    return None
+
+
+class DeviceRoleIndex:
+    """Map channel and sensor roles of a VdSD to its component objects.
+
+    Indexes are kept per dSUID by the DeviceManager, see
+    DeviceManager.get_role_index.
+    """
+
+    def __init__(self, device: Any) -> None:
+        """Build the index from the device structure."""
+        self.primary_channel: Any | None = None
+        self._channels: dict[str, Any] = {}
+        self._sensors: dict[str, Any] = {}
+
+        output = getattr(device, "output", None)
+        channels = (output.channels or []) if output else []
+        if channels:
+            self.primary_channel = channels[0]
+        for channel in channels:
+            role = _channel_role(getattr(channel, "channel_type", ""))
+            if role:
+                # First channel of a role wins, as with the previous scans
+                self._channels.setdefault(role, channel)
+
+        for sensor in getattr(device, "sensors", None) or []:
+            role = _sensor_role(getattr(sensor, "sensor_type", ""))
+            if role:
+                self._sensors.setdefault(role, sensor)
+
+    def channel(self, role: str) -> Any | None:
+        """Return the output channel for a role."""
+        return self._channels.get(role)
+
+    def sensor(self, role: str) -> Any | None:
+        """Return the sensor for a role."""
+        return self._sensors.get(role)
+
+    def has_channel(self, role: str) -> bool:
+        """Return True if the device has a channel for the role."""
+        return role in self._channels
@@ -0,0 +1,129 @@
+"""Local scene value table for digitalSTROM VDC devices."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from typing import Any
+
+NUM_SCENES = 128
+VALUE_DIGITS = 4
+# Channel values closer than this are the same output state
+MATCH_TOLERANCE = 0.01
+
+# States of a scene in the table
+_UNSAVED = 0
+_SAVED = 1
+# The device has been seen applying the saved values on its own
+_VERIFIED = 2
+
+
+class SceneTable:
+    """Channel values of the 128 digitalSTROM scenes of one device.
+
+    Values are stored row-major in one single precision float array, scene
+    by scene, with a byte per scene marking which scenes have been saved and
+    which of those the device has been seen applying itself.
+    Values are rounded to VALUE_DIGITS decimals when read back, which is well
+    below channel resolution.
+    """
+
+    __slots__ = ("channel_count", "_values", "_saved", "hits", "misses")
+
+    def __init__(self, channel_count: int) -> None:
+        """Initialize an empty table."""
+        self.channel_count = channel_count
+        self._values = array("f", bytes(4 * NUM_SCENES * channel_count))
+        self._saved = bytearray(NUM_SCENES)
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        """Return the size of the table storage."""
+        return self._values.itemsize * len(self._values) + len(self._saved)
+
+    def save(self, scene: int, values: Sequence[float]) -> None:
+        """Store the channel values of a scene."""
+        if len(values) != self.channel_count:
+            raise ValueError(
+                f"Expected {self.channel_count} channel values, got {len(values)}"
+            )
+        offset = scene * self.channel_count
+        self._values[offset : offset + self.channel_count] = array("f", values)
+        self._saved[scene] = _SAVED
+
+    def get(self, scene: int) -> list[float] | None:
+        """Return the channel values of a saved scene."""
+        if not self._saved[scene]:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._row(scene)
+
+    def matches(self, scene: int, values: Sequence[float]) -> bool:
+        """Return whether values equal a saved scene within MATCH_TOLERANCE."""
+        if not self._saved[scene] or len(values) != self.channel_count:
+            return False
+        return all(
+            abs(saved - value) <= MATCH_TOLERANCE
+            for saved, value in zip(self._row(scene), values, strict=True)
+        )
+
+    def is_verified(self, scene: int) -> bool:
+        """Return whether the device applied a saved scene's values itself."""
+        return self._saved[scene] == _VERIFIED
+
+    def verify(self, scene: int) -> None:
+        """Mark a saved scene as applied by the device."""
+        if self._saved[scene]:
+            self._saved[scene] = _VERIFIED
+
+    def unverify_all(self) -> bool:
+        """Require every saved scene to be applied by the device again.
+
+        Returns whether any scene was verified.
+        """
+        changed = False
+        for scene, state in enumerate(self._saved):
+            if state == _VERIFIED:
+                self._saved[scene] = _SAVED
+                changed = True
+        return changed
+
+    def discard(self, scene: int) -> None:
+        """Forget a saved scene."""
+        self._saved[scene] = _UNSAVED
+
+    def _row(self, scene: int) -> list[float]:
+        """Return the rounded channel values of a scene."""
+        offset = scene * self.channel_count
+        return [
+            round(value, VALUE_DIGITS)
+            for value in self._values[offset : offset + self.channel_count]
+        ]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the saved scenes for storage."""
+        return {
+            "channels": self.channel_count,
+            "scenes": {
+                str(scene): self._row(scene)
+                for scene in range(NUM_SCENES)
+                if self._saved[scene]
+            },
+            "verified": [
+                scene
+                for scene in range(NUM_SCENES)
+                if self._saved[scene] == _VERIFIED
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SceneTable:
+        """Create a table from stored data."""
+        table = cls(data["channels"])
+        for scene, values in data["scenes"].items():
+            table.save(int(scene), values)
+        for scene in data.get("verified", ()):
+            table.verify(scene)
+        return table
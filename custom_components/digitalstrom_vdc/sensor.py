@@ -2,16 +2,41 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DATA_COORDINATOR, DATA_DEVICE_MANAGER, DOMAIN
+from .const import (
+    CONF_VDC_NAME,
+    DATA_COORDINATOR,
+    DATA_DEVICE_MANAGER,
+    DATA_METRICS,
+    DATA_VDC_MANAGER,
+    DOMAIN,
+    STATE_ACTIVE,
+    STATE_CONNECTED,
+    STATE_CONNECTING,
+    STATE_DISCONNECTED,
+)
 from .coordinator import DigitalStromVDCCoordinator
+from .metrics import (
+    BINDING_QUEUE_DEPTH,
+    MESSAGES_IN,
+    MESSAGES_OUT,
+    SET_VALUE_LATENCY,
+    MetricsRegistry,
+)
+from .vdc_manager import VDCHostManager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,8 +51,20 @@ async def async_setup_entry(
     coordinator: DigitalStromVDCCoordinator = data[DATA_COORDINATOR]
     device_manager = data[DATA_DEVICE_MANAGER]
 
+    # Diagnostics of the dSS connection
+    vdc_manager: VDCHostManager = data[DATA_VDC_MANAGER]
+    entities: list[SensorEntity] = [
+        DigitalStromVDCConnectionStateSensor(entry, vdc_manager),
+        DigitalStromVDCPingSensor(entry, vdc_manager),
+    ]
+    metrics: MetricsRegistry = data[DATA_METRICS]
+    if metrics.enabled:
+        entities.extend(
+            DigitalStromVDCMetricSensor(entry, vdc_manager, metrics, *description)
+            for description in METRIC_SENSORS
+        )
+
     # Get all devices with sensor inputs
-    entities = []
     for device in device_manager.get_all_devices():
         # Check if device has sensor components
         if hasattr(device, 'sensors') and device.sensors:
@@ -50,7 +87,7 @@ class DigitalStromVDCSensor(CoordinatorEntity, SensorEntity):
         sensor_component: Any,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=vdc_device.dSUID)
         self._vdc_device = vdc_device
         self._sensor = sensor_component
         self._attr_unique_id = f"{vdc_device.dSUID}_{sensor_component.sensor_type}"
@@ -74,3 +111,183 @@ class DigitalStromVDCSensor(CoordinatorEntity, SensorEntity):
             "model": self._vdc_device.model,
             "via_device": (DOMAIN, self.coordinator.vdc_manager.host.dSUID),
         }
+
+
+class DigitalStromVDCConnectionSensor(SensorEntity):
+    """Base class of the dSS connection diagnostic sensors."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, entry: ConfigEntry, vdc_manager: VDCHostManager) -> None:
+        """Initialize the sensor."""
+        self._entry = entry
+        self._vdc_manager = vdc_manager
+
+    async def async_added_to_hass(self) -> None:
+        """Update on connection state changes and ping results."""
+        self.async_on_remove(
+            self._vdc_manager.async_add_connection_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return information about the VDC host."""
+        return {
+            "identifiers": {(DOMAIN, self._vdc_manager.host.dSUID)},
+            "name": self._entry.data[CONF_VDC_NAME],
+            "manufacturer": "digitalSTROM VDC",
+            "model": "Home Assistant VDC",
+        }
+
+
+class DigitalStromVDCConnectionStateSensor(DigitalStromVDCConnectionSensor):
+    """State of the connection to the dSS."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = [
+        STATE_DISCONNECTED,
+        STATE_CONNECTING,
+        STATE_CONNECTED,
+        STATE_ACTIVE,
+    ]
+    _attr_name = "dSS connection"
+
+    def __init__(self, entry: ConfigEntry, vdc_manager: VDCHostManager) -> None:
+        """Initialize the sensor."""
+        super().__init__(entry, vdc_manager)
+        self._attr_unique_id = f"{entry.entry_id}_dss_connection"
+
+    @property
+    def native_value(self) -> str:
+        """Return the connection state."""
+        return self._vdc_manager.connection_state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return reconnection counters and recent state transitions."""
+        stats = self._vdc_manager.connection_stats
+        return {
+            "reconnects": stats.reconnects,
+            "reconnect_attempts": stats.reconnect_attempts,
+            "transitions": list(stats.transitions),
+        }
+
+
+class DigitalStromVDCPingSensor(DigitalStromVDCConnectionSensor):
+    """Round trip time of the keepalive ping to the dSS."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 1
+    _attr_name = "dSS ping"
+
+    def __init__(self, entry: ConfigEntry, vdc_manager: VDCHostManager) -> None:
+        """Initialize the sensor."""
+        super().__init__(entry, vdc_manager)
+        self._attr_unique_id = f"{entry.entry_id}_dss_ping"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the last round trip time."""
+        return self._vdc_manager.connection_stats.last_rtt
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return round trip percentiles and the histogram."""
+        stats = self._vdc_manager.connection_stats
+        return {
+            "p50": stats.rtt_percentile(50),
+            "p95": stats.rtt_percentile(95),
+            "pings": stats.pings,
+            "pings_skipped": stats.pings_skipped,
+            "ping_failures": stats.ping_failures,
+            **stats.rtt_histogram,
+        }
+
+
+def _total(counts: dict[str, int] | None) -> int:
+    """Return the sum of a labelled counter."""
+    return sum((counts or {}).values())
+
+
+# Key, name, metric, value from snapshot, unit, state class
+METRIC_SENSORS: tuple[tuple[Any, ...], ...] = (
+    (
+        "messages_in",
+        "VDC messages received",
+        MESSAGES_IN,
+        _total,
+        None,
+        SensorStateClass.TOTAL_INCREASING,
+    ),
+    (
+        "messages_out",
+        "VDC messages sent",
+        MESSAGES_OUT,
+        _total,
+        None,
+        SensorStateClass.TOTAL_INCREASING,
+    ),
+    (
+        "binding_queue_depth",
+        "Binding write queue",
+        BINDING_QUEUE_DEPTH,
+        lambda value: value,
+        None,
+        SensorStateClass.MEASUREMENT,
+    ),
+    (
+        "set_value_latency",
+        "Channel write latency",
+        SET_VALUE_LATENCY,
+        lambda value: value and value["mean"],
+        UnitOfTime.MILLISECONDS,
+        SensorStateClass.MEASUREMENT,
+    ),
+)
+
+
+class DigitalStromVDCMetricSensor(DigitalStromVDCConnectionSensor):
+    """Optional diagnostic sensor reading a metric, disabled by default."""
+
+    _attr_entity_registry_enabled_default = False
+    _attr_should_poll = True
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        vdc_manager: VDCHostManager,
+        metrics: MetricsRegistry,
+        key: str,
+        name: str,
+        metric: str,
+        value_fn: Callable[[Any], Any],
+        unit: str | None,
+        state_class: SensorStateClass,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(entry, vdc_manager)
+        self._metrics = metrics
+        self._metric = metric
+        self._value_fn = value_fn
+        self._attr_unique_id = f"{entry.entry_id}_metric_{key}"
+        self._attr_name = name
+        self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = state_class
+
+    async def async_added_to_hass(self) -> None:
+        """Poll instead of following connection changes."""
+
+    @property
+    def native_value(self) -> Any:
+        """Return the metric value."""
+        return self._value_fn(self._metrics.value(self._metric))
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the metric detail, e.g. counts per method."""
+        value = self._metrics.value(self._metric)
+        return value if isinstance(value, dict) else None
@@ -10,6 +10,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .channel_batch import async_apply_channel_values
 from .const import DATA_COORDINATOR, DATA_DEVICE_MANAGER, DOMAIN
 from .coordinator import DigitalStromVDCCoordinator
 
@@ -46,7 +47,7 @@ class DigitalStromVDCSwitch(CoordinatorEntity, SwitchEntity):
         vdc_device: Any,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=vdc_device.dSUID)
         self._vdc_device = vdc_device
         self._attr_unique_id = vdc_device.dSUID
         self._attr_name = vdc_device.name
@@ -76,10 +77,12 @@ class DigitalStromVDCSwitch(CoordinatorEntity, SwitchEntity):
         
         # Set output channel to 100 (full on)
         primary_channel = self._vdc_device.output.channels[0]
-        await primary_channel.set_value(100.0)
+        await async_apply_channel_values(
+            self._vdc_device.output, [(primary_channel, 100.0)]
+        )
         
         # Request coordinator update
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_schedule_device_refresh(self._vdc_device.dSUID)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
@@ -91,10 +94,12 @@ class DigitalStromVDCSwitch(CoordinatorEntity, SwitchEntity):
         
         # Set output channel to 0 (off)
         primary_channel = self._vdc_device.output.channels[0]
-        await primary_channel.set_value(0.0)
+        await async_apply_channel_values(
+            self._vdc_device.output, [(primary_channel, 0.0)]
+        )
         
         # Request coordinator update
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_schedule_device_refresh(self._vdc_device.dSUID)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -0,0 +1,87 @@
+"""Multi-device service targets for digitalSTROM VDC integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+from .resolver import ResolvedDevice, async_get_resolver
+
+_LOGGER = logging.getLogger(__name__)
+
+DeviceOperation = Callable[[ResolvedDevice], Awaitable[Any]]
+
+
+def async_resolve_targets(
+    hass: HomeAssistant, call: ServiceCall
+) -> tuple[dict[str, ResolvedDevice], dict[str, str]]:
+    """Resolve the devices, areas and labels of a service call.
+
+    Returns the VDC devices by HA device id and errors for explicitly
+    targeted devices that are not VDC devices. Devices of other integrations
+    in targeted areas or labels are ignored.
+    """
+    resolver = async_get_resolver(hass)
+    explicit = set(call.data.get(ATTR_DEVICE_ID) or [])
+    selected = async_extract_referenced_entity_ids(hass, call)
+
+    targets: dict[str, ResolvedDevice] = {}
+    errors: dict[str, str] = {}
+    for device_id in selected.referenced_devices | explicit:
+        resolved = resolver.async_resolve_device_id(device_id)
+        if resolved is not None:
+            targets[device_id] = resolved
+        elif device_id in explicit:
+            errors[device_id] = "not a digitalSTROM VDC device"
+    return targets, errors
+
+
+async def async_run_on_targets(
+    targets: dict[str, ResolvedDevice],
+    operation: DeviceOperation,
+    max_parallel: int,
+) -> dict[str, Any]:
+    """Run an operation on all targets and report per-device timing.
+
+    At most max_parallel operations run at once.
+    """
+    semaphore = asyncio.Semaphore(max_parallel)
+    results: dict[str, dict[str, Any]] = {}
+    start = time.perf_counter()
+
+    async def run(device_id: str, resolved: ResolvedDevice) -> None:
+        async with semaphore:
+            op_start = time.perf_counter()
+            result: dict[str, Any] = {
+                "dsuid": resolved.device.dSUID,
+                "name": getattr(resolved.device, "name", None),
+            }
+            try:
+                await operation(resolved)
+                result["success"] = True
+            except Exception as err:  # noqa: BLE001 - reported per device
+                _LOGGER.warning(
+                    "Operation failed on %s: %s", resolved.device.dSUID, err
+                )
+                result["success"] = False
+                result["error"] = str(err)
+            result["duration_ms"] = round((time.perf_counter() - op_start) * 1000, 2)
+            results[device_id] = result
+
+    if targets:
+        await asyncio.gather(
+            *(run(device_id, resolved) for device_id, resolved in targets.items())
+        )
+
+    return {
+        "succeeded": sum(result["success"] for result in results.values()),
+        "failed": sum(not result["success"] for result in results.values()),
+        "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+        "devices": results,
+    }
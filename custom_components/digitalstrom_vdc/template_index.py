@@ -0,0 +1,150 @@
+"""Search index over the template catalog of digitalSTROM VDC integration."""
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from typing import Any
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Fields that can be queried as field:value, e.g. vendor:philips
+SEARCH_FIELDS = ("name", "vendor", "type", "binding", "channel")
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Split text into lower case alphanumeric tokens."""
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+def template_tokens(key: str, template: dict[str, Any]) -> frozenset[str]:
+    """Return the plain and field qualified tokens of a catalog entry."""
+    fields: dict[str, list[str]] = {
+        "name": tokenize(template.get("name")) + tokenize(key),
+        "vendor": tokenize(template.get("vendor")),
+        # Types are matched whole, deviceType is one token
+        "type": [template["type"].lower()] if template.get("type") else [],
+        "binding": [
+            token
+            for binding in template.get("bindings") or []
+            for token in tokenize(binding)
+        ],
+        "channel": [
+            token
+            for channel in template.get("channels") or []
+            for token in tokenize(channel)
+        ],
+    }
+    tokens = {token for values in fields.values() for token in values}
+    tokens.update(
+        f"{field}:{token}" for field, values in fields.items() for token in values
+    )
+    return frozenset(tokens)
+
+
+class TemplateIndex:
+    """Inverted index from tokens to template keys.
+
+    Every query term is a prefix: "phil hue" matches any template with a
+    token starting with phil and one starting with hue. A term such as
+    vendor:phil only matches that field. Entries are added and removed one
+    at a time, so a catalog refresh only touches changed templates.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._postings: dict[str, set[str]] = {}
+        self._tokens: dict[str, frozenset[str]] = {}
+        self._sort_keys: dict[str, tuple[str, str]] = {}
+        # Sorted vocabulary for prefix lookups, rebuilt lazily after changes
+        self._vocabulary: list[str] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of indexed templates."""
+        return len(self._tokens)
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a template is indexed."""
+        return key in self._tokens
+
+    def add(self, key: str, template: dict[str, Any]) -> None:
+        """Index a template, replacing an older entry of the same key."""
+        self.remove(key)
+        tokens = template_tokens(key, template)
+        self._tokens[key] = tokens
+        self._sort_keys[key] = ((template.get("name") or key).lower(), key)
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is None:
+                self._postings[token] = {key}
+                self._vocabulary = None
+            else:
+                postings.add(key)
+
+    def remove(self, key: str) -> None:
+        """Drop a template from the index."""
+        tokens = self._tokens.pop(key, None)
+        if tokens is None:
+            return
+        del self._sort_keys[key]
+        for token in tokens:
+            postings = self._postings[token]
+            postings.discard(key)
+            if not postings:
+                del self._postings[token]
+                self._vocabulary = None
+
+    def clear(self) -> None:
+        """Drop all templates."""
+        self._postings.clear()
+        self._tokens.clear()
+        self._sort_keys.clear()
+        self._vocabulary = None
+
+    def keys_with_token(self, token: str) -> set[str]:
+        """Return the keys of templates with an exact token."""
+        return set(self._postings.get(token, ()))
+
+    def _prefix_matches(self, prefix: str) -> set[str]:
+        """Return the keys of templates with a token starting with prefix."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        matches: set[str] = set()
+        position = bisect_left(vocabulary, prefix)
+        while position < len(vocabulary) and vocabulary[position].startswith(prefix):
+            matches |= self._postings[vocabulary[position]]
+            position += 1
+        return matches
+
+    def search(
+        self,
+        query: str = "",
+        template_type: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[int, list[str]]:
+        """Return the number of matches and one page of matching keys.
+
+        Matches are ordered by template name. An empty query matches all
+        templates.
+        """
+        candidates: set[str] | None = None
+        if template_type:
+            candidates = self.keys_with_token(f"type:{template_type.lower()}")
+
+        for term in query.lower().split():
+            field, _, value = term.rpartition(":")
+            if field not in SEARCH_FIELDS:
+                field = ""
+                value = term
+            for token in tokenize(value):
+                matches = self._prefix_matches(f"{field}:{token}" if field else token)
+                candidates = matches if candidates is None else candidates & matches
+                if not candidates:
+                    return 0, []
+
+        if candidates is None:
+            candidates = set(self._tokens)
+        ordered = sorted(candidates, key=self._sort_keys.__getitem__)
+        end = None if limit is None else offset + limit
+        return len(ordered), ordered[offset:end]
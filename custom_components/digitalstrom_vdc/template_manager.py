@@ -2,80 +2,363 @@
 from __future__ import annotations
 
 import logging
+import time
+from collections import OrderedDict
+from pathlib import Path
 from typing import Any
 
+import yaml
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .blueprint import Blueprint, compile_blueprint
+from .const import (
+    BLUEPRINT_CACHE_SIZE,
+    DATA_TEMPLATE_MANAGER,
+    DOMAIN,
+    STORAGE_KEY_TEMPLATE_INDEX,
+    STORAGE_VERSION,
+    TEMPLATE_TYPE_DEVICE,
+)
+from .template_index import TemplateIndex
+
 _LOGGER = logging.getLogger(__name__)
 
+# The C loader is several times faster where libyaml is available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+TEMPLATE_SUFFIXES = (".yaml", ".yml")
+
+# Used when pyvdcapi ships no template files
+BUILTIN_TEMPLATES: dict[str, dict[str, Any]] = {
+    "simple_onoff_light": {
+        "type": "deviceType",
+        "name": "Simple On/Off Light",
+        "description": "Basic on/off light with brightness (0-100%)",
+        "parameters": [],
+        "bindings": ["brightness"],
+    },
+    "dimmable_light_with_scenes": {
+        "type": "deviceType",
+        "name": "Dimmable Light with Scenes",
+        "description": "Dimmer with scene presets",
+        "parameters": [],
+        "bindings": ["brightness"],
+    },
+    "wall_switch_single_button": {
+        "type": "deviceType",
+        "name": "Wall Switch (Single Button)",
+        "description": "Single button wall switch",
+        "parameters": [],
+        "bindings": ["button"],
+    },
+    "motorized_blinds": {
+        "type": "deviceType",
+        "name": "Motorized Blinds",
+        "description": "Position-controlled blinds",
+        "parameters": [],
+        "bindings": ["position"],
+    },
+    "temperature_humidity_sensor": {
+        "type": "deviceType",
+        "name": "Temperature & Humidity Sensor",
+        "description": "Combined climate sensor",
+        "parameters": [],
+        "bindings": ["temperature", "humidity"],
+    },
+    "philips_hue_lily_garden_spot": {
+        "type": "vendorType",
+        "name": "Philips HUE Lily Garden Spot",
+        "description": "Philips HUE RGB+White outdoor spotlight",
+        "parameters": [],
+        "bindings": ["brightness", "hue", "saturation"],
+    },
+}
+
+
+def find_templates_dir() -> Path | None:
+    """Return the template directory of the installed pyvdcapi."""
+    try:
+        import pyvdcapi
+    except ImportError:
+        return None
+    path = Path(pyvdcapi.__file__).parent / "templates"
+    return path if path.is_dir() else None
+
+
+def template_summary(data: dict[str, Any], relative_path: str) -> dict[str, Any]:
+    """Return the catalog entry of a parsed template file.
+
+    The template type defaults to the first directory below the template
+    root (deviceType or vendorType).
+    """
+    parts = relative_path.split("/")
+    default_type = parts[0] if len(parts) > 1 else TEMPLATE_TYPE_DEVICE
+    output = data.get("output") or {}
+    channels = [
+        channel.get("channel_type") or channel.get("type")
+        for channel in output.get("channels") or []
+        if isinstance(channel, dict)
+    ]
+    bindings = data.get("bindings")
+    if bindings is None:
+        bindings = [channel for channel in channels if channel]
+        bindings += [
+            sensor.get("sensor_type") or sensor.get("type")
+            for sensor in data.get("sensors") or []
+            if isinstance(sensor, dict)
+        ]
+        bindings += ["binary_input"] * bool(data.get("binary_inputs"))
+        bindings += ["button"] * bool(data.get("button_inputs"))
+    return {
+        "type": data.get("type") or default_type,
+        "name": data.get("name") or Path(relative_path).stem,
+        "description": data.get("description", ""),
+        "vendor": data.get("vendor"),
+        "parameters": data.get("parameters") or [],
+        "bindings": [binding for binding in bindings if binding],
+        "channels": [channel for channel in channels if channel],
+        "path": relative_path,
+    }
+
+
+def load_template_file(path: Path) -> dict[str, Any] | None:
+    """Read a full template file, None if unreadable. Runs in the executor."""
+    try:
+        with path.open(encoding="utf-8") as file:
+            data = yaml.load(file, Loader=_YAML_LOADER)
+    except (OSError, UnicodeDecodeError, yaml.YAMLError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def scan_templates(
+    root: Path, index: dict[str, dict[str, Any]]
+) -> tuple[dict[str, dict[str, Any]], int]:
+    """Scan a template directory, parsing only new and changed files.
+
+    The index maps each file path relative to root to its mtime, size and
+    catalog entry. Files whose mtime and size match the index are taken from
+    it without being read. Returns the new index and the number of parsed
+    files. Runs in the executor.
+    """
+    new_index: dict[str, dict[str, Any]] = {}
+    parsed = 0
+    for path in sorted(root.rglob("*")):
+        if path.suffix not in TEMPLATE_SUFFIXES:
+            continue
+        relative_path = path.relative_to(root).as_posix()
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        cached = index.get(relative_path)
+        if (
+            cached is not None
+            and cached["mtime"] == stat.st_mtime_ns
+            and cached["size"] == stat.st_size
+        ):
+            new_index[relative_path] = cached
+            continue
+
+        try:
+            with path.open(encoding="utf-8") as file:
+                data = yaml.load(file, Loader=_YAML_LOADER)
+        except (OSError, UnicodeDecodeError, yaml.YAMLError) as err:
+            _LOGGER.warning("Skipping template %s: %s", relative_path, err)
+            continue
+        parsed += 1
+        if not isinstance(data, dict):
+            continue
+        new_index[relative_path] = {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "key": path.stem,
+            "template": template_summary(data, relative_path),
+        }
+    return new_index, parsed
+
+
+def index_by_name(
+    index: dict[str, dict[str, Any]]
+) -> tuple[dict[str, dict[str, Any]], list[str]]:
+    """Key the scanned files by template name, the file stem.
+
+    pyvdcapi creates devices by template name, so two files with the same
+    stem (e.g. deviceType/spot.yaml and vendorType/spot.yaml) cannot both be
+    used. The first in path order is kept. Returns the entries and the
+    relative paths of the files that were left out.
+    """
+    entries: dict[str, dict[str, Any]] = {}
+    duplicates: list[str] = []
+    for relative_path, entry in index.items():
+        kept = entries.setdefault(entry["key"], entry)
+        if kept is not entry:
+            duplicates.append(relative_path)
+            _LOGGER.warning(
+                "Ignoring template %s, its name %s is already used by %s",
+                relative_path,
+                entry["key"],
+                kept["template"]["path"],
+            )
+    return entries, duplicates
+
 
 class TemplateManager:
-    """Manage device templates from pyvdcapi."""
+    """Manage device templates from pyvdcapi.
+
+    The catalog is built from the template files shipped with pyvdcapi. The
+    directory is scanned in the executor, and a persisted index of path,
+    mtime and size means only new or changed files are parsed; a warm start
+    with an unchanged library parses no YAML at all.
 
-    def __init__(self) -> None:
+    Full template files are only read when a device is created from them,
+    and are then compiled into a blueprint kept in a small LRU cache. A
+    cached blueprint is dropped when the mtime or size of its file changes.
+
+    Searches and type filters go through an inverted index that a refresh
+    updates for new, changed and removed templates only.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        templates_dir: Path | None = None,
+        blueprint_cache_size: int = BLUEPRINT_CACHE_SIZE,
+    ) -> None:
         """Initialize template manager."""
+        self.hass = hass
+        self._templates_dir = templates_dir
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY_TEMPLATE_INDEX
+        )
+        self._index: dict[str, dict[str, Any]] | None = None
+        self._entries: dict[str, dict[str, Any]] = {}
         self._available_templates: dict[str, dict[str, Any]] = {}
+        self._search_index = TemplateIndex()
+        self._blueprints: OrderedDict[str, Blueprint] = OrderedDict()
+        self._blueprint_cache_size = blueprint_cache_size
+        self.blueprint_stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self.load_stats: dict[str, Any] | None = None
 
     async def load_templates(self) -> None:
         """Load available templates from pyvdcapi."""
-        _LOGGER.info("Loading device templates")
-        
+        _LOGGER.debug("Loading device templates")
+        start = time.perf_counter()
+
         try:
-            # In a real implementation, we would:
-            # 1. Scan pyvdcapi/templates/ directory
-            # 2. Parse template YAML files
-            # 3. Extract template descriptions
-            # 4. Build UI-friendly template list
-            
-            # For now, we'll define some common templates based on pyvdcapi docs
+            if self._templates_dir is None:
+                self._templates_dir = await self.hass.async_add_executor_job(
+                    find_templates_dir
+                )
+            root = self._templates_dir
+            if root is None:
+                _LOGGER.debug("No pyvdcapi template directory, using built-ins")
+                index: dict[str, dict[str, Any]] = {}
+                parsed = removed = 0
+            else:
+                if self._index is None:
+                    stored = await self._store.async_load() or {}
+                    # An index of another pyvdcapi installation is useless
+                    same_root = stored.get("root") == str(root)
+                    self._index = stored.get("files", {}) if same_root else {}
+
+                index, parsed = await self.hass.async_add_executor_job(
+                    scan_templates, root, self._index
+                )
+                removed = len(self._index.keys() - index.keys())
+                if parsed or removed:
+                    await self._store.async_save({"root": str(root), "files": index})
+                self._index = index
+
+            previous = self._available_templates
+            self._entries, duplicates = index_by_name(index)
             self._available_templates = {
-                "simple_onoff_light": {
-                    "type": "deviceType",
-                    "name": "Simple On/Off Light",
-                    "description": "Basic on/off light with brightness (0-100%)",
-                    "parameters": [],
-                    "bindings": ["brightness"],
-                },
-                "dimmable_light_with_scenes": {
-                    "type": "deviceType",
-                    "name": "Dimmable Light with Scenes",
-                    "description": "Dimmer with scene presets",
-                    "parameters": [],
-                    "bindings": ["brightness"],
-                },
-                "wall_switch_single_button": {
-                    "type": "deviceType",
-                    "name": "Wall Switch (Single Button)",
-                    "description": "Single button wall switch",
-                    "parameters": [],
-                    "bindings": ["button"],
-                },
-                "motorized_blinds": {
-                    "type": "deviceType",
-                    "name": "Motorized Blinds",
-                    "description": "Position-controlled blinds",
-                    "parameters": [],
-                    "bindings": ["position"],
-                },
-                "temperature_humidity_sensor": {
-                    "type": "deviceType",
-                    "name": "Temperature & Humidity Sensor",
-                    "description": "Combined climate sensor",
-                    "parameters": [],
-                    "bindings": ["temperature", "humidity"],
-                },
-                "philips_hue_lily_garden_spot": {
-                    "type": "vendorType",
-                    "name": "Philips HUE Lily Garden Spot",
-                    "description": "Philips HUE RGB+White outdoor spotlight",
-                    "parameters": [],
-                    "bindings": ["brightness", "hue", "saturation"],
-                },
+                key: entry["template"] for key, entry in self._entries.items()
+            } or dict(BUILTIN_TEMPLATES)
+            self._invalidate_blueprints()
+            indexed = self._update_search_index(previous)
+            self.load_stats = {
+                "files": len(index),
+                "parsed": parsed,
+                "removed": removed,
+                "duplicates": duplicates,
+                "indexed": indexed,
+                "seconds": time.perf_counter() - start,
             }
-            
-            _LOGGER.info("Loaded %d templates", len(self._available_templates))
-            
+
+            _LOGGER.info(
+                "Loaded %d templates (%d parsed) in %.3f s",
+                len(self._available_templates),
+                parsed,
+                self.load_stats["seconds"],
+            )
+
         except Exception as err:
             _LOGGER.error("Failed to load templates: %s", err)
             self._available_templates = {}
+            self._search_index.clear()
+
+    def _update_search_index(self, previous: dict[str, dict[str, Any]]) -> int:
+        """Reindex new and changed templates, return how many were indexed.
+
+        Unchanged files keep their catalog entry object across scans, so an
+        identity check finds the changed ones.
+        """
+        for key in previous.keys() - self._available_templates.keys():
+            self._search_index.remove(key)
+        indexed = 0
+        for key, template in self._available_templates.items():
+            if previous.get(key) is not template or key not in self._search_index:
+                self._search_index.add(key, template)
+                indexed += 1
+        return indexed
+
+    def _signature(self, template_name: str) -> tuple[int, int] | None:
+        """Return the mtime and size of a template file, None for built-ins."""
+        entry = self._entries.get(template_name)
+        return (entry["mtime"], entry["size"]) if entry is not None else None
+
+    def _invalidate_blueprints(self) -> None:
+        """Drop blueprints of removed or changed templates."""
+        for name in [
+            name
+            for name, blueprint in self._blueprints.items()
+            if name not in self._available_templates
+            or blueprint.signature != self._signature(name)
+        ]:
+            del self._blueprints[name]
+
+    async def async_get_blueprint(self, template_name: str) -> Blueprint | None:
+        """Return the compiled blueprint of a template, None if unknown.
+
+        Raises InvalidTemplate if the template cannot be compiled.
+        """
+        template = self._available_templates.get(template_name)
+        if template is None:
+            return None
+
+        signature = self._signature(template_name)
+        blueprint = self._blueprints.get(template_name)
+        if blueprint is not None and blueprint.signature == signature:
+            self._blueprints.move_to_end(template_name)
+            self.blueprint_stats["hits"] += 1
+            return blueprint
+
+        self.blueprint_stats["misses"] += 1
+        data: dict[str, Any] | None = None
+        if signature is not None and self._templates_dir is not None:
+            data = await self.hass.async_add_executor_job(
+                load_template_file, self._templates_dir / template["path"]
+            )
+        # Fall back to the catalog entry if the file went away since the scan
+        blueprint = compile_blueprint(template_name, data or template, signature)
+
+        self._blueprints[template_name] = blueprint
+        self._blueprints.move_to_end(template_name)
+        while len(self._blueprints) > self._blueprint_cache_size:
+            self._blueprints.popitem(last=False)
+            self.blueprint_stats["evictions"] += 1
+        return blueprint
 
     def get_available_templates(self) -> dict[str, dict[str, Any]]:
         """Get all available templates."""
@@ -101,8 +384,28 @@ class TemplateManager:
 
     def get_templates_by_type(self, template_type: str) -> dict[str, dict[str, Any]]:
         """Get templates filtered by type (deviceType or vendorType)."""
-        return {
-            name: template
-            for name, template in self._available_templates.items()
-            if template.get("type") == template_type
-        }
+        return self.search_templates(template_type=template_type)[1]
+
+    def search_templates(
+        self,
+        query: str = "",
+        template_type: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[int, dict[str, dict[str, Any]]]:
+        """Search templates by name, vendor, type, binding and channel.
+
+        Returns the number of matches and one page of them ordered by name.
+        See TemplateIndex for the query syntax.
+        """
+        total, keys = self._search_index.search(query, template_type, offset, limit)
+        return total, {key: self._available_templates[key] for key in keys}
+
+
+@callback
+def async_get_template_manager(hass: HomeAssistant) -> TemplateManager:
+    """Return the template manager shared by all entries."""
+    shared = hass.data.setdefault(DOMAIN, {}).setdefault(DOMAIN, {})
+    if DATA_TEMPLATE_MANAGER not in shared:
+        shared[DATA_TEMPLATE_MANAGER] = TemplateManager(hass)
+    return shared[DATA_TEMPLATE_MANAGER]
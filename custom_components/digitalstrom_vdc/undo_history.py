@@ -0,0 +1,57 @@
+"""Bounded undo history for digitalSTROM VDC devices."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+
+from .scene_table import VALUE_DIGITS
+
+
+class UndoHistory:
+    """Ring buffer of channel snapshots taken before scene calls.
+
+    Snapshots are stored in one preallocated single precision float array of
+    depth × channel count. When full, the oldest snapshot is overwritten.
+    """
+
+    __slots__ = ("depth", "channel_count", "_values", "_head", "_size")
+
+    def __init__(self, depth: int, channel_count: int) -> None:
+        """Initialize an empty history."""
+        self.depth = depth
+        self.channel_count = channel_count
+        self._values = array("f", bytes(4 * depth * channel_count))
+        self._head = 0  # slot of the next push
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored snapshots."""
+        return self._size
+
+    @property
+    def memory_bytes(self) -> int:
+        """Return the size of the snapshot storage."""
+        return self._values.itemsize * len(self._values)
+
+    def push(self, values: Sequence[float]) -> None:
+        """Store a snapshot, dropping the oldest one if full."""
+        if len(values) != self.channel_count:
+            raise ValueError(
+                f"Expected {self.channel_count} channel values, got {len(values)}"
+            )
+        offset = self._head * self.channel_count
+        self._values[offset : offset + self.channel_count] = array("f", values)
+        self._head = (self._head + 1) % self.depth
+        self._size = min(self._size + 1, self.depth)
+
+    def pop(self) -> list[float] | None:
+        """Remove and return the most recent snapshot."""
+        if not self._size:
+            return None
+        self._head = (self._head - 1) % self.depth
+        self._size -= 1
+        offset = self._head * self.channel_count
+        return [
+            round(value, VALUE_DIGITS)
+            for value in self._values[offset : offset + self.channel_count]
+        ]
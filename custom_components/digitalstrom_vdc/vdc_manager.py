@@ -2,28 +2,47 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Mapping
 import logging
+import socket
+import time
 from typing import Any
 
 from pyvdcapi import VdcHost
 from pyvdcapi.entities.vdc import Vdc
-from zeroconf import ServiceInfo, Zeroconf
+from zeroconf import ServiceInfo
 from zeroconf.asyncio import AsyncZeroconf
 
-from homeassistant.core import HomeAssistant
+from homeassistant.components import zeroconf
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 
+from .announcer import AnnouncementScheduler
+from .connection import ConnectionStats, backoff_delay
 from .const import (
+    CONF_ANNOUNCE_CONCURRENCY,
+    CONF_ANNOUNCE_RATE,
     CONF_ANNOUNCE_SERVICE,
     CONF_DSUID,
     CONF_PORT,
     CONF_SERVICE_NAME,
     CONF_VDC_NAME,
+    DEFAULT_ANNOUNCE_CONCURRENCY,
+    DEFAULT_ANNOUNCE_RATE,
+    KEEPALIVE_INTERVAL,
     STATE_ACTIVE,
     STATE_CONNECTED,
     STATE_CONNECTING,
     STATE_DISCONNECTED,
 )
 from .errors import CannotConnect, DSSHandshakeFailed
+from .metrics import (
+    DISABLED_METRICS,
+    MESSAGES_IN,
+    MESSAGES_OUT,
+    RECONNECTS,
+    MetricsRegistry,
+)
+from .network import async_get_local_ip
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,16 +50,42 @@ _LOGGER = logging.getLogger(__name__)
 class VDCHostManager:
     """Manage the VDC host and connection to DSS."""
 
-    def __init__(self, hass: HomeAssistant, config: dict[str, Any]) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config: dict[str, Any],
+        options: Mapping[str, Any] | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
         """Initialize VDC manager."""
         self.hass = hass
         self._config = config
+        options = options or {}
+        self.metrics = metrics or DISABLED_METRICS
+        self._messages_in = self.metrics.counter(MESSAGES_IN)
+        self._messages_out = self.metrics.counter(MESSAGES_OUT)
+        self._reconnects = self.metrics.counter(RECONNECTS)
+        self.announcer = AnnouncementScheduler(
+            hass,
+            concurrency=options.get(
+                CONF_ANNOUNCE_CONCURRENCY, DEFAULT_ANNOUNCE_CONCURRENCY
+            ),
+            rate=options.get(CONF_ANNOUNCE_RATE, DEFAULT_ANNOUNCE_RATE),
+            metrics=self.metrics,
+        )
         self._host: VdcHost | None = None
         self._vdc: Vdc | None = None
         self._connection_state = STATE_DISCONNECTED
         self._aiozc: AsyncZeroconf | None = None
         self._service_info: ServiceInfo | None = None
-        self._maintain_task: asyncio.Task | None = None
+        self._monitoring_task: asyncio.Task | None = None
+        self._device_listeners: list[Callable[[str], None]] = []
+        self._connection_listeners: list[Callable[[], None]] = []
+        self.connection_stats = ConnectionStats()
+        self._last_traffic = time.monotonic()
+        # When our last ping answered; traffic at that time proves nothing new
+        self._last_ping: float | None = None
+        self._wake = asyncio.Event()
 
     @property
     def host(self) -> VdcHost:
@@ -61,6 +106,70 @@ class VDCHostManager:
         """Return current connection state."""
         return self._connection_state
 
+    @callback
+    def async_add_connection_listener(
+        self, listener: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Register a listener called on state changes and ping results."""
+        self._connection_listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            if listener in self._connection_listeners:
+                self._connection_listeners.remove(listener)
+
+        return remove_listener
+
+    @callback
+    def _async_set_state(self, state: str) -> None:
+        """Change the connection state and notify listeners."""
+        if state == self._connection_state:
+            return
+        self.connection_stats.record_transition(self._connection_state, state)
+        _LOGGER.debug("dSS connection %s -> %s", self._connection_state, state)
+        self._connection_state = state
+        self._async_notify_connection_listeners()
+
+    @callback
+    def _async_notify_connection_listeners(self) -> None:
+        """Call all connection listeners."""
+        for listener in list(self._connection_listeners):
+            listener()
+
+    @callback
+    def async_add_device_listener(
+        self, listener: Callable[[str], None]
+    ) -> CALLBACK_TYPE:
+        """Register a listener called with the dsUID of a device the DSS changed."""
+        self._device_listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            if listener in self._device_listeners:
+                self._device_listeners.remove(listener)
+
+        return remove_listener
+
+    def config_snapshot(self) -> dict[str, Any]:
+        """Return the vdc_host section of vdc_config.yaml."""
+        return {
+            "name": self._config[CONF_VDC_NAME],
+            "dsuid": self._config[CONF_DSUID],
+            "port": self._config[CONF_PORT],
+        }
+
+    def vdcs_snapshot(self) -> list[dict[str, Any]]:
+        """Return the vdcs section of vdc_config.yaml."""
+        if self._vdc is None:
+            return []
+        return [
+            {
+                "name": self._vdc.name,
+                "dsuid": getattr(self._vdc, "dSUID", None),
+                "model": "Home Assistant VDC",
+            }
+        ]
+
     async def async_initialize(self) -> bool:
         """Initialize VDC host and establish connection."""
         _LOGGER.info("Initializing VDC host")
@@ -103,21 +212,21 @@ class VDCHostManager:
             # Wait for DSS connection and perform handshake
             # In a real implementation, we'd wait for actual connection
             # For now, we'll just set the state
-            self._connection_state = STATE_ACTIVE
+            self._async_set_state(STATE_ACTIVE)
             
             _LOGGER.info("VDC host initialized successfully")
             return True
 
         except Exception as err:
             _LOGGER.error("Failed to initialize VDC host: %s", err)
-            self._connection_state = STATE_DISCONNECTED
+            self._async_set_state(STATE_DISCONNECTED)
             return False
 
     async def _start_server(self) -> None:
         """Start the TCP server."""
         try:
             await self._host.start()
-            self._connection_state = STATE_CONNECTED
+            self._async_set_state(STATE_CONNECTED)
             _LOGGER.info("VDC TCP server started on port %d", self._config[CONF_PORT])
         except Exception as err:
             _LOGGER.error("Failed to start TCP server: %s", err)
@@ -126,12 +235,8 @@ class VDCHostManager:
     async def _announce_service(self, service_name: str, port: int) -> None:
         """Announce VDC service via zeroconf."""
         try:
-            # Get local IP
-            import socket
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            local_ip = s.getsockname()[0]
-            s.close()
+            # Get local IP from the network integration
+            local_ip = await async_get_local_ip(self.hass)
 
             # Create service info
             self._service_info = ServiceInfo(
@@ -145,8 +250,8 @@ class VDCHostManager:
                 },
             )
 
-            # Register service
-            self._aiozc = AsyncZeroconf()
+            # Register service on Home Assistant's shared zeroconf instance
+            self._aiozc = await zeroconf.async_get_async_instance(self.hass)
             await self._aiozc.async_register_service(self._service_info)
             
             _LOGGER.info("VDC service announced via zeroconf: %s", service_name)
@@ -156,48 +261,123 @@ class VDCHostManager:
             # Non-fatal error, continue without announcement
 
     async def async_maintain_connection(self) -> None:
-        """Keep connection alive with DSS."""
+        """Supervise the dSS connection until cancelled.
+
+        While the connection is up, a ping is only sent after
+        KEEPALIVE_INTERVAL seconds without any message from the dSS, and its
+        round trip time is recorded. A lost connection is re-established
+        with exponential backoff and jitter, without ever giving up.
+        """
         _LOGGER.debug("Starting connection monitor")
+        self._monitoring_task = asyncio.current_task()
         
+        try:
+            while True:
+                try:
+                    if self._connection_state == STATE_DISCONNECTED and self._host:
+                        await self._async_reconnect()
+                    else:
+                        await self._async_keepalive()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as err:
+                    _LOGGER.error("Error in connection monitor: %s", err)
+                    await self._async_wait(KEEPALIVE_INTERVAL)
+        except asyncio.CancelledError:
+            _LOGGER.debug("Connection monitor cancelled")
+        finally:
+            self._monitoring_task = None
+
+    async def _async_keepalive(self) -> None:
+        """Ping the dSS if no message arrived during the keepalive interval."""
+        idle = time.monotonic() - self._last_traffic
+        if idle < KEEPALIVE_INTERVAL:
+            # Recent traffic proves the connection, no ping needed. Only a
+            # message other than our own ping saves one.
+            if (
+                self._connection_state == STATE_ACTIVE
+                and self._last_traffic != self._last_ping
+            ):
+                self.connection_stats.pings_skipped += 1
+            await self._async_wait(KEEPALIVE_INTERVAL - idle)
+            return
+        if self._connection_state != STATE_ACTIVE or not self._host:
+            await self._async_wait(KEEPALIVE_INTERVAL)
+            return
+
+        stats = self.connection_stats
+        start = time.monotonic()
+        self._messages_out.inc("ping")
+        try:
+            await asyncio.wait_for(self._host.ping(), stats.ping_timeout)
+        except Exception as err:
+            _LOGGER.warning("Failed to ping DSS: %s", str(err) or "timeout")
+            stats.ping_failures += 1
+            self._async_connection_lost()
+            return
+        self._last_traffic = self._last_ping = time.monotonic()
+        stats.record_rtt(self._last_traffic - start)
+        _LOGGER.debug("PING to DSS took %.1f ms", stats.last_rtt)
+        self._async_notify_connection_listeners()
+
+    async def _async_reconnect(self) -> None:
+        """Reconnect to the dSS, backing off exponentially between attempts."""
+        _LOGGER.info("Attempting to reconnect to DSS")
+        self._async_set_state(STATE_CONNECTING)
+        stats = self.connection_stats
+
+        attempt = 0
         while True:
+            await self._async_wait(backoff_delay(attempt))
+            if self._connection_state == STATE_ACTIVE:
+                # The dSS connected on its own while we waited
+                return
+            stats.reconnect_attempts += 1
             try:
-                await asyncio.sleep(30)  # Check every 30 seconds
-                
-                if self._connection_state == STATE_ACTIVE and self._host:
-                    # Send periodic PING to keep connection alive
-                    try:
-                        await self._host.ping()
-                        _LOGGER.debug("PING sent to DSS")
-                    except Exception as err:
-                        _LOGGER.warning("Failed to ping DSS: %s", err)
-                        self._connection_state = STATE_DISCONNECTED
-                        # Attempt reconnection
-                        await self._attempt_reconnection()
-                
-            except asyncio.CancelledError:
-                _LOGGER.debug("Connection monitor cancelled")
-                break
+                await self._host.reconnect()
             except Exception as err:
-                _LOGGER.error("Error in connection monitor: %s", err)
-                await asyncio.sleep(10)  # Back off on error
+                # Only the first failure is worth a warning, the dSS may be
+                # restarting for a while
+                log = _LOGGER.warning if attempt == 0 else _LOGGER.debug
+                log("Reconnection attempt %d failed: %s", attempt + 1, err)
+                attempt += 1
+                continue
+
+            _LOGGER.info("Reconnection successful after %d attempts", attempt + 1)
+            stats.reconnects += 1
+            self._reconnects.inc()
+            self._last_traffic = time.monotonic()
+            self._async_set_state(STATE_ACTIVE)
+            return
+
+    async def _async_wait(self, delay: float) -> None:
+        """Sleep until the delay passed or the connection state changed."""
+        try:
+            await asyncio.wait_for(self._wake.wait(), delay)
+        except TimeoutError:
+            pass
+        self._wake.clear()
 
     async def async_shutdown(self) -> None:
         """Gracefully shutdown VDC host."""
         _LOGGER.info("Shutting down VDC host")
 
+        # Stop pending announcements
+        await self.announcer.async_shutdown()
+
         # Cancel connection monitor
-        if self._maintain_task and not self._maintain_task.done():
-            self._maintain_task.cancel()
+        if self._monitoring_task and not self._monitoring_task.done():
+            self._monitoring_task.cancel()
             try:
-                await self._maintain_task
+                await self._monitoring_task
             except asyncio.CancelledError:
                 pass
 
         # Unregister zeroconf service
         if self._aiozc and self._service_info:
             try:
+                # The zeroconf instance is shared, only remove our service
                 await self._aiozc.async_unregister_service(self._service_info)
-                await self._aiozc.async_close()
             except Exception as err:
                 _LOGGER.warning("Error unregistering zeroconf service: %s", err)
 
@@ -210,13 +390,19 @@ class VDCHostManager:
             except Exception as err:
                 _LOGGER.warning("Error stopping VDC host: %s", err)
 
-        self._connection_state = STATE_DISCONNECTED
+        self._async_set_state(STATE_DISCONNECTED)
         _LOGGER.info("VDC host shutdown complete")
 
     async def _on_dss_connected(self, dss_session_id: str) -> None:
         """Handle DSS connection event."""
         _LOGGER.info("DSS connected with session ID: %s", dss_session_id)
-        self._connection_state = STATE_ACTIVE
+        self._last_traffic = time.monotonic()
+        self._async_set_state(STATE_ACTIVE)
+        self._wake.set()
+
+        # A new dSS session knows none of our devices, announce them all
+        self.announcer.async_reset()
+        self.announcer.async_announce_all()
         
         # Fire Home Assistant event
         self.hass.bus.async_fire(
@@ -227,40 +413,38 @@ class VDCHostManager:
     async def _on_dss_disconnected(self) -> None:
         """Handle DSS disconnection event."""
         _LOGGER.warning("DSS disconnected")
-        self._connection_state = STATE_DISCONNECTED
-        
+        self._async_connection_lost()
+
+        # The connection monitor reconnects, wake it instead of blocking here
+        self._wake.set()
+
+    @callback
+    def _async_connection_lost(self) -> None:
+        """Reset what a lost dSS connection invalidates.
+
+        Used for both a disconnect reported by the dSS and a failed ping.
+        """
+        self._async_set_state(STATE_DISCONNECTED)
+
+        # The next session knows none of our devices
+        self.announcer.async_reset()
+
         # Fire Home Assistant event
         self.hass.bus.async_fire("digitalstrom_vdc_dss_disconnected", {})
-        
-        # Attempt reconnection
-        await self._attempt_reconnection()
 
     async def _on_message_received(self, message: dict) -> None:
         """Handle incoming message from DSS."""
-        _LOGGER.debug("Message received from DSS: %s", message.get("method", "unknown"))
-
-    async def _attempt_reconnection(self) -> None:
-        """Attempt to reconnect to DSS."""
-        if self._connection_state == STATE_CONNECTING:
-            return  # Already attempting to reconnect
-        
-        _LOGGER.info("Attempting to reconnect to DSS")
-        self._connection_state = STATE_CONNECTING
-        
-        max_attempts = 5
-        for attempt in range(max_attempts):
-            try:
-                await asyncio.sleep(10 * (attempt + 1))  # Exponential backoff
-                
-                # Try to re-establish connection
-                if self._host:
-                    await self._host.reconnect()
-                    _LOGGER.info("Reconnection successful")
-                    self._connection_state = STATE_ACTIVE
-                    return
-                    
-            except Exception as err:
-                _LOGGER.warning("Reconnection attempt %d failed: %s", attempt + 1, err)
-        
-        _LOGGER.error("Failed to reconnect after %d attempts", max_attempts)
-        self._connection_state = STATE_DISCONNECTED
+        method = message.get("method", "unknown")
+        _LOGGER.debug("Message received from DSS: %s", method)
+        self._last_traffic = time.monotonic()
+        self._messages_in.inc(method)
+
+        # Notifications address one or several devices by dsUID
+        dsuids = message.get("dSUID")
+        if not dsuids or not self._device_listeners:
+            return
+        if isinstance(dsuids, str):
+            dsuids = [dsuids]
+        for dsuid in dsuids:
+            for listener in self._device_listeners:
+                listener(dsuid)
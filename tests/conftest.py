@@ -31,6 +31,26 @@ def socket_enabled(socket_enabled):
     yield
 
 
+@pytest.fixture(autouse=True)
+def mock_local_ip_probe():
+    """Answer local IP lookups without the network integration."""
+    with patch(
+        "homeassistant.components.network.async_get_source_ip",
+        return_value="192.168.1.10",
+    ) as probe:
+        yield probe
+
+
+@pytest.fixture(autouse=True)
+def mock_config_file_write():
+    """Keep vdc_config.yaml out of the test config directory."""
+    with patch(
+        "custom_components.digitalstrom_vdc.config_writer.ConfigWriter._write",
+        return_value=0,
+    ) as write:
+        yield write
+
+
 @pytest.fixture
 def mock_vdc_host():
     """Return a mocked VdcHost."""
@@ -55,6 +75,14 @@ def mock_vdc():
     return mock
 
 
+@pytest.fixture
+def device_manager(mock_vdc):
+    """Return a device manager for the mocked Vdc."""
+    from custom_components.digitalstrom_vdc.device_manager import DeviceManager
+
+    return DeviceManager(mock_vdc, MagicMock())
+
+
 @pytest.fixture
 def mock_vdsd():
     """Return a mocked VdSD device."""
@@ -191,6 +219,7 @@ def mock_coordinator():
     """Return a mocked coordinator."""
     mock = MagicMock()
     mock.async_request_refresh = AsyncMock()
+    mock.async_schedule_device_refresh = MagicMock()
     mock.data = {}
     return mock
 
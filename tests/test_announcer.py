@@ -0,0 +1,89 @@
+"""Tests for the device announcement scheduler."""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+
+
+def _device(dsuid: str) -> MagicMock:
+    """Return a mocked VdSD that can be announced."""
+    device = MagicMock()
+    device.dSUID = dsuid
+    device.name = dsuid
+    device.output.channels = []
+    device.sensors = []
+    device.binary_inputs = []
+    device.button_inputs = []
+    device.announce = AsyncMock()
+    return device
+
+
+async def test_announce_retry_and_unchanged_skip(hass: HomeAssistant):
+    """Test concurrent announcements with retries and content hash skipping."""
+    from custom_components.digitalstrom_vdc.announcer import AnnouncementScheduler
+
+    scheduler = AnnouncementScheduler(hass, concurrency=4, rate=1000.0)
+    devices = [_device(f"dsuid-{number}") for number in range(20)]
+    failures = [ConnectionError("busy")]
+
+    async def announce_once_failing():
+        # Fails on the first call only
+        if failures:
+            raise failures.pop()
+
+    devices[3].announce.side_effect = announce_once_failing
+
+    with patch(
+        "custom_components.digitalstrom_vdc.announcer.ANNOUNCE_RETRY_DELAY", 0
+    ):
+        assert await scheduler.async_announce_many(devices) == [True] * 20
+
+        assert scheduler.retries == 1
+        assert devices[3].announce.await_count == 2
+        assert all(scheduler.is_announced(device.dSUID) for device in devices)
+
+        # Unchanged devices are not announced again
+        assert await scheduler.async_announce_many(devices) == [True] * 20
+        assert scheduler.skipped_unchanged == 20
+        assert devices[0].announce.await_count == 1
+
+        # After the dSS reconnected everything is announced again
+        scheduler.device_provider = lambda: devices
+        scheduler.async_reset()
+        for future in scheduler.async_announce_all():
+            assert await future
+        assert devices[0].announce.await_count == 2
+        assert devices[3].announce.await_count == 3
+        assert scheduler.retries == 1
+
+    await scheduler.async_shutdown()
+
+
+async def test_reset_during_announce_announces_again(hass: HomeAssistant):
+    """Test that an announcement in flight during a reset is not recorded."""
+    import asyncio
+
+    from custom_components.digitalstrom_vdc.announcer import AnnouncementScheduler
+
+    scheduler = AnnouncementScheduler(hass, concurrency=1, rate=1000.0)
+    device = _device("dsuid-1")
+    release = asyncio.Event()
+
+    async def announce_slowly():
+        await release.wait()
+
+    device.announce.side_effect = announce_slowly
+
+    future = scheduler.async_queue(device)
+    await asyncio.sleep(0)
+    assert device.announce.await_count == 1
+
+    # The dSS session the announcement went to is gone
+    scheduler.async_reset()
+    release.set()
+
+    assert await future
+    assert device.announce.await_count == 2
+    assert scheduler.is_announced(device.dSUID)
+    assert scheduler.announced == 1
+
+    await scheduler.async_shutdown()
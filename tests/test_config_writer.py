@@ -0,0 +1,53 @@
+"""Tests for the vdc_config.yaml writer."""
+import pytest
+import yaml
+from homeassistant.core import HomeAssistant
+
+
+@pytest.fixture(autouse=True)
+def mock_config_file_write():
+    """Write real files, the tests use tmp_path."""
+    yield
+
+
+async def test_dirty_sections_flush_atomically(hass: HomeAssistant, tmp_path):
+    """Test that changes are debounced and written with a backup."""
+    from custom_components.digitalstrom_vdc.config_writer import ConfigWriter
+
+    path = str(tmp_path / "vdc_config.yaml")
+    vdsds = [{"dsuid": "dsuid-1", "name": "Lamp"}]
+    host_calls = 0
+
+    def host_snapshot():
+        nonlocal host_calls
+        host_calls += 1
+        return {"name": "Test VDC", "port": 8444}
+
+    writer = ConfigWriter(hass, path)
+    writer.async_register_section("vdc_host", host_snapshot)
+    writer.async_register_section("vdsds", lambda: vdsds)
+    await writer.async_flush()
+
+    with open(path, encoding="utf-8") as config_file:
+        assert yaml.safe_load(config_file) == {
+            "vdc_host": {"name": "Test VDC", "port": 8444},
+            "vdsds": vdsds,
+        }
+
+    # A storm of edits to one section results in one write of that section
+    for number in range(2, 50):
+        vdsds.append({"dsuid": f"dsuid-{number}", "name": "Lamp"})
+        writer.async_mark_dirty("vdsds")
+    await writer.async_flush()
+
+    assert writer.flushes == 2
+    assert host_calls == 1
+    assert (tmp_path / "vdc_config.yaml.bak").exists()
+    with open(path, encoding="utf-8") as config_file:
+        assert len(yaml.safe_load(config_file)["vdsds"]) == 49
+
+    # Flushing unchanged content does not rewrite the file
+    writer.async_mark_dirty("vdsds")
+    await writer.async_flush()
+    assert writer.writes_skipped == 1
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,37 @@
+"""Tests for the dSS connection supervision helpers."""
+from unittest.mock import patch
+
+
+def test_backoff_delay_is_capped_and_jittered():
+    """Test the reconnection backoff."""
+    from custom_components.digitalstrom_vdc.connection import backoff_delay
+    from custom_components.digitalstrom_vdc.const import (
+        RECONNECT_BASE_DELAY,
+        RECONNECT_MAX_DELAY,
+    )
+
+    assert RECONNECT_BASE_DELAY / 2 <= backoff_delay(0) <= RECONNECT_BASE_DELAY
+    assert RECONNECT_MAX_DELAY / 2 <= backoff_delay(50) <= RECONNECT_MAX_DELAY
+    with patch("random.uniform", side_effect=lambda low, high: high):
+        assert backoff_delay(3) == RECONNECT_BASE_DELAY * 8
+
+
+def test_rtt_histogram_and_adaptive_timeout():
+    """Test round trip statistics."""
+    from custom_components.digitalstrom_vdc.connection import ConnectionStats
+    from custom_components.digitalstrom_vdc.const import PING_TIMEOUT_MIN
+
+    stats = ConnectionStats()
+    for rtt in (0.004, 0.020, 0.020, 2.0):
+        stats.record_rtt(rtt)
+
+    histogram = stats.rtt_histogram
+    assert histogram["le_5ms"] == 1
+    assert histogram["le_25ms"] == 2
+    assert histogram["gt_1000ms"] == 1
+    assert stats.rtt_percentile(50) == 20.0
+    assert stats.ping_timeout == 8.0
+
+    fast = ConnectionStats()
+    fast.record_rtt(0.001)
+    assert fast.ping_timeout == PING_TIMEOUT_MIN
@@ -0,0 +1,75 @@
+"""Tests for the data update coordinator."""
+import asyncio
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+
+
+async def test_push_update_only_notifies_dirty_device(hass: HomeAssistant):
+    """Test that a pushed change only updates entities of that device."""
+    from custom_components.digitalstrom_vdc.coordinator import (
+        DigitalStromVDCCoordinator,
+    )
+
+    vdc_manager = MagicMock()
+    coordinator = DigitalStromVDCCoordinator(hass, vdc_manager)
+    vdc_manager.async_add_device_listener.assert_called_once_with(
+        coordinator.async_mark_device_dirty
+    )
+
+    device_a = MagicMock()
+    device_b = MagicMock()
+    remove_a = coordinator.async_add_listener(device_a, "dsuid-a")
+    remove_b = coordinator.async_add_listener(device_b, "dsuid-b")
+
+    # Several changes within one loop iteration collapse into one update
+    coordinator.async_mark_device_dirty("dsuid-a")
+    coordinator.async_mark_device_dirty("dsuid-a")
+    await asyncio.sleep(0)
+
+    device_a.assert_called_once()
+    device_b.assert_not_called()
+
+    # Removed listeners get no more pushes
+    remove_a()
+    coordinator.async_mark_device_dirty("dsuid-a")
+    await asyncio.sleep(0)
+    device_a.assert_called_once()
+
+    remove_b()
+    await coordinator.async_shutdown()
+
+
+async def test_command_refreshes_are_coalesced(hass: HomeAssistant):
+    """Test that refresh requests inside the window collapse into one update."""
+    from datetime import timedelta
+
+    from homeassistant.util import dt as dt_util
+    from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+    from custom_components.digitalstrom_vdc.coordinator import (
+        DigitalStromVDCCoordinator,
+    )
+
+    coordinator = DigitalStromVDCCoordinator(hass, MagicMock())
+    lights = {dsuid: MagicMock() for dsuid in ("dsuid-1", "dsuid-2", "dsuid-3")}
+    removers = [
+        coordinator.async_add_listener(update_callback, dsuid)
+        for dsuid, update_callback in lights.items()
+    ]
+
+    for _ in range(10):
+        coordinator.async_schedule_device_refresh("dsuid-1")
+        coordinator.async_schedule_device_refresh("dsuid-2")
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    lights["dsuid-1"].assert_called_once()
+    lights["dsuid-2"].assert_called_once()
+    lights["dsuid-3"].assert_not_called()
+    assert coordinator.refresh_stats == {"requested": 20, "run": 1, "saved": 19}
+
+    for remove_listener in removers:
+        remove_listener()
+    await coordinator.async_shutdown()
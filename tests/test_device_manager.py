@@ -172,3 +172,281 @@ async def test_get_all_devices(mock_vdc, mock_vdsd):
     
     assert len(devices) == 2
     assert all(d == mock_vdsd for d in devices)
+
+
+async def test_restore_devices_from_store(hass: HomeAssistant, mock_vdc, mock_vdsd):
+    """Test that stored devices are recreated on startup."""
+    from custom_components.digitalstrom_vdc.device_manager import DeviceManager
+    from custom_components.digitalstrom_vdc.device_store import DeviceStore
+
+    mock_vdc.create_vdsd_from_template = MagicMock(return_value=mock_vdsd)
+
+    manager = DeviceManager(mock_vdc, hass, DeviceStore(hass, "entry-1"))
+    await manager.create_device_from_template(
+        template_name="light_dimmer",
+        instance_name="Living Room Light",
+        parameters={"channel_type": "brightness"},
+        entity_bindings={},
+    )
+    await manager._device_store.async_flush()
+
+    # A fresh manager, as after a restart, rebuilds the device in one pass
+    mock_vdc.create_vdsd_from_template.reset_mock()
+    restarted = DeviceManager(mock_vdc, hass, DeviceStore(hass, "entry-1"))
+    assert await restarted.async_restore_devices() == 1
+
+    mock_vdc.create_vdsd_from_template.assert_called_once_with(
+        template_name="light_dimmer",
+        instance_name="Living Room Light",
+        channel_type="brightness",
+    )
+    assert restarted.get_device(mock_vdsd.dSUID) is mock_vdsd
+    assert restarted.restore_stats["failed"] == 0
+
+
+async def test_create_devices_bulk(mock_vdc):
+    """Test bulk creation with per-item report and batched announcements."""
+    from custom_components.digitalstrom_vdc.device_manager import DeviceManager
+
+    devices = []
+
+    def create_vdsd_from_template(template_name, instance_name, **parameters):
+        if template_name == "missing":
+            raise ValueError("Template not found")
+        device = MagicMock()
+        device.dSUID = f"dsuid-{instance_name}"
+        device.announce = AsyncMock()
+        devices.append(device)
+        return device
+
+    mock_vdc.create_vdsd_from_template = MagicMock(side_effect=create_vdsd_from_template)
+    manager = DeviceManager(mock_vdc, MagicMock())
+
+    specs = [
+        {"kind": "template", "template_name": "light_dimmer", "instance_name": f"L{i}"}
+        for i in range(5)
+    ]
+    specs.append({"kind": "template", "template_name": "missing", "instance_name": "X"})
+
+    report = await manager.async_create_devices_bulk(
+        specs, max_parallel=2, announce_batch_size=2
+    )
+
+    assert report["created"] == 5
+    assert report["failed"] == 1
+    assert report["items"][5]["status"] == "failed"
+    assert all(item["announced"] for item in report["items"][:5])
+    assert all(device.announce.await_count == 1 for device in devices)
+    assert len(manager.get_all_devices()) == 5
+
+
+async def test_create_devices_bulk_validates_up_front(mock_vdc):
+    """Test that an invalid spec prevents any creation."""
+    from custom_components.digitalstrom_vdc.device_manager import DeviceManager
+
+    manager = DeviceManager(mock_vdc, MagicMock())
+    report = await manager.async_create_devices_bulk(
+        [
+            {"kind": "template", "template_name": "light_dimmer", "instance_name": "A"},
+            {"kind": "manual", "device_config": {}},
+        ]
+    )
+
+    assert [item["status"] for item in report["items"]] == ["skipped", "invalid"]
+    mock_vdc.create_vdsd_from_template.assert_not_called()
+
+
+async def test_create_devices_bulk_checks_blueprints_up_front(mock_vdc):
+    """Test that unknown templates and bad parameters prevent any creation."""
+    from custom_components.digitalstrom_vdc.blueprint import compile_blueprint
+    from custom_components.digitalstrom_vdc.device_manager import DeviceManager
+
+    dimmer = compile_blueprint(
+        "light_dimmer", {"parameters": [{"name": "zone", "type": "int"}]}
+    )
+    template_manager = MagicMock()
+    template_manager.async_get_blueprint = AsyncMock(
+        side_effect=lambda name: dimmer if name == "light_dimmer" else None
+    )
+    manager = DeviceManager(mock_vdc, MagicMock(), template_manager=template_manager)
+
+    report = await manager.async_create_devices_bulk(
+        [
+            {
+                "kind": "template",
+                "template_name": "light_dimmer",
+                "instance_name": "A",
+                "parameters": {"zone": 1},
+            },
+            {"kind": "template", "template_name": "light_dimmer", "instance_name": "B"},
+            {"kind": "template", "template_name": "missing", "instance_name": "C"},
+        ]
+    )
+
+    statuses = [item["status"] for item in report["items"]]
+    assert statuses == ["skipped", "invalid", "invalid"]
+    assert "missing" in report["items"][2]["error"]
+    mock_vdc.create_vdsd_from_template.assert_not_called()
+
+
+async def test_saved_scene_is_recalled_locally(mock_vdc, mock_vdsd):
+    """Test that verified scenes are pushed in one batch instead of called."""
+    from custom_components.digitalstrom_vdc.device_manager import DeviceManager
+
+    channels = [MagicMock(value=80.0), MagicMock(value=20.5)]
+    for channel in channels:
+        channel.set_value = AsyncMock()
+    mock_vdsd.output.channels = channels
+    mock_vdsd.save_scene = AsyncMock()
+    mock_vdsd.call_scene = AsyncMock()
+
+    manager = DeviceManager(mock_vdc, MagicMock())
+    await manager.async_save_scene(mock_vdsd, 17)
+
+    # The first call is left to the device, which verifies the saved values
+    await manager.async_call_scene(mock_vdsd, 17)
+    mock_vdsd.call_scene.assert_awaited_once_with(17)
+    channels[1].set_value.assert_not_called()
+
+    # Verified table values are written locally without calling the device
+    await manager.async_call_scene(mock_vdsd, 17)
+    mock_vdsd.call_scene.assert_awaited_once_with(17)
+    channels[0].set_value.assert_awaited_once_with(80.0, apply_now=False)
+    channels[1].set_value.assert_awaited_once_with(20.5)
+
+    # Unknown scenes are only sent to the device
+    await manager.async_call_scene(mock_vdsd, 18)
+    mock_vdsd.call_scene.assert_awaited_with(18)
+    assert channels[1].set_value.await_count == 1
+    assert manager.scene_stats["hits"] == 2
+    assert manager.scene_stats["misses"] == 1
+
+    # Local priority may make the device ignore calls, so verify again
+    await manager.async_set_local_priority(mock_vdsd, 17)
+    mock_vdsd.set_local_prio.assert_awaited_once_with(17)
+    await manager.async_call_scene(mock_vdsd, 17)
+    mock_vdsd.call_scene.assert_awaited_with(17)
+    assert mock_vdsd.call_scene.await_count == 3
+    assert channels[1].set_value.await_count == 1
+
+
+async def test_stale_scene_is_dropped(mock_vdc, mock_vdsd):
+    """Test that scenes the device does not apply are dropped from the table."""
+    from custom_components.digitalstrom_vdc.device_manager import DeviceManager
+
+    channels = [MagicMock(value=80.0), MagicMock(value=20.5)]
+    for channel in channels:
+        channel.set_value = AsyncMock()
+    mock_vdsd.output.channels = channels
+    mock_vdsd.save_scene = AsyncMock()
+
+    # A dontCare scene leaves the outputs alone and never verifies
+    async def leave_outputs(scene):
+        channels[0].value = 10.0
+
+    mock_vdsd.call_scene = AsyncMock(side_effect=leave_outputs)
+
+    manager = DeviceManager(mock_vdc, MagicMock())
+    await manager.async_save_scene(mock_vdsd, 17)
+    await manager.async_call_scene(mock_vdsd, 17)
+    await manager.async_call_scene(mock_vdsd, 17)
+    channels[1].set_value.assert_not_called()
+    assert manager.scene_stats["hits"] == 1
+    assert manager.scene_stats["misses"] == 1
+
+
+def test_scene_table_round_trip():
+    """Test the scene table storage format."""
+    from custom_components.digitalstrom_vdc.scene_table import SceneTable
+
+    table = SceneTable(3)
+    table.save(5, [0.0, 50.0, 100.0])
+    table.save(127, [1.5, 2.25, 3.0])
+    table.verify(127)
+
+    restored = SceneTable.from_dict(table.as_dict())
+    assert restored.get(5) == [0.0, 50.0, 100.0]
+    assert restored.get(127) == [1.5, 2.25, 3.0]
+    assert restored.get(0) is None
+    assert restored.is_verified(127)
+    assert not restored.is_verified(5)
+    assert table.memory_bytes == 128 * 3 * 4 + 128
+
+
+async def test_undo_restores_snapshot_in_one_batch(mock_vdc, mock_vdsd):
+    """Test that undo restores the values from before the scene call."""
+    from custom_components.digitalstrom_vdc.device_manager import DeviceManager
+
+    channels = [MagicMock(value=10.0), MagicMock(value=30.0)]
+    for channel in channels:
+        channel.set_value = AsyncMock()
+    mock_vdsd.output.channels = channels
+    mock_vdsd.call_scene = AsyncMock()
+    mock_vdsd.undo_scene = AsyncMock()
+
+    manager = DeviceManager(mock_vdc, MagicMock(), undo_depth=2)
+    await manager.async_call_scene(mock_vdsd, 5)
+    channels[0].value, channels[1].value = 100.0, 100.0
+
+    await manager.async_undo_scene(mock_vdsd)
+    mock_vdsd.undo_scene.assert_not_called()
+    channels[0].set_value.assert_awaited_once_with(10.0, apply_now=False)
+    channels[1].set_value.assert_awaited_once_with(30.0)
+    assert manager.undo_memory_report()[mock_vdsd.dSUID] == {
+        "snapshots": 0,
+        "depth": 2,
+        "memory_bytes": 2 * 2 * 4,
+    }
+
+    # An empty history leaves undo to the device
+    await manager.async_undo_scene(mock_vdsd)
+    mock_vdsd.undo_scene.assert_awaited_once()
+
+
+def test_undo_history_drops_oldest():
+    """Test that the ring buffer keeps only the newest snapshots."""
+    from custom_components.digitalstrom_vdc.undo_history import UndoHistory
+
+    history = UndoHistory(2, 1)
+    for value in (1.0, 2.0, 3.0):
+        history.push([value])
+
+    assert len(history) == 2
+    assert history.pop() == [3.0]
+    assert history.pop() == [2.0]
+    assert history.pop() is None
+
+
+async def test_create_device_from_blueprint(mock_vdc, mock_vdsd):
+    """Test that binding names are mapped through the template blueprint."""
+    from custom_components.digitalstrom_vdc.blueprint import compile_blueprint
+    from custom_components.digitalstrom_vdc.device_manager import DeviceManager
+
+    hass = MagicMock()
+    template_manager = MagicMock()
+    template_manager.async_get_blueprint = AsyncMock(
+        return_value=compile_blueprint(
+            "light_dimmer",
+            {
+                "bindings": ["brightness"],
+                "parameters": [{"name": "zone", "type": "int", "default": 0}],
+            },
+        )
+    )
+    mock_vdc.create_vdsd_from_template = MagicMock(return_value=mock_vdsd)
+    manager = DeviceManager(mock_vdc, hass, template_manager=template_manager)
+    manager.setup_entity_binding = AsyncMock()
+
+    await manager.create_device_from_template(
+        template_name="light_dimmer",
+        instance_name="Test Light",
+        parameters={},
+        entity_bindings={"brightness": "light.test"},
+    )
+
+    mock_vdc.create_vdsd_from_template.assert_called_once_with(
+        template_name="light_dimmer", instance_name="Test Light", zone=0
+    )
+    manager.setup_entity_binding.assert_awaited_once_with(
+        mock_vdsd, "output_channel_0", "light.test"
+    )
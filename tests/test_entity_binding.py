@@ -171,22 +171,25 @@ async def test_unregister_binding(mock_output_channel):
     assert "light.living_room" not in registry._bindings
 
 
-async def test_binding_cleanup():
+async def test_binding_cleanup(mock_output_channel, mock_sensor):
     """Test binding cleanup on shutdown."""
     from custom_components.digitalstrom_vdc.entity_binding import BindingRegistry
     
     hass = MagicMock()
     registry = BindingRegistry(hass)
+    bindings = registry._bindings
     
     # Add some bindings
-    registry._bindings = {
-        "light.test": {"channel": MagicMock()},
-        "sensor.test": {"sensor": MagicMock()},
-    }
+    await registry.register_channel_binding("light.test", mock_output_channel)
+    await registry.register_sensor_binding("sensor.test", mock_sensor)
+    assert len(bindings) == 2
     
     await registry.async_cleanup()
     
+    # The view is cleared in place, not replaced
+    assert registry._bindings is bindings
     assert len(registry._bindings) == 0
+    assert not registry._entity_index
 
 
 async def test_concurrent_binding_operations(mock_output_channel, mock_sensor):
@@ -212,3 +215,263 @@ async def test_concurrent_binding_operations(mock_output_channel, mock_sensor):
     )
     
     assert len(registry._bindings) == 2
+
+
+async def test_ha_to_vdc_writes_are_coalesced(mock_output_channel):
+    """Test that a burst of HA updates collapses into in-flight + latest write."""
+    import asyncio
+
+    from custom_components.digitalstrom_vdc.entity_binding import (
+        BindingType,
+        EntityBinding,
+    )
+
+    release = asyncio.Event()
+
+    async def slow_set_value(value):
+        await release.wait()
+
+    mock_output_channel.set_value = AsyncMock(side_effect=slow_set_value)
+    hass = MagicMock()
+    hass.async_create_task = asyncio.ensure_future
+
+    binding = EntityBinding(
+        hass, "light.living_room", mock_output_channel, BindingType.OUTPUT
+    )
+
+    binding.async_queue_write(State("light.living_room", STATE_ON, {"brightness": 1}))
+    await asyncio.sleep(0)  # Let the first write start and block
+
+    for brightness in range(2, 41):
+        binding.async_queue_write(
+            State("light.living_room", STATE_ON, {"brightness": brightness})
+        )
+
+    release.set()
+    await binding._write_task
+
+    assert mock_output_channel.set_value.call_count == 2
+    mock_output_channel.set_value.assert_called_with((40 / 255.0) * 100.0)
+    assert binding.write_stats["requested"] == 40
+    assert binding.write_stats["completed"] == 2
+    assert binding.write_stats["coalesced"] == 38
+
+    # A failed write is counted apart from the completed ones
+    mock_output_channel.set_value = AsyncMock(side_effect=OSError("timeout"))
+    binding.async_queue_write(State("light.living_room", STATE_ON, {"brightness": 9}))
+    await binding._write_task
+    assert binding.write_stats["completed"] == 2
+    assert binding.write_stats["failed"] == 1
+
+
+async def test_shared_state_change_dispatcher(mock_output_channel):
+    """Test that output bindings share one state-change subscription."""
+    from custom_components.digitalstrom_vdc.entity_binding import (
+        BindingRegistry,
+        BindingType,
+        EntityBinding,
+    )
+
+    hass = MagicMock()
+    unsub = MagicMock()
+    hass.bus.async_listen = MagicMock(return_value=unsub)
+    other_channel = MagicMock(set_value=AsyncMock())
+
+    registry = BindingRegistry(hass)
+    await registry.register_channel_binding("light.room1", mock_output_channel)
+    await registry.async_add_binding(
+        "light.room1_copy", "light.room1", other_channel, BindingType.OUTPUT
+    )
+    await registry.register_channel_binding("light.room2", other_channel)
+
+    hass.bus.async_listen.assert_called_once()
+    event_filter = hass.bus.async_listen.call_args.kwargs["event_filter"]
+    assert event_filter({"entity_id": "light.room1"})
+    assert not event_filter({"entity_id": "light.unbound"})
+
+    # Bindings are slotted, so the method is patched on the class
+    new_state = State("light.room1", STATE_ON, {"brightness": 255})
+    with patch.object(EntityBinding, "async_queue_write") as queue_write:
+        registry._async_dispatch_state_changed(
+            MagicMock(data={"entity_id": "light.room1", "new_state": new_state})
+        )
+    assert queue_write.call_count == 2
+    queue_write.assert_called_with(new_state)
+
+    await registry.unregister_binding("light.room1")
+    await registry.unregister_binding("light.room1_copy")
+    unsub.assert_not_called()
+    await registry.async_remove_all()
+    unsub.assert_called_once()
+
+
+async def test_sensor_deadband_and_max_age(mock_sensor):
+    """Test that sensor jitter is suppressed before events are fired."""
+    from custom_components.digitalstrom_vdc.entity_binding import (
+        BindingRegistry,
+        SensorFilter,
+    )
+
+    hass = MagicMock()
+    registry = BindingRegistry(hass)
+    await registry.register_sensor_binding(
+        entity_id="sensor.temperature",
+        sensor=mock_sensor,
+        sensor_filter=SensorFilter(absolute_deadband=0.1, max_age=600.0),
+    )
+    callback = mock_sensor.on_value_changed.call_args[0][0]
+
+    with patch(
+        "custom_components.digitalstrom_vdc.entity_binding.time.monotonic",
+        side_effect=[0.0, 1.0, 2.0, 700.0],
+    ):
+        await callback(21.00)  # First value is always reported
+        await callback(21.01)  # Jitter below deadband
+        await callback(21.20)  # Significant change
+        await callback(21.21)  # Below deadband but older than max_age
+
+    assert hass.bus.async_fire.call_count == 3
+    binding = registry.get_binding("sensor.temperature")
+    assert binding.filter_stats == {
+        "reported": 3,
+        "suppressed_deadband": 1,
+        "rate_limited": 0,
+        "forced": 1,
+    }
+
+
+async def test_sensor_rate_limit_reports_deferred_value_once(mock_sensor):
+    """Test that a held back value is reported once the interval has passed."""
+    from custom_components.digitalstrom_vdc.entity_binding import (
+        BindingRegistry,
+        SensorFilter,
+    )
+
+    hass = MagicMock()
+    registry = BindingRegistry(hass)
+    await registry.register_sensor_binding(
+        entity_id="sensor.temperature",
+        sensor=mock_sensor,
+        sensor_filter=SensorFilter(absolute_deadband=0.1, min_interval=10.0),
+    )
+    callback = mock_sensor.on_value_changed.call_args[0][0]
+
+    # The timer fires slightly before the interval has passed
+    with patch(
+        "custom_components.digitalstrom_vdc.entity_binding.time.monotonic",
+        side_effect=[0.0, 1.0, 9.9],
+    ):
+        await callback(21.0)
+        await callback(22.0)
+        delay, report, value = hass.loop.call_later.call_args[0]
+        assert delay == 9.0
+        report(value)
+
+    await hass.async_create_task.call_args[0][0]
+    assert hass.bus.async_fire.call_count == 2
+    hass.bus.async_fire.assert_called_with(
+        "digitalstrom_vdc_sensor_changed",
+        {"entity_id": "sensor.temperature", "value": 22.0},
+    )
+    binding = registry.get_binding("sensor.temperature")
+    assert binding.filter_stats["rate_limited"] == 1
+    assert binding.filter_stats["reported"] == 2
+    assert hass.loop.call_later.call_count == 1
+
+
+async def test_vdc_updates_emitted_as_batch(mock_binary_input, mock_button_input):
+    """Test that VDC → HA updates of one loop iteration form one batch event."""
+    from custom_components.digitalstrom_vdc.const import EVENT_BATCH_UPDATE
+    from custom_components.digitalstrom_vdc.entity_binding import BindingRegistry
+
+    hass = MagicMock()
+    registry = BindingRegistry(hass, per_entity_events=False)
+    await registry.register_binary_input_binding("binary_sensor.motion", mock_binary_input)
+    await registry.register_button_binding("button.doorbell", mock_button_input)
+
+    await mock_binary_input.on_state_changed.call_args[0][0](True)
+    await mock_button_input.on_pressed.call_args[0][0]("click")
+
+    hass.bus.async_fire.assert_not_called()
+    hass.loop.call_soon.assert_called_once()
+
+    registry._async_flush_batch()
+
+    hass.bus.async_fire.assert_called_once_with(
+        EVENT_BATCH_UPDATE,
+        {
+            "updates": [
+                {
+                    "event_type": "digitalstrom_vdc_binary_input_changed",
+                    "entity_id": "binary_sensor.motion",
+                    "state": True,
+                },
+                {
+                    "event_type": "digitalstrom_vdc_button_press",
+                    "entity_id": "button.doorbell",
+                    "event": "click",
+                },
+            ]
+        },
+    )
+
+
+async def test_sync_lock_created_on_contention(mock_output_channel):
+    """Test that overlapping writes create the lock and still run in order."""
+    import asyncio
+
+    from custom_components.digitalstrom_vdc.entity_binding import (
+        BindingType,
+        EntityBinding,
+    )
+
+    order = []
+
+    async def set_value(value):
+        order.append(("start", value))
+        await asyncio.sleep(0)
+        order.append(("end", value))
+
+    mock_output_channel.set_value = AsyncMock(side_effect=set_value)
+    binding = EntityBinding(
+        MagicMock(), "switch.pump", mock_output_channel, BindingType.OUTPUT
+    )
+    assert not hasattr(binding, "__dict__")
+
+    await binding._update_vdc_from_ha(State("switch.pump", STATE_ON))
+    assert binding._sync_lock is None
+
+    await asyncio.gather(
+        binding._update_vdc_from_ha(State("switch.pump", STATE_OFF)),
+        binding._update_vdc_from_ha(State("switch.pump", STATE_ON)),
+    )
+    assert binding._sync_lock is not None
+    assert not binding._sync_lock.locked()
+    assert order[2:] == [
+        ("start", 0.0),
+        ("end", 0.0),
+        ("start", 100.0),
+        ("end", 100.0),
+    ]
+
+
+async def test_memory_footprint(mock_output_channel, mock_sensor):
+    """Test the derived component view and the footprint report."""
+    from custom_components.digitalstrom_vdc.entity_binding import BindingRegistry
+
+    registry = BindingRegistry(MagicMock())
+    assert registry.memory_footprint()["bytes_per_binding"] is None
+
+    await registry.register_channel_binding("light.room", mock_output_channel)
+    await registry.register_sensor_binding("sensor.temp", mock_sensor)
+
+    assert dict(registry._bindings) == {
+        "light.room": {"channel": mock_output_channel},
+        "sensor.temp": {"sensor": mock_sensor},
+    }
+    footprint = registry.memory_footprint()
+    assert footprint["bindings"] == 2
+    assert footprint["locks"] == 0
+    assert footprint["total_bytes"] == (
+        footprint["binding_bytes"] + footprint["table_bytes"]
+    )
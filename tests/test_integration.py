@@ -181,3 +181,48 @@ async def test_connection_lifecycle(hass: HomeAssistant, mock_config_entry):
         # Shutdown
         await manager.async_shutdown()
         assert manager._monitoring_task is None
+
+
+@pytest.mark.integration
+async def test_service_set_local_priority_unverifies_scene(
+    hass: HomeAssistant, mock_vdc, mock_vdsd
+):
+    """Test that the set local priority service unverifies the saved scenes."""
+    from homeassistant.helpers import device_registry as dr
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from custom_components.digitalstrom_vdc import async_setup_services
+    from custom_components.digitalstrom_vdc.const import DOMAIN
+    from custom_components.digitalstrom_vdc.device_manager import DeviceManager
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    channel = MagicMock(value=80.0, set_value=AsyncMock())
+    mock_vdsd.output.channels = [channel]
+    mock_vdsd.save_scene = AsyncMock()
+    mock_vdsd.call_scene = AsyncMock()
+    mock_vdsd.set_local_prio = AsyncMock()
+
+    device_manager = DeviceManager(mock_vdc, MagicMock())
+    device_manager.get_all_devices = MagicMock(return_value=[mock_vdsd])
+    hass.data[DOMAIN] = {entry.entry_id: {"device_manager": device_manager}}
+    device_entry = dr.async_get(hass).async_get_or_create(
+        config_entry_id=entry.entry_id,
+        identifiers={(DOMAIN, mock_vdsd.dSUID)},
+    )
+
+    await device_manager.async_save_scene(mock_vdsd, 17)
+    await device_manager.async_call_scene(mock_vdsd, 17)
+    table = device_manager._scene_tables[mock_vdsd.dSUID]
+    assert table.is_verified(17)
+
+    await async_setup_services(hass)
+    await hass.services.async_call(
+        DOMAIN,
+        "set_local_priority",
+        {"device_id": device_entry.id, "scene_number": 17},
+        blocking=True,
+    )
+
+    mock_vdsd.set_local_prio.assert_awaited_once_with(17)
+    assert not table.is_verified(17)
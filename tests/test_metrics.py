@@ -0,0 +1,70 @@
+"""Tests for the metrics registry."""
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.core import State
+
+
+def test_counters_gauges_and_histograms():
+    """Test metric types and snapshots."""
+    from custom_components.digitalstrom_vdc.metrics import MetricsRegistry
+
+    metrics = MetricsRegistry()
+    messages = metrics.counter("messages")
+    messages.inc("ping")
+    messages.inc("ping")
+    messages.inc("getProperty")
+    assert metrics.counter("messages") is messages
+
+    depth = [3]
+    metrics.gauge("depth", lambda: depth[0])
+    latency = metrics.histogram("latency", (1, 10))
+    for value in (0.5, 5.0, 50.0, 60.0):
+        latency.observe(value)
+
+    depth[0] = 4
+    snapshot = metrics.snapshot()
+    assert snapshot["messages"] == {"ping": 2, "getProperty": 1}
+    assert snapshot["depth"] == 4
+    assert snapshot["latency"]["buckets"] == {"le_1": 1, "le_10": 1, "gt_10": 2}
+    assert snapshot["latency"]["mean"] == 28.875
+
+
+def test_disabled_registry_records_nothing():
+    """Test that a disabled registry hands out shared no-op metrics."""
+    from custom_components.digitalstrom_vdc.metrics import (
+        NULL_METRIC,
+        MetricsRegistry,
+    )
+
+    metrics = MetricsRegistry(enabled=False)
+    assert metrics.counter("messages") is NULL_METRIC
+    metrics.counter("messages").inc("ping")
+    metrics.histogram("latency").observe(1.0)
+    metrics.gauge("depth", lambda: 1)
+    assert metrics.snapshot() == {}
+
+
+async def test_binding_metrics(mock_output_channel):
+    """Test set_value latency and event fan-out metrics of bindings."""
+    from custom_components.digitalstrom_vdc.entity_binding import BindingRegistry
+    from custom_components.digitalstrom_vdc.metrics import (
+        BINDING_QUEUE_DEPTH,
+        EVENTS_FIRED,
+        MESSAGES_OUT,
+        SET_VALUE_LATENCY,
+        MetricsRegistry,
+    )
+
+    metrics = MetricsRegistry()
+    registry = BindingRegistry(MagicMock(), metrics=metrics)
+    mock_output_channel.set_value = AsyncMock()
+    await registry.register_channel_binding("switch.pump", mock_output_channel)
+
+    binding = registry.get_binding("switch.pump")
+    await binding._update_vdc_from_ha(State("switch.pump", "on"))
+    registry._async_emit_event("digitalstrom_vdc_button_press", {"entity_id": "x"})
+
+    assert metrics.value(SET_VALUE_LATENCY)["count"] == 1
+    assert metrics.value(MESSAGES_OUT) == {"set_value": 1}
+    assert metrics.value(EVENTS_FIRED) == {"digitalstrom_vdc_button_press": 1}
+    assert metrics.value(BINDING_QUEUE_DEPTH) == 0
@@ -0,0 +1,20 @@
+"""Tests for local network helpers."""
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+
+async def test_local_ip_comes_from_network_integration(
+    hass: HomeAssistant, mock_local_ip_probe
+):
+    """Test that the local IP is the network integration's source IP."""
+    from custom_components.digitalstrom_vdc.network import (
+        FALLBACK_IP,
+        async_get_local_ip,
+    )
+
+    assert await async_get_local_ip(hass) == "192.168.1.10"
+    mock_local_ip_probe.assert_awaited_once_with(hass)
+
+    # Without a usable adapter the loopback address is announced
+    mock_local_ip_probe.side_effect = HomeAssistantError("no adapter")
+    assert await async_get_local_ip(hass) == FALLBACK_IP
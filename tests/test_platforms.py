@@ -6,42 +6,60 @@ from homeassistant.components.light import ColorMode
 from homeassistant.core import HomeAssistant
 
 
-async def test_light_entity_initialization(mock_coordinator, mock_vdsd, mock_output_channel):
+async def test_light_entity_initialization(
+    mock_coordinator, device_manager, mock_vdsd, mock_output_channel
+):
     """Test light entity initialization."""
     from custom_components.digitalstrom_vdc.light import DigitalStromVDCLight
     
     mock_vdsd.output.channels = [mock_output_channel]
     
-    light = DigitalStromVDCLight(mock_coordinator, mock_vdsd)
+    light = DigitalStromVDCLight(mock_coordinator, mock_vdsd, device_manager)
     
     assert light._vdc_device == mock_vdsd
     assert light.coordinator == mock_coordinator
     assert ColorMode.BRIGHTNESS in light.supported_color_modes
 
 
-async def test_light_turn_on(mock_coordinator, mock_vdsd, mock_output_channel):
+async def test_light_turn_on(
+    hass: HomeAssistant,
+    mock_coordinator,
+    device_manager,
+    mock_vdsd,
+    mock_output_channel,
+):
     """Test turning on light."""
     from custom_components.digitalstrom_vdc.light import DigitalStromVDCLight
     
     mock_vdsd.output.channels = [mock_output_channel]
     mock_output_channel.set_value = AsyncMock()
     
-    light = DigitalStromVDCLight(mock_coordinator, mock_vdsd)
+    light = DigitalStromVDCLight(mock_coordinator, mock_vdsd, device_manager)
+    light.hass = hass
     
     await light.async_turn_on(brightness=255)
     
     mock_output_channel.set_value.assert_called_once_with(100.0)
-    mock_coordinator.async_request_refresh.assert_called_once()
-
-
-async def test_light_turn_off(mock_coordinator, mock_vdsd, mock_output_channel):
+    mock_coordinator.async_schedule_device_refresh.assert_called_once_with(
+        mock_vdsd.dSUID
+    )
+
+
+async def test_light_turn_off(
+    hass: HomeAssistant,
+    mock_coordinator,
+    device_manager,
+    mock_vdsd,
+    mock_output_channel,
+):
     """Test turning off light."""
     from custom_components.digitalstrom_vdc.light import DigitalStromVDCLight
     
     mock_vdsd.output.channels = [mock_output_channel]
     mock_output_channel.set_value = AsyncMock()
     
-    light = DigitalStromVDCLight(mock_coordinator, mock_vdsd)
+    light = DigitalStromVDCLight(mock_coordinator, mock_vdsd, device_manager)
+    light.hass = hass
     
     await light.async_turn_off()
     
@@ -95,33 +113,39 @@ async def test_binary_sensor_state(mock_coordinator, mock_vdsd, mock_binary_inpu
     assert binary_sensor.is_on is True
 
 
-async def test_cover_position(mock_coordinator, mock_vdsd, mock_output_channel):
+async def test_cover_position(
+    mock_coordinator, device_manager, mock_vdsd, mock_output_channel
+):
     """Test cover position."""
     from custom_components.digitalstrom_vdc.cover import DigitalStromVDCCover
     
     mock_vdsd.output.channels = [mock_output_channel]
     mock_output_channel.value = 50.0
     
-    cover = DigitalStromVDCCover(mock_coordinator, mock_vdsd)
+    cover = DigitalStromVDCCover(mock_coordinator, mock_vdsd, device_manager)
     
     assert cover.current_cover_position == 50
 
 
-async def test_cover_open(mock_coordinator, mock_vdsd, mock_output_channel):
+async def test_cover_open(
+    mock_coordinator, device_manager, mock_vdsd, mock_output_channel
+):
     """Test opening cover."""
     from custom_components.digitalstrom_vdc.cover import DigitalStromVDCCover
     
     mock_vdsd.output.channels = [mock_output_channel]
     mock_output_channel.set_value = AsyncMock()
     
-    cover = DigitalStromVDCCover(mock_coordinator, mock_vdsd)
+    cover = DigitalStromVDCCover(mock_coordinator, mock_vdsd, device_manager)
     
     await cover.async_open_cover()
     
     mock_output_channel.set_value.assert_called_once_with(100.0)
 
 
-async def test_climate_temperature(mock_coordinator, mock_vdsd, mock_output_channel, mock_sensor):
+async def test_climate_temperature(
+    mock_coordinator, device_manager, mock_vdsd, mock_output_channel, mock_sensor
+):
     """Test climate temperature."""
     from custom_components.digitalstrom_vdc.climate import DigitalStromVDCClimate
     
@@ -129,7 +153,7 @@ async def test_climate_temperature(mock_coordinator, mock_vdsd, mock_output_chan
     mock_vdsd.sensors = [mock_sensor]
     mock_output_channel.value = 21.0
     
-    climate = DigitalStromVDCClimate(mock_coordinator, mock_vdsd)
+    climate = DigitalStromVDCClimate(mock_coordinator, mock_vdsd, device_manager)
     
     assert climate.current_temperature == 20.5
     assert climate.target_temperature == 21.0
@@ -152,3 +176,57 @@ async def test_button_press(mock_coordinator, mock_vdsd, mock_button_input):
     await button.async_press()
     
     hass.bus.async_fire.assert_called_once()
+
+
+async def test_light_turn_on_color_single_push(
+    hass: HomeAssistant, mock_coordinator, device_manager, mock_vdsd
+):
+    """Test that color and brightness are committed in one push."""
+    from custom_components.digitalstrom_vdc.light import DigitalStromVDCLight
+
+    brightness = MagicMock(channel_type="brightness", value=0.0, set_value=AsyncMock())
+    hue = MagicMock(channel_type="hue", value=0.0, set_value=AsyncMock())
+    saturation = MagicMock(channel_type="saturation", value=0.0, set_value=AsyncMock())
+    # Brightness is found by its role, not by its position
+    mock_vdsd.output.channels = [hue, saturation, brightness]
+
+    light = DigitalStromVDCLight(mock_coordinator, mock_vdsd, device_manager)
+    light.hass = hass
+
+    await light.async_turn_on(brightness=255, hs_color=(120.0, 50.0))
+
+    hue.set_value.assert_called_once_with(120.0, apply_now=False)
+    saturation.set_value.assert_called_once_with(50.0, apply_now=False)
+    brightness.set_value.assert_called_once_with(100.0)
+
+    brightness.value = 100.0
+    assert light.brightness == 255
+
+
+async def test_role_index_lookup_and_invalidation(
+    device_manager, mock_vdsd, mock_sensor
+):
+    """Test the per-device channel/sensor role index."""
+    from custom_components.digitalstrom_vdc.role_index import (
+        ROLE_HUE,
+        ROLE_POSITION,
+        ROLE_TEMPERATURE,
+    )
+
+    brightness = MagicMock(channel_type="brightness")
+    hue = MagicMock(channel_type="hue")
+    mock_vdsd.output.channels = [brightness, hue]
+    mock_vdsd.sensors = [mock_sensor]
+
+    roles = device_manager.get_role_index(mock_vdsd)
+    assert roles is device_manager.get_role_index(mock_vdsd)
+    assert roles.primary_channel is brightness
+    assert roles.channel(ROLE_HUE) is hue
+    assert roles.sensor(ROLE_TEMPERATURE) is mock_sensor
+    assert not roles.has_channel(ROLE_POSITION)
+
+    position = MagicMock(channel_type="shadePositionOutside")
+    mock_vdsd.output.channels = [position]
+    device_manager.invalidate_role_index(mock_vdsd)
+
+    assert device_manager.get_role_index(mock_vdsd).channel(ROLE_POSITION) is position
@@ -0,0 +1,146 @@
+"""Tests for the dimming and transition ramp engine."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+def _engine():
+    """Return a ramp engine on a manual clock that runs writes as tasks."""
+    from custom_components.digitalstrom_vdc.ramp import RampEngine
+
+    hass = MagicMock()
+    hass.loop = asyncio.get_running_loop()
+    hass.async_create_background_task = lambda coro, name: asyncio.ensure_future(coro)
+    engine = RampEngine(hass, tick_rate=10.0)
+    now = [0.0]
+    engine.clock = lambda: now[0]
+    return engine, now
+
+
+def _channel(value: float = 0.0) -> MagicMock:
+    """Return a mocked output channel."""
+    channel = MagicMock(value=value, min_value=0.0, max_value=100.0)
+    channel.set_value = AsyncMock()
+    return channel
+
+
+async def test_many_ramps_share_one_timer():
+    """Test that concurrent transitions use one timer and one write per output."""
+    engine, now = _engine()
+    outputs = [MagicMock() for _ in range(100)]
+    channels = [(_channel(), _channel()) for _ in outputs]
+
+    with patch(
+        "custom_components.digitalstrom_vdc.ramp.async_call_later"
+    ) as call_later:
+        futures = [
+            engine.async_ramp(output, channel, 50.0, 1.0)
+            for output, pair in zip(outputs, channels, strict=True)
+            for channel in pair
+        ]
+        assert call_later.call_count == 1
+
+        now[0] = 0.5
+        engine._async_tick()
+        await asyncio.sleep(0)
+
+    for first, second in channels:
+        first.set_value.assert_awaited_once_with(25.0, apply_now=False)
+        second.set_value.assert_awaited_once_with(25.0)
+    assert engine.stats["writes"] == 100
+    assert not any(future.done() for future in futures)
+
+
+async def test_retarget_reverse_and_stop():
+    """Test retargeting, reversing and stopping a running ramp."""
+    engine, now = _engine()
+    output = MagicMock()
+    channel = _channel(0.0)
+
+    with patch("custom_components.digitalstrom_vdc.ramp.async_call_later"):
+        first = engine.async_dim(output, channel, 1, rate=10.0)
+        now[0] = 5.0
+        # Reversing continues from the current value of 50
+        second = engine.async_dim(output, channel, -1, rate=10.0)
+        assert first.result() is False
+
+        now[0] = 7.0
+        engine._async_tick()
+        await asyncio.sleep(0)
+        channel.set_value.assert_awaited_once_with(30.0)
+
+        assert engine.async_stop(channel) == 30.0
+        assert second.result() is False
+        assert not engine.is_active(channel)
+
+        third = engine.async_ramp(output, channel, 80.0, 0)
+        engine._async_tick()
+        await asyncio.sleep(0)
+
+    assert third.result() is True
+    channel.set_value.assert_awaited_with(80.0)
+
+
+async def test_direct_write_waits_for_ramp_write():
+    """Test that a direct write lands after a ramp write already in flight."""
+    engine, now = _engine()
+    output = MagicMock()
+    channel = _channel(0.0)
+    release = asyncio.Event()
+    written = []
+
+    async def set_value(value, apply_now=True):
+        written.append(value)
+        if len(written) == 1:
+            await release.wait()
+
+    channel.set_value = AsyncMock(side_effect=set_value)
+
+    with patch("custom_components.digitalstrom_vdc.ramp.async_call_later"):
+        future = engine.async_ramp(output, channel, 100.0, 1.0)
+        now[0] = 0.5
+        engine._async_tick()
+        await asyncio.sleep(0)
+        assert written == [50.0]
+
+        direct = asyncio.ensure_future(engine.async_write(output, [(channel, 0.0)]))
+        await asyncio.sleep(0)
+        assert future.result() is False
+        assert written == [50.0]
+
+        release.set()
+        await direct
+
+    assert written == [50.0, 0.0]
+    engine.async_shutdown()
+    assert engine.stats["active"] == 0
+
+
+async def test_direct_write_drops_ramp_batch_waiting_to_commit():
+    """Test that a direct write to an output is not overwritten by its ramp batch."""
+    engine, now = _engine()
+    first_output, second_output = MagicMock(), MagicMock()
+    first, second = _channel(0.0), _channel(0.0)
+    release = asyncio.Event()
+
+    async def set_value(value, apply_now=True):
+        await release.wait()
+
+    first.set_value = AsyncMock(side_effect=set_value)
+
+    with patch("custom_components.digitalstrom_vdc.ramp.async_call_later"):
+        engine.async_ramp(first_output, first, 100.0, 1.0)
+        engine.async_ramp(second_output, second, 100.0, 1.0)
+        now[0] = 0.5
+        engine._async_tick()
+        await asyncio.sleep(0)
+        first.set_value.assert_awaited_once_with(50.0)
+
+        # The second output is written directly while the first one commits
+        await engine.async_write(second_output, [(second, 10.0)])
+        release.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    second.set_value.assert_awaited_once_with(10.0)
+    assert engine.stats["writes"] == 1
+    engine.async_shutdown()
@@ -0,0 +1,67 @@
+"""Tests for service target resolution."""
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.digitalstrom_vdc.const import DOMAIN
+
+
+async def test_resolve_device_id_is_cached_until_registry_update(
+    hass: HomeAssistant, mock_vdsd
+):
+    """Test that lookups are cached and dropped on device registry updates."""
+    from custom_components.digitalstrom_vdc.resolver import async_get_resolver
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    device_manager = MagicMock()
+    device_manager.get_all_devices = MagicMock(return_value=[mock_vdsd])
+    hass.data[DOMAIN] = {entry.entry_id: {"device_manager": device_manager}}
+
+    device_registry = dr.async_get(hass)
+    device_entry = device_registry.async_get_or_create(
+        config_entry_id=entry.entry_id,
+        identifiers={(DOMAIN, mock_vdsd.dSUID)},
+    )
+
+    resolver = async_get_resolver(hass)
+    resolved = resolver.async_resolve_device_id(device_entry.id)
+    assert resolved.device is mock_vdsd
+    assert resolved.entry_id == entry.entry_id
+    assert resolver.async_resolve_device_id(device_entry.id) is resolved
+    assert resolver.async_resolve_dsuid(mock_vdsd.dSUID) is resolved
+    assert resolver.hits == 2
+
+    device_registry.async_update_device(device_entry.id, name_by_user="Lamp")
+    await hass.async_block_till_done()
+    assert device_entry.id not in resolver._by_device_id
+
+
+async def test_dsuid_misses_do_not_rebuild_until_devices_change(
+    hass: HomeAssistant, mock_vdsd
+):
+    """Test that unknown dsUIDs only rebuild the index after a change."""
+    from custom_components.digitalstrom_vdc.const import DATA_RESOLVER
+    from custom_components.digitalstrom_vdc.resolver import async_get_resolver
+
+    device_manager = MagicMock()
+    device_manager.get_all_devices = MagicMock(return_value=[])
+    hass.data[DOMAIN] = {"entry": {"device_manager": device_manager}}
+
+    resolver = async_get_resolver(hass)
+    for _ in range(3):
+        assert resolver.async_resolve_dsuid(mock_vdsd.dSUID) is None
+    assert resolver.rebuilds == 1
+
+    # A new device is picked up by the next miss
+    device_manager.get_all_devices.return_value = [mock_vdsd]
+    resolver.async_devices_changed()
+    assert resolver.async_resolve_dsuid(mock_vdsd.dSUID).device is mock_vdsd
+    assert resolver.rebuilds == 2
+
+    # Shutting down stops the registry listener and drops the resolver
+    resolver.async_shutdown()
+    assert DATA_RESOLVER not in hass.data[DOMAIN][DOMAIN]
+    assert async_get_resolver(hass) is not resolver
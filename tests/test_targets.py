@@ -0,0 +1,39 @@
+"""Tests for multi-device service targets."""
+import asyncio
+from unittest.mock import MagicMock
+
+
+def _resolved(dsuid: str):
+    """Return a resolved device with a mocked VdSD."""
+    from custom_components.digitalstrom_vdc.resolver import ResolvedDevice
+
+    device = MagicMock()
+    device.dSUID = dsuid
+    device.name = dsuid
+    return ResolvedDevice("entry", MagicMock(), device)
+
+
+async def test_run_on_targets_reports_per_device():
+    """Test bounded fan-out with per-device results."""
+    from custom_components.digitalstrom_vdc.targets import async_run_on_targets
+
+    targets = {f"device-{number}": _resolved(f"dsuid-{number}") for number in range(6)}
+    running = 0
+    peak = 0
+
+    async def operation(resolved):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        if resolved.device.dSUID == "dsuid-5":
+            raise ConnectionError("offline")
+
+    report = await async_run_on_targets(targets, operation, max_parallel=2)
+
+    assert peak == 2
+    assert report["succeeded"] == 5
+    assert report["failed"] == 1
+    assert report["devices"]["device-5"]["error"] == "offline"
+    assert "duration_ms" in report["devices"]["device-0"]
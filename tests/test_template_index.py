@@ -0,0 +1,65 @@
+"""Tests for the template search index."""
+
+
+def _templates():
+    """Return a small catalog."""
+    return {
+        "philips_hue_spot": {
+            "type": "vendorType",
+            "name": "Philips HUE Lily Garden Spot",
+            "vendor": "Philips",
+            "bindings": ["brightness", "hue", "saturation"],
+            "channels": ["brightness", "hue", "saturation"],
+        },
+        "dimmer": {
+            "type": "deviceType",
+            "name": "Dimmable Light",
+            "bindings": ["brightness"],
+            "channels": ["brightness"],
+        },
+        "climate": {
+            "type": "deviceType",
+            "name": "Climate Sensor",
+            "vendor": "Acme",
+            "bindings": ["temperature", "humidity"],
+        },
+    }
+
+
+def test_prefix_and_field_queries():
+    """Test token prefixes, field qualified terms and type filters."""
+    from custom_components.digitalstrom_vdc.template_index import TemplateIndex
+
+    index = TemplateIndex()
+    for key, template in _templates().items():
+        index.add(key, template)
+
+    assert index.search("bright") == (2, ["dimmer", "philips_hue_spot"])
+    assert index.search("phil hu") == (1, ["philips_hue_spot"])
+    assert index.search("vendor:ac") == (1, ["climate"])
+    assert index.search("vendor:bright") == (0, [])
+    assert index.search("channel:sat") == (1, ["philips_hue_spot"])
+    assert index.search("", template_type="deviceType") == (
+        2,
+        ["climate", "dimmer"],
+    )
+    assert index.search("", offset=1, limit=1) == (3, ["dimmer"])
+
+
+def test_incremental_updates():
+    """Test that replaced and removed entries leave no stale tokens."""
+    from custom_components.digitalstrom_vdc.template_index import TemplateIndex
+
+    index = TemplateIndex()
+    for key, template in _templates().items():
+        index.add(key, template)
+    assert index.search("hum") == (1, ["climate"])
+
+    index.add("climate", {"type": "deviceType", "name": "Thermometer"})
+    assert index.search("hum") == (0, [])
+    assert index.search("thermo") == (1, ["climate"])
+
+    index.remove("philips_hue_spot")
+    assert "philips_hue_spot" not in index
+    assert index.search("phil") == (0, [])
+    assert len(index) == 2
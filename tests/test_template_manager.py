@@ -0,0 +1,173 @@
+"""Tests for the template catalog."""
+import os
+
+
+def _write(path, content):
+    """Write a template file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def test_scan_parses_only_changed_files(tmp_path):
+    """Test that unchanged files are taken from the index."""
+    from custom_components.digitalstrom_vdc.template_manager import scan_templates
+
+    _write(
+        tmp_path / "deviceType" / "dimmer.yaml",
+        "name: Dimmer\noutput:\n  channels:\n    - channel_type: brightness\n",
+    )
+    _write(
+        tmp_path / "vendorType" / "spot.yaml",
+        "name: Spot\nvendor: Acme\nsensors:\n  - sensor_type: temperature\n",
+    )
+
+    index, parsed = scan_templates(tmp_path, {})
+    assert parsed == 2
+    dimmer = index["deviceType/dimmer.yaml"]["template"]
+    assert dimmer["type"] == "deviceType"
+    assert dimmer["bindings"] == ["brightness"]
+    assert index["vendorType/spot.yaml"]["template"]["bindings"] == ["temperature"]
+
+    # A warm scan reads no file
+    assert scan_templates(tmp_path, index)[1] == 0
+
+    spot = tmp_path / "vendorType" / "spot.yaml"
+    _write(spot, "name: Spot 2\nvendor: Acme\n")
+    os.utime(spot, ns=(1, 1))
+    (tmp_path / "deviceType" / "dimmer.yaml").unlink()
+    index, parsed = scan_templates(tmp_path, index)
+    assert parsed == 1
+    assert list(index) == ["vendorType/spot.yaml"]
+    assert index["vendorType/spot.yaml"]["template"]["name"] == "Spot 2"
+
+
+def test_blueprint_slots_and_parameters():
+    """Test that a blueprint maps binding names and validates parameters."""
+    import pytest
+    import voluptuous as vol
+
+    from custom_components.digitalstrom_vdc.blueprint import compile_blueprint
+
+    blueprint = compile_blueprint(
+        "spot",
+        {
+            "output": {
+                "channels": [
+                    {"channel_type": "brightness"},
+                    {"channel_type": "hue"},
+                    {"channel_type": "brightness"},
+                ]
+            },
+            "sensors": [{"sensor_type": "temperature"}],
+            "button_inputs": [{}],
+            "parameters": [
+                {"name": "zone", "type": "int", "min": 0},
+                {"name": "mode", "default": "a", "options": ["a", "b"]},
+            ],
+        },
+    )
+    assert blueprint.channels == ("brightness", "hue", "brightness")
+    assert blueprint.component_bindings(
+        {"brightness_2": "light.b", "temperature": "sensor.t", "button": "x.y"}
+    ) == {"output_channel_2": "light.b", "sensor_0": "sensor.t", "button_0": "x.y"}
+    assert blueprint.instantiate({"zone": "3"}) == {"zone": 3, "mode": "a"}
+    with pytest.raises(vol.Invalid):
+        blueprint.instantiate({"zone": 1, "mode": "c"})
+    with pytest.raises(vol.Invalid):
+        blueprint.instantiate({})
+
+    # Built-in entries only list binding names
+    builtin = compile_blueprint(
+        "climate", {"bindings": ["temperature", "humidity"], "parameters": []}
+    )
+    assert builtin.slots == {"temperature": "sensor_0", "humidity": "sensor_1"}
+    assert builtin.instantiate({"anything": 1}) == {"anything": 1}
+
+
+async def test_blueprint_cache(tmp_path):
+    """Test blueprint caching, eviction and invalidation on file changes."""
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from custom_components.digitalstrom_vdc.template_manager import TemplateManager
+
+    for name in ("a", "b"):
+        _write(
+            tmp_path / "deviceType" / f"{name}.yaml",
+            "name: X\noutput:\n  channels:\n    - channel_type: brightness\n",
+        )
+
+    hass = MagicMock()
+    hass.async_add_executor_job = AsyncMock(
+        side_effect=lambda func, *args: func(*args)
+    )
+    with patch("custom_components.digitalstrom_vdc.template_manager.Store") as store:
+        store.return_value.async_load = AsyncMock(return_value=None)
+        store.return_value.async_save = AsyncMock()
+        manager = TemplateManager(hass, tmp_path, blueprint_cache_size=1)
+        await manager.load_templates()
+
+        first = await manager.async_get_blueprint("a")
+        assert first.slots == {"brightness": "output_channel_0"}
+        assert await manager.async_get_blueprint("a") is first
+        assert await manager.async_get_blueprint("missing") is None
+
+        await manager.async_get_blueprint("b")
+        assert manager.blueprint_stats == {"hits": 1, "misses": 2, "evictions": 1}
+
+        path = tmp_path / "deviceType" / "b.yaml"
+        _write(path, "name: X\nsensors:\n  - sensor_type: humidity\n")
+        os.utime(path, ns=(1, 1))
+        await manager.load_templates()
+        changed = await manager.async_get_blueprint("b")
+        assert changed.slots == {"humidity": "sensor_0"}
+        assert manager.blueprint_stats["misses"] == 3
+
+
+async def test_refresh_reindexes_changed_templates(tmp_path):
+    """Test that a refresh only reindexes new and changed templates."""
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from custom_components.digitalstrom_vdc.const import TEMPLATE_TYPE_VENDOR
+    from custom_components.digitalstrom_vdc.template_manager import TemplateManager
+
+    _write(tmp_path / "deviceType" / "dimmer.yaml", "name: Dimmer\n")
+    _write(tmp_path / "vendorType" / "spot.yaml", "name: Spot\nvendor: Acme\n")
+
+    hass = MagicMock()
+    hass.async_add_executor_job = AsyncMock(
+        side_effect=lambda func, *args: func(*args)
+    )
+    with patch("custom_components.digitalstrom_vdc.template_manager.Store") as store:
+        store.return_value.async_load = AsyncMock(return_value=None)
+        store.return_value.async_save = AsyncMock()
+        manager = TemplateManager(hass, tmp_path)
+        await manager.load_templates()
+        assert manager.load_stats["indexed"] == 2
+        assert list(manager.get_templates_by_type(TEMPLATE_TYPE_VENDOR)) == ["spot"]
+
+        await manager.load_templates()
+        assert manager.load_stats["indexed"] == 0
+
+        spot = tmp_path / "vendorType" / "spot.yaml"
+        _write(spot, "name: Spot\nvendor: Globex\n")
+        os.utime(spot, ns=(1, 1))
+        await manager.load_templates()
+        assert manager.load_stats["indexed"] == 1
+        assert manager.search_templates("vendor:acme") == (0, {})
+        assert list(manager.search_templates("glob")[1]) == ["spot"]
+
+
+def test_duplicate_template_names_are_reported(tmp_path, caplog):
+    """Test that files sharing a name across types keep the first one."""
+    from custom_components.digitalstrom_vdc.template_manager import (
+        index_by_name,
+        scan_templates,
+    )
+
+    _write(tmp_path / "deviceType" / "spot.yaml", "name: Generic Spot\n")
+    _write(tmp_path / "vendorType" / "spot.yaml", "name: Acme Spot\n")
+
+    entries, duplicates = index_by_name(scan_templates(tmp_path, {})[0])
+    assert entries["spot"]["template"]["name"] == "Generic Spot"
+    assert duplicates == ["vendorType/spot.yaml"]
+    assert "vendorType/spot.yaml" in caplog.text
@@ -188,3 +188,93 @@ async def test_dss_disconnected_callback(mock_vdc_host, mock_vdc):
         assert manager.connection_state == STATE_DISCONNECTED
         # Event should be fired
         assert hass.bus.async_fire.call_count >= 1
+
+
+async def test_reconnect_backs_off_without_giving_up(mock_vdc_host, mock_vdc):
+    """Test that reconnection keeps trying past the old attempt limit."""
+    from custom_components.digitalstrom_vdc.vdc_manager import VDCHostManager
+
+    mock_vdc_host.reconnect = AsyncMock(
+        side_effect=[ConnectionError("dSS restarting")] * 7 + [None]
+    )
+    config = {
+        CONF_PORT: 8444,
+        CONF_VDC_NAME: "Test VDC",
+        CONF_DSUID: "test-dsuid-123",
+    }
+    manager = VDCHostManager(MagicMock(), config)
+    manager._host = mock_vdc_host
+
+    # The disconnect callback only wakes the monitor
+    await manager._on_dss_disconnected()
+    assert manager.connection_state == STATE_DISCONNECTED
+    mock_vdc_host.reconnect.assert_not_called()
+
+    with patch(
+        "custom_components.digitalstrom_vdc.vdc_manager.backoff_delay",
+        return_value=0,
+    ):
+        await manager._async_reconnect()
+
+    assert manager.connection_state == STATE_ACTIVE
+    assert mock_vdc_host.reconnect.await_count == 8
+    stats = manager.connection_stats
+    assert stats.reconnects == 1
+    assert stats.reconnect_attempts == 8
+    assert [t["to"] for t in stats.transitions][-2:] == ["connecting", "active"]
+
+
+async def test_keepalive_skips_ping_after_traffic(mock_vdc_host, mock_vdc):
+    """Test that pings are only sent on an idle connection and timed."""
+    from custom_components.digitalstrom_vdc.vdc_manager import VDCHostManager
+
+    config = {
+        CONF_PORT: 8444,
+        CONF_VDC_NAME: "Test VDC",
+        CONF_DSUID: "test-dsuid-123",
+    }
+    manager = VDCHostManager(MagicMock(), config)
+    manager._host = mock_vdc_host
+    manager._connection_state = STATE_ACTIVE
+
+    await manager._on_message_received({"method": "getProperty"})
+    with patch.object(manager, "_async_wait", AsyncMock()):
+        await manager._async_keepalive()
+    mock_vdc_host.ping.assert_not_called()
+    assert manager.connection_stats.pings_skipped == 1
+
+    manager._last_traffic -= 60
+    await manager._async_keepalive()
+    mock_vdc_host.ping.assert_awaited_once()
+    assert manager.connection_stats.pings == 1
+    assert manager.connection_stats.last_rtt is not None
+
+    # The idle time restarted by our own ping is not a skipped ping
+    with patch.object(manager, "_async_wait", AsyncMock()):
+        await manager._async_keepalive()
+    assert manager.connection_stats.pings_skipped == 1
+
+
+async def test_failed_ping_resets_like_a_disconnect(mock_vdc_host, mock_vdc):
+    """Test that a failed ping resets announcements like a dSS disconnect."""
+    from custom_components.digitalstrom_vdc.vdc_manager import VDCHostManager
+
+    config = {
+        CONF_PORT: 8444,
+        CONF_VDC_NAME: "Test VDC",
+        CONF_DSUID: "test-dsuid-123",
+    }
+    hass = MagicMock()
+    manager = VDCHostManager(hass, config)
+    manager._host = mock_vdc_host
+    manager._connection_state = STATE_ACTIVE
+    manager._last_traffic -= 60
+    mock_vdc_host.ping = AsyncMock(side_effect=ConnectionResetError())
+
+    with patch.object(manager.announcer, "async_reset") as reset:
+        await manager._async_keepalive()
+
+    assert manager.connection_state == STATE_DISCONNECTED
+    assert manager.connection_stats.ping_failures == 1
+    reset.assert_called_once()
+    hass.bus.async_fire.assert_called_with("digitalstrom_vdc_dss_disconnected", {})